@@ -0,0 +1,63 @@
+"""
+Yerel ASGI sunucusu ile üretim girişi (Passenger + a2wsgi alternatifi).
+
+a2wsgi her isteği WSGI thread'inden olay döngüsüne köprüler; async uç
+noktalar G/Ç'yi örtüştüremez. Burada uygulama doğrudan çok süreçli bir ASGI
+sunucusunda çalışır ve lifespan olayları (arka plan görevleri, ısınma)
+her worker'da normal şekilde tetiklenir.
+
+  python asgi.py                   -> uvicorn, worker_count() süreç
+                                      (SIGHUP: worker'ları yeniden başlatır,
+                                       SIGTTIN/SIGTTOU: worker ekler/çıkarır)
+  gunicorn -c gunicorn.conf.py     -> gunicorn + Uvicorn worker
+                                      (kill -HUP <master>: zarif yeniden yükleme)
+
+Tüm seçenekler core.config.Settings'teki SERVER_* alanlarından gelir.
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from core.config import settings
+
+APP = "main:app"
+
+
+def cpu_count() -> int:
+    """
+    Sürecin kullanabileceği CPU sayısı (cgroup/affinity kısıtları dahil).
+    """
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def worker_count() -> int:
+    if settings.SERVER_WORKERS:
+        return settings.SERVER_WORKERS
+    return max(1, min(2 * cpu_count() + 1, settings.SERVER_MAX_WORKERS))
+
+
+def uvicorn_options() -> dict:
+    return {
+        "host": settings.SERVER_HOST,
+        "port": settings.SERVER_PORT,
+        "workers": worker_count(),
+        "proxy_headers": True,
+        "forwarded_allow_ips": settings.SERVER_FORWARDED_ALLOW_IPS,
+        "timeout_keep_alive": settings.SERVER_KEEPALIVE_SECONDS,
+        "timeout_graceful_shutdown": settings.SERVER_GRACEFUL_TIMEOUT_SECONDS,
+        "limit_max_requests": settings.SERVER_MAX_REQUESTS or None,
+        "limit_max_requests_jitter": settings.SERVER_MAX_REQUESTS_JITTER,
+        "log_level": settings.SERVER_LOG_LEVEL,
+        "access_log": settings.SERVER_ACCESS_LOG,
+        "server_header": False,
+    }
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run(APP, **uvicorn_options())
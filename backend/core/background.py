@@ -0,0 +1,59 @@
+import threading
+from typing import Callable, List
+
+
+class PeriodicTask:
+    """
+    Belirli aralıklarla bir işi çalıştıran daemon thread.
+
+    Passenger/a2wsgi altında lifespan olayları her zaman tetiklenmeyebilir;
+    bu yüzden start() idempotenttir ve ilk kullanımda da çağrılabilir.
+    """
+
+    def __init__(self, name: str, interval_seconds: float, func: Callable[[], None]):
+        self.name = name
+        self.interval_seconds = interval_seconds
+        self.func = func
+        self._stop = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_seconds):
+            try:
+                self.func()
+            except Exception as e:
+                from logger import log_error
+                log_error(e, f"periodic task {self.name}")
+
+
+# Uygulama ömrü boyunca çalışan görevler (main.lifespan başlatır/durdurur)
+registered_tasks: List[PeriodicTask] = []
+
+
+def register(task: PeriodicTask) -> PeriodicTask:
+    registered_tasks.append(task)
+    return task
+
+
+def start_all() -> None:
+    for task in registered_tasks:
+        task.start()
+
+
+def stop_all() -> None:
+    for task in registered_tasks:
+        task.stop()
@@ -0,0 +1,149 @@
+"""
+Yanıt sıkıştırma (ASGI middleware).
+
+İstemcinin Accept-Encoding başlığına göre brotli (paket kuruluysa) veya gzip
+seçilir. Yalnızca sıkıştırılabilir içerik tipleri (JSON, metin) ve
+COMPRESSION_MIN_BYTES üzerindeki gövdeler sıkıştırılır; dosya indirmeleri,
+kısmi (206) ve gövdesiz (304/204) yanıtlar olduğu gibi geçer. Akış halindeki
+yanıtlar parça parça sıkıştırılır.
+"""
+import zlib
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # brotli opsiyonel; yoksa yalnızca gzip kullanılır
+    brotli = None
+
+COMPRESSIBLE_TYPES = (
+    "application/json", "application/javascript", "application/xml", "image/svg+xml",
+)
+
+
+def _compressible(content_type: str) -> bool:
+    media_type = content_type.partition(";")[0].strip().lower()
+    return media_type.startswith("text/") or media_type in COMPRESSIBLE_TYPES
+
+
+def negotiate(accept_encoding: str) -> Optional[str]:
+    """
+    Desteklenen ve q>0 ile kabul edilen en iyi kodlama ("br", "gzip" veya None).
+    """
+    accepted = set()
+    for part in accept_encoding.lower().split(","):
+        name, _, params = part.strip().partition(";")
+        q = params.strip()
+        if q.startswith("q="):
+            try:
+                if float(q[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(name.strip())
+    if brotli is not None and "br" in accepted:
+        return "br"
+    if "gzip" in accepted or "*" in accepted:
+        return "gzip"
+    return None
+
+
+class _Compressor:
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int):
+        if encoding == "br":
+            self._br = brotli.Compressor(quality=brotli_quality)
+            self._gz = None
+        else:
+            self._br = None
+            self._gz = zlib.compressobj(gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        if self._br is not None:
+            out = self._br.process(data)
+            return out + (self._br.finish() if final else self._br.flush())
+        out = self._gz.compress(data)
+        return out + self._gz.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+
+
+class CompressionMiddleware:
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024, gzip_level: int = 6,
+                 brotli_quality: int = 4):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        await _Responder(self, encoding, send).run(scope, receive)
+
+
+class _Responder:
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self.send = send
+        self.start: Optional[Message] = None
+        self.compressor: Optional[_Compressor] = None
+        self.passthrough = False
+
+    async def run(self, scope: Scope, receive: Receive) -> None:
+        await self.middleware.app(scope, receive, self.send_wrapper)
+
+    async def send_wrapper(self, message: Message) -> None:
+        message_type = message["type"]
+        if message_type == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            self.passthrough = (
+                message["status"] in (204, 206, 304)
+                or "content-encoding" in headers
+                or not _compressible(headers.get("content-type", ""))
+            )
+            if self.passthrough:
+                await self.send(message)
+            else:
+                # Başlıklar, ilk gövde parçası görülene kadar bekletilir
+                self.start = message
+            return
+
+        if self.passthrough or message_type != "http.response.body":
+            if self.start is not None:
+                await self.send(self.start)
+                self.start = None
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.start is not None:
+            start, self.start = self.start, None
+            headers = MutableHeaders(raw=start["headers"])
+            if not more_body and len(body) < self.middleware.minimum_size:
+                self.passthrough = True
+                await self.send(start)
+                await self.send(message)
+                return
+            self.compressor = _Compressor(self.encoding, self.middleware.gzip_level,
+                                          self.middleware.brotli_quality)
+            body = self.compressor.compress(body, final=not more_body)
+            headers["Content-Encoding"] = self.encoding
+            headers.add_vary_header("Accept-Encoding")
+            if more_body:
+                del headers["Content-Length"]
+            else:
+                headers["Content-Length"] = str(len(body))
+            await self.send(start)
+            await self.send({"type": "http.response.body", "body": body, "more_body": more_body})
+            return
+
+        body = self.compressor.compress(body, final=not more_body)
+        await self.send({"type": "http.response.body", "body": body, "more_body": more_body})
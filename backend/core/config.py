@@ -23,11 +23,117 @@ class Settings(BaseSettings):
     DB_PORT: str = os.getenv("DB_PORT", "3306")
     DB_NAME: str = os.getenv("DB_NAME", "hr_db")
     SQLALCHEMY_DATABASE_URL: Optional[str] = None
+    # Okuma replikaları (virgülle ayrılmış URL'ler; boşsa tüm sorgular birincile gider).
+    # Yazan istemci STICKY_SECONDS boyunca birincilden okur (replikasyon gecikmesinden uzun olmalı).
+    DB_REPLICA_URLS: str = ""
+    DB_REPLICA_STICKY_SECONDS: float = 5.0
 
     # JWT Ayarları
     SECRET_KEY: str = os.getenv("SECRET_KEY", "your-super-secret-key-change-in-prod")
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    # JWT doğrulama: "auto" (HS* için hmac), "hmac", "pyjwt" veya "jose"
+    JWT_BACKEND: str = "auto"
+    JWT_MEMO_SIZE: int = 4096
+    # Açıkken access token'daki uid/role/ver claim'lerine güvenilir, istek başına
+    # kullanıcı sorgusu yapılmaz; iptal token sürüm haritasıyla yapılır.
+    AUTH_STATELESS: bool = False
+    TOKEN_VERSION_REFRESH_SECONDS: int = 30
+
+    # Şifre Hashleme: "bcrypt" veya "argon2" (argon2-cffi gerekir). ROUNDS boşsa
+    # maliyet açılışta TARGET_MS hedefine göre kalibre edilir.
+    PASSWORD_HASH_SCHEME: str = "bcrypt"
+    PASSWORD_HASH_TARGET_MS: float = 250
+    PASSWORD_HASH_ROUNDS: Optional[int] = None
+
+    # Giriş Hız Sınırı (kayan pencere, yalnızca başarısız denemeler sayılır). Sayaçlar süreç içidir; paylaşılan backend
+    # henüz yok, BACKEND_URL verilirse uygulama açılışta hata verir.
+    LOGIN_RATE_LIMIT_WINDOW_SECONDS: int = 300
+    LOGIN_RATE_LIMIT_IP_ATTEMPTS: int = 30
+    LOGIN_RATE_LIMIT_USER_FAILURES: int = 5
+    LOGIN_RATE_LIMIT_BACKEND_URL: Optional[str] = None
+
+    # Refresh Token / Oturum Ayarları
+    REFRESH_TOKEN_EXPIRE_MINUTES: int = 60 * 24
+    SESSION_CLEANUP_INTERVAL_SECONDS: int = 3600
+    SESSION_CLEANUP_BATCH_SIZE: int = 1000
+
+    # Denetim Kaydı Yazıcısı (toplu INSERT eşikleri)
+    AUDIT_BATCH_SIZE: int = 200
+    AUDIT_FLUSH_INTERVAL_SECONDS: float = 2.0
+    AUDIT_MAX_QUEUE: int = 50000
+    # Denetim Kaydı Arşivi (eski kayıtlar gün bazlı gzip JSONL dosyalarına taşınır)
+    AUDIT_RETENTION_DAYS: int = 90
+    AUDIT_ARCHIVE_DIR: str = "archive/audit_logs"
+    AUDIT_ARCHIVE_CHUNK_SIZE: int = 5000
+    AUDIT_ARCHIVE_INTERVAL_SECONDS: int = 6 * 3600
+
+    # Doküman Depolama
+    DOCUMENT_STORAGE_DIR: str = "storage/documents"
+    DOCUMENT_MAX_BYTES: int = 25 * 1024 * 1024
+    DOCUMENT_THUMBNAIL_SIZE: int = 256
+    # Ön taraftaki web sunucusu sendfile destekliyorsa (ör. nginx "X-Accel-Redirect")
+    # dosya gövdesi uygulama yerine sunucu tarafından gönderilir.
+    DOCUMENT_SENDFILE_HEADER: Optional[str] = None
+    DOCUMENT_SENDFILE_PREFIX: str = "/protected-documents"
+
+    # Çalışan İstatistikleri (artımlı sayaçlar + periyodik SQL mutabakatı)
+    EMPLOYEE_STATS_RECONCILE_SECONDS: int = 300
+    EMPLOYEE_ONBOARDING_DAYS: int = 30
+
+    # Organizasyon Şeması Önbelleği
+    ORG_CHART_TTL_SECONDS: int = 300
+
+    # Hatırlatıcılar: bellek içi gün kovaları bu kadar günü kapsar, DB'den
+    # REFRESH aralığıyla tazelenir. Kaçırılan (ör. kapalıyken) hatırlatıcılar
+    # en fazla CATCHUP_HOURS geriye kadar tetiklenir.
+    REMINDER_INDEX_DAYS: int = 60
+    REMINDER_INDEX_REFRESH_SECONDS: int = 300
+    REMINDER_CATCHUP_HOURS: int = 24
+
+    # Toplu İstek (/api/batch) başına en fazla alt istek
+    BATCH_MAX_REQUESTS: int = 20
+
+    # Yanıt sıkıştırma (brotli paketi kuruluysa br, değilse gzip)
+    COMPRESSION_MIN_BYTES: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+
+    # Worker açılışı: nadir kullanılan yönlendiriciler ilk istekte yüklenir;
+    # açılışta mapper/şema derleme ve havuz ısıtma arka planda yapılır.
+    LAZY_ROUTERS: bool = True
+    STARTUP_WARMUP: bool = True
+    DB_POOL_PREWARM: int = 2
+    STARTUP_SCHEMA_WARMUP_DELAY_SECONDS: float = 2.0
+
+    # Yerel ASGI sunucusu (asgi.py / gunicorn.conf.py). WORKERS boşsa CPU
+    # sayısından hesaplanır (2 * cpu + 1, en fazla MAX_WORKERS).
+    SERVER_HOST: str = "127.0.0.1"
+    SERVER_PORT: int = 8000
+    SERVER_WORKERS: Optional[int] = None
+    SERVER_MAX_WORKERS: int = 8
+    SERVER_KEEPALIVE_SECONDS: int = 5
+    SERVER_GRACEFUL_TIMEOUT_SECONDS: int = 30
+    SERVER_TIMEOUT_SECONDS: int = 60
+    # Worker bu kadar istekten sonra yenilenir (0: kapalı); JITTER hepsinin aynı anda yenilenmesini önler
+    SERVER_MAX_REQUESTS: int = 0
+    SERVER_MAX_REQUESTS_JITTER: int = 0
+    SERVER_FORWARDED_ALLOW_IPS: str = "127.0.0.1"
+    SERVER_LOG_LEVEL: str = "info"
+    SERVER_ACCESS_LOG: bool = False
+
+    # İzin Takvimi Ayarları
+    ABSENCE_CALENDAR_MAX_DAYS: int = 366
+    ABSENCE_CALENDAR_CACHE_TTL_SECONDS: int = 300
+    ABSENCE_CALENDAR_CACHE_MONTHS: int = 3
+
+    # Duyuru Akışı Önbelleği (çoklu worker'da en fazla bu kadar bayat kalabilir)
+    ANNOUNCEMENT_FEED_TTL_SECONDS: int = 60
+
+    # Arama indeksi diğer worker'ların yazmalarını bu süre sonra görür (arka planda yeniden kurulur)
+    SEARCH_INDEX_TTL_SECONDS: int = 300
+    # Bir aramada puanlanan en fazla aday (sonuç sırasıyla gezilir; typeahead p99'unu sınırlar)
+    SEARCH_MAX_SCORED_CANDIDATES: int = 1000
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
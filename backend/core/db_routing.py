@@ -0,0 +1,203 @@
+"""
+Okuma replikalarına yönlendirme.
+
+DB_REPLICA_URLS tanımlıysa SessionLocal bir RoutingSession üretir:
+salt-okunur isteklerdeki (GET/HEAD ve kayıtlı okuma yolları) SELECT'ler
+replikaya, diğer her şey (flush, INSERT/UPDATE/DELETE, ham SQL, istek dışı
+arka plan işleri) birincil sunucuya gider. Bir oturum yazdıktan sonra kalan
+sorguları da birincilden okur.
+
+Kendi yazdığını okuma (read-your-writes): yazma commit edildiğinde istemci
+(Authorization başlığı) DB_REPLICA_STICKY_SECONDS boyunca birincile
+yapıştırılır; bu süre replikasyon gecikmesinden uzun tutulmalıdır. Kayıt
+worker başınadır; çoklu worker'da yazmanın yapıldığı worker dışında gelen
+okumalar en fazla replikasyon gecikmesi kadar bayat olabilir.
+"""
+import hashlib
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from itertools import count
+from typing import Dict, Iterable, Optional, Sequence
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from core.config import settings
+
+READ_METHODS = frozenset({"GET", "HEAD"})
+
+
+class RoutingState:
+    """
+    İsteğe ait yönlendirme durumu (middleware tarafından kurulur).
+    """
+    __slots__ = ("read_only", "client", "wrote")
+
+    def __init__(self, read_only: bool, client: Optional[str] = None):
+        self.read_only = read_only
+        self.client = client
+        self.wrote = False
+
+
+_state: ContextVar[Optional[RoutingState]] = ContextVar("db_routing_state", default=None)
+
+
+class StickyWrites:
+    """
+    Yakın zamanda yazan istemciler -> birincile yapışma bitiş zamanı (monotonic).
+    """
+
+    def __init__(self, seconds: float, max_clients: int = 10000):
+        self.seconds = seconds
+        self.max_clients = max_clients
+        self._until: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def mark(self, client: str) -> None:
+        now = time.monotonic()
+        with self._lock:
+            if len(self._until) >= self.max_clients:
+                self._until = {key: until for key, until in self._until.items() if until > now}
+            self._until[client] = now + self.seconds
+
+    def active(self, client: str) -> bool:
+        until = self._until.get(client)
+        return until is not None and until > time.monotonic()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._until.clear()
+
+
+class ReplicaSet:
+    """
+    Replika engine'leri arasında sırayla (round-robin) seçim.
+    """
+
+    def __init__(self, engines: Sequence[Engine]):
+        self.engines = tuple(engines)
+        self._counter = count()
+
+    def __bool__(self) -> bool:
+        return bool(self.engines)
+
+    def pick(self) -> Engine:
+        return self.engines[next(self._counter) % len(self.engines)]
+
+
+class RoutingSession(Session):
+    """
+    get_bind ile sorgu başına birincil/replika seçen oturum. Bir istek
+    boyunca aynı replika kullanılır (okumalar kendi içinde tutarlı kalır).
+    """
+
+    def __init__(self, *args, replicas: Optional[ReplicaSet] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.replicas = replicas
+        self._replica: Optional[Engine] = None
+        self._wrote = False
+
+    def _use_replica(self, clause) -> bool:
+        if not self.replicas or self._wrote or self._flushing or not isinstance(clause, Select):
+            return False
+        state = _state.get()
+        return state is not None and state.read_only and not state.wrote
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self._use_replica(clause):
+            if self._replica is None:
+                self._replica = self.replicas.pick()
+            return self._replica
+        return super().get_bind(mapper=mapper, clause=clause, **kwargs)
+
+    def close(self) -> None:
+        super().close()
+        self._replica = None
+        self._wrote = False
+
+
+def _mark_wrote(session: RoutingSession) -> None:
+    session._wrote = True
+    state = _state.get()
+    if state is not None:
+        state.wrote = True
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _after_flush(session, flush_context):
+    _mark_wrote(session)
+
+
+@event.listens_for(RoutingSession, "do_orm_execute")
+def _on_execute(orm_execute_state):
+    # insert().values(...), update(...) gibi flush dışı yazmalar
+    if not orm_execute_state.is_select:
+        _mark_wrote(orm_execute_state.session)
+
+
+@event.listens_for(RoutingSession, "after_commit")
+def _after_commit(session):
+    if not session._wrote:
+        return
+    state = _state.get()
+    # Yanıt gönderilmeden işaretlenir; istemcinin sonraki okuması birincile gider
+    if state is not None and state.client is not None:
+        sticky_writes.mark(state.client)
+
+
+@contextmanager
+def use_primary():
+    """
+    Salt-okunur bir istekte bile bu blok içindeki sorguları birincile gönderir
+    (ör. okuduğunu hemen ardından güncelleyen GET uç noktaları).
+    """
+    state = _state.get()
+    previous = state.read_only if state is not None else None
+    if state is not None:
+        state.read_only = False
+    try:
+        yield
+    finally:
+        if state is not None:
+            state.read_only = previous
+
+
+def _client_key(scope: Scope) -> Optional[str]:
+    for name, value in scope.get("headers") or ():
+        if name == b"authorization":
+            # Token bellekte tutulmaz, özeti anahtar olur
+            return hashlib.sha1(value).hexdigest()
+    return None
+
+
+class ReplicaRoutingMiddleware:
+    """
+    İstek başına yönlendirme durumunu kurar: salt-okunur mu, istemci yakın
+    zamanda yazmış mı (yapışkan birincil).
+    """
+
+    def __init__(self, app: ASGIApp, read_only_paths: Iterable[str] = ()):
+        self.app = app
+        self.read_only_paths = frozenset(read_only_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        client = _client_key(scope)
+        read_only = scope["method"] in READ_METHODS or scope["path"] in self.read_only_paths
+        if read_only and client is not None and sticky_writes.active(client):
+            read_only = False
+        token = _state.set(RoutingState(read_only, client))
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _state.reset(token)
+
+
+sticky_writes = StickyWrites(settings.DB_REPLICA_STICKY_SECONDS)
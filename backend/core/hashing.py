@@ -0,0 +1,204 @@
+"""
+Şifre hashleme politikası: maliyet kalibrasyonu, yeniden hashleme ve ölçümler.
+
+bcrypt tur sayısı (veya argon2 time_cost) açılışta hedef gecikmeye
+(PASSWORD_HASH_TARGET_MS) göre bir kez kalibre edilir. Kalibre edilen değer
+alt sınır (min_rounds) olarak da ayarlandığından, daha düşük maliyetle
+üretilmiş hash'ler needs_update() ile işaretlenir ve başarılı girişte
+yeniden hashlenir.
+"""
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
+
+from passlib.context import CryptContext
+
+from core.config import settings
+
+# Şema başına kalibrasyon aralığı (bcrypt: log2 tur, argon2: time_cost)
+ROUND_BOUNDS = {"bcrypt": (10, 15), "argon2": (2, 12)}
+# bcrypt'te her tur maliyeti ikiye katlar; argon2'de maliyet time_cost ile doğrusal
+_EXPONENTIAL = {"bcrypt": True, "argon2": False}
+
+
+def _argon2_available() -> bool:
+    try:
+        import argon2  # noqa: F401  (argon2-cffi, opsiyonel)
+        return True
+    except ImportError:
+        return False
+
+
+class HashMetrics:
+    """
+    Son N hashleme/doğrulama süresinin (ms) halka tamponu.
+    """
+
+    def __init__(self, size: int = 512):
+        self._samples: Dict[str, Deque[float]] = {}
+        self._counts: Dict[str, int] = {}
+        self._size = size
+        self._lock = threading.Lock()
+
+    def record(self, op: str, elapsed_ms: float) -> None:
+        with self._lock:
+            self._samples.setdefault(op, deque(maxlen=self._size)).append(elapsed_ms)
+            self._counts[op] = self._counts.get(op, 0) + 1
+
+    def increment(self, name: str) -> None:
+        with self._lock:
+            self._counts[name] = self._counts.get(name, 0) + 1
+
+    def count(self, name: str) -> int:
+        return self._counts.get(name, 0)
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            data = {op: sorted(samples) for op, samples in self._samples.items()}
+            counts = dict(self._counts)
+        result = {}
+        for op, ordered in data.items():
+            pick = lambda q: round(ordered[min(len(ordered) - 1, int(q * len(ordered)))], 2)
+            result[op] = {
+                "count": counts[op],
+                "mean_ms": round(sum(ordered) / len(ordered), 2),
+                "p50_ms": pick(0.50),
+                "p95_ms": pick(0.95),
+                "p99_ms": pick(0.99),
+            }
+        return result
+
+
+class PasswordHasher:
+    """
+    Kalibre edilmiş CryptContext etrafında ince katman.
+    İlk kullanımda (veya uygulama açılışında configure() ile) yapılandırılır.
+    """
+
+    def __init__(self, scheme: str, target_ms: float, rounds: Optional[int] = None):
+        self.requested_scheme = scheme
+        self.target_ms = target_ms
+        self.fixed_rounds = rounds
+        self.scheme: Optional[str] = None
+        self.rounds: Optional[int] = None
+        self.estimated_ms: Optional[float] = None
+        self.calibration_ms: Optional[float] = None
+        self.metrics = HashMetrics()
+        self._context: Optional[CryptContext] = None
+        self._dummy_hash: Optional[str] = None
+        self._lock = threading.Lock()
+
+    @property
+    def context(self) -> CryptContext:
+        if self._context is None:
+            self.configure()
+        return self._context
+
+    def configure(self) -> None:
+        with self._lock:
+            if self._context is not None:
+                return
+            started = time.perf_counter()
+            scheme = self.requested_scheme
+            if scheme == "argon2" and not _argon2_available():
+                from logger import logger
+                logger.warning("argon2-cffi kurulu değil, bcrypt kullanılıyor")
+                scheme = "bcrypt"
+            if scheme not in ROUND_BOUNDS:
+                raise ValueError(f"Desteklenmeyen şifre hash şeması: {scheme}")
+
+            if self.fixed_rounds is not None:
+                rounds, estimated = self.fixed_rounds, None
+            else:
+                rounds, estimated = self._calibrate(scheme)
+
+            # Eski şemadaki (bcrypt) hash'ler argon2'ye geçişte deprecated sayılır
+            schemes = [scheme] + (["bcrypt"] if scheme != "bcrypt" else [])
+            options = {f"{scheme}__default_rounds": rounds, f"{scheme}__min_rounds": rounds}
+            self._context = CryptContext(schemes=schemes, deprecated="auto", **options)
+            self._dummy_hash = self._context.hash("dummy-password")
+            self.scheme, self.rounds, self.estimated_ms = scheme, rounds, estimated
+            self.calibration_ms = (time.perf_counter() - started) * 1000
+
+    def _calibrate(self, scheme: str) -> Tuple[int, float]:
+        """
+        En düşük maliyette ölçüp, hedef gecikmeyi aşmayan en yüksek maliyeti tahmin eder.
+        """
+        low, high = ROUND_BOUNDS[scheme]
+        handler = CryptContext(schemes=[scheme]).handler(scheme).using(rounds=low)
+        elapsed = float("inf")
+        for _ in range(2):
+            started = time.perf_counter()
+            handler.hash("calibration-password")
+            elapsed = min(elapsed, (time.perf_counter() - started) * 1000)
+
+        rounds = low
+        while rounds < high:
+            if _EXPONENTIAL[scheme]:
+                estimate = elapsed * 2
+            else:
+                estimate = elapsed * (rounds + 1) / rounds
+            if estimate > self.target_ms:
+                break
+            rounds, elapsed = rounds + 1, estimate
+        return rounds, elapsed
+
+    def hash(self, password: str) -> str:
+        context = self.context
+        started = time.perf_counter()
+        try:
+            return context.hash(password)
+        finally:
+            self.metrics.record("hash", (time.perf_counter() - started) * 1000)
+
+    def verify_and_update(self, password: str, hashed: str) -> Tuple[bool, Optional[str]]:
+        """
+        Şifre doğruysa ve hash güncel politikaya uymuyorsa yeni hash'i de döndürür.
+        """
+        context = self.context
+        started = time.perf_counter()
+        try:
+            valid, new_hash = context.verify_and_update(password, hashed)
+        finally:
+            self.metrics.record("verify", (time.perf_counter() - started) * 1000)
+        if new_hash is not None:
+            self.metrics.increment("rehash")
+        return valid, new_hash
+
+    def verify(self, password: str, hashed: str) -> bool:
+        return self.verify_and_update(password, hashed)[0]
+
+    def dummy_verify(self, password: str) -> bool:
+        context = self.context
+        started = time.perf_counter()
+        context.verify(password, self._dummy_hash)
+        self.metrics.record("verify", (time.perf_counter() - started) * 1000)
+        return False
+
+    def start_background_configure(self) -> None:
+        """
+        Kalibrasyonu açılışta arka planda yapar; ilk giriş isteğini bekletmez.
+        """
+        if self._context is None:
+            threading.Thread(target=self.configure, name="password-hash-calibration", daemon=True).start()
+
+    def describe(self) -> Dict:
+        context_ready = self._context is not None
+        return {
+            "scheme": self.scheme,
+            "rounds": self.rounds,
+            "target_ms": self.target_ms,
+            "estimated_ms": round(self.estimated_ms, 2) if self.estimated_ms is not None else None,
+            "calibration_ms": round(self.calibration_ms, 2) if self.calibration_ms is not None else None,
+            "configured": context_ready,
+            "rehashed": self.metrics.count("rehash"),
+            "operations": self.metrics.snapshot(),
+        }
+
+
+password_hasher = PasswordHasher(
+    scheme=settings.PASSWORD_HASH_SCHEME,
+    target_ms=settings.PASSWORD_HASH_TARGET_MS,
+    rounds=settings.PASSWORD_HASH_ROUNDS,
+)
@@ -0,0 +1,76 @@
+"""
+Yönlendiricilerin (router) ilk istekte yüklenmesi.
+
+Passenger worker'ları sık yeniden başlatır; her açılışta nadiren kullanılan
+yönlendiricilerin (ve yalnızca onların kullandığı servislerin) import
+edilmesi ilk yanıtı geciktirir. Burada kaydedilen modüller, yolu kayıtlı
+öneklerden biriyle başlayan ilk istekte import edilip uygulamaya eklenir.
+OpenAPI/dokümantasyon istekleri tüm yönlendiricileri yükler.
+"""
+import importlib
+import threading
+from typing import Dict, Iterable, Tuple
+
+from fastapi import FastAPI
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class LazyRouters:
+    def __init__(self, app: FastAPI, prefix: str = ""):
+        self.app = app
+        self.prefix = prefix
+        # modül adı -> karşıladığı yol önekleri (prefix dahil)
+        self._pending: Dict[str, Tuple[str, ...]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, module: str, paths: Iterable[str]) -> None:
+        self._pending[module] = tuple(self.prefix + path for path in paths)
+
+    def include(self, module: str) -> None:
+        self.app.include_router(importlib.import_module(module).router, prefix=self.prefix)
+
+    def load(self, module: str) -> None:
+        with self._lock:
+            if module not in self._pending:
+                return
+            self.include(module)
+            del self._pending[module]
+            # Önbelleğe alınmış OpenAPI şeması yeni yolları içermez
+            self.app.openapi_schema = None
+
+    def load_all(self) -> None:
+        for module in list(self._pending):
+            self.load(module)
+
+    def match(self, path: str):
+        for module, paths in list(self._pending.items()):
+            for prefix in paths:
+                if path == prefix or path.startswith(prefix + "/"):
+                    return module
+        return None
+
+    @property
+    def pending(self) -> Tuple[str, ...]:
+        return tuple(self._pending)
+
+
+class LazyRouterMiddleware:
+    """
+    Yönlendirmeden önce, isteğin yolunu karşılayan bekleyen yönlendiriciyi yükler.
+    """
+
+    def __init__(self, app: ASGIApp, routers: LazyRouters, load_all_paths: Iterable[str] = ()):
+        self.app = app
+        self.routers = routers
+        self.load_all_paths = frozenset(load_all_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and self.routers.pending:
+            path = scope["path"]
+            if path in self.load_all_paths:
+                self.routers.load_all()
+            else:
+                module = self.routers.match(path)
+                if module is not None:
+                    self.routers.load(module)
+        await self.app(scope, receive, send)
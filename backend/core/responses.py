@@ -0,0 +1,74 @@
+import hashlib
+import json
+from datetime import date, datetime
+from typing import Any, Callable
+
+from fastapi import Request
+from fastapi.responses import Response
+
+try:
+    import orjson
+except ImportError:  # orjson opsiyonel; yoksa standart json kullanılır
+    orjson = None
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"JSON'a çevrilemeyen tip: {type(value).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    """
+    Hızlı JSON kodlama (orjson varsa orjson).
+    """
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":"), default=_default).encode("utf-8")
+
+
+class FastJSONResponse(Response):
+    """
+    Önceden hazırlanmış dict/list verisini pydantic doğrulaması olmadan
+    doğrudan JSON'a çeviren yanıt sınıfı. Okuma modeli (read model)
+    uç noktalarında kullanılır.
+    """
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+# ---- Koşullu GET (ETag / If-None-Match) ----
+
+def weak_etag(*parts: Any) -> str:
+    """
+    Verilen parçalardan (liste sürümü, kapsam, sayfalama) zayıf ETag üretir.
+    """
+    digest = hashlib.blake2b(repr(parts).encode("utf-8"), digest_size=12).hexdigest()
+    return f'W/"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # Zayıf karşılaştırma: W/ öneki yok sayılır
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    return any(
+        (tag.strip()[2:] if tag.strip().startswith("W/") else tag.strip()) == opaque
+        for tag in header.split(",")
+    )
+
+
+def conditional_json(request: Request, etag: str, produce: Callable[[], Any]) -> Response:
+    """
+    İstemcinin kopyası güncelse gövdesiz 304, değilse produce() sonucunu döndürür.
+    Liste yalnızca ETag değiştiğinde sorgulanır ve serileştirilir.
+    """
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return FastJSONResponse(produce(), headers=headers)
@@ -1,27 +1,49 @@
+import base64
+import hashlib
+import hmac
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Optional, Union, Any
-from jose import jwt
-from passlib.context import CryptContext
+from typing import Optional, Union, Any, Dict, Tuple
 from core.config import settings
-
-# Şifre hashleme bağlamı (context)
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from core.hashing import password_hasher
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Şifre Doğrulama
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    return password_hasher.verify(plain_password, hashed_password)
+
+def verify_password_and_update(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """
+    Şifre Doğrulama; hash güncel maliyet politikasının altındaysa yeni hash de döner.
+    """
+    return password_hasher.verify_and_update(plain_password, hashed_password)
 
 def get_password_hash(password: str) -> str:
     """
     Şifre Hashleme
     """
-    return pwd_context.hash(password)
+    return password_hasher.hash(password)
 
-def create_access_token(subject: Union[str, Any], expires_delta: Optional[timedelta] = None) -> str:
+def dummy_verify_password(plain_password: str) -> bool:
+    """
+    Bilinmeyen kullanıcılar için gerçek doğrulamayla aynı maliyette sahte
+    doğrulama; yanıt süresinden kullanıcı adının varlığı anlaşılamaz.
+    """
+    return password_hasher.dummy_verify(plain_password)
+
+def create_access_token(
+    subject: Union[str, Any],
+    expires_delta: Optional[timedelta] = None,
+    claims: Optional[Dict[str, Any]] = None,
+) -> str:
     """
     Erişim Tokenı Oluşturma
+    `claims` ile uid/role/ver gibi ek alanlar eklenebilir.
     """
     if expires_delta:
         expire = datetime.utcnow() + expires_delta
@@ -29,15 +51,125 @@ def create_access_token(subject: Union[str, Any], expires_delta: Optional[timede
         expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     
     to_encode = {"sub": str(subject), "exp": expire, "type": "access"}
+    if claims:
+        to_encode.update(claims)
+    # jose yalnızca token üretiminde/jose doğrulamasında yüklenir (açılış süresi)
+    from jose import jwt
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
+_HMAC_DIGESTS = {"HS256": hashlib.sha256, "HS384": hashlib.sha384, "HS512": hashlib.sha512}
+
+
+_B64URL_SEGMENT = re.compile(r"[A-Za-z0-9_-]*")
+
+
+def _b64decode(segment: str) -> bytes:
+    """
+    Katı base64url çözümü: dolgu, alfabe dışı karakter ve kullanılmayan bitleri
+    sıfır olmayan (kanonik olmayan) kodlamalar reddedilir; aynı token'ın
+    farklı yazımları imza doğrulamasından geçemez.
+    """
+    if len(segment) % 4 == 1 or not _B64URL_SEGMENT.fullmatch(segment):
+        raise ValueError("Geçersiz base64url")
+    data = base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+    if base64.urlsafe_b64encode(data).rstrip(b"=") != segment.encode("ascii"):
+        raise ValueError("Kanonik olmayan base64url")
+    return data
+
+
+class TokenVerifier:
+    """
+    Tek JWT doğrulama bileşeni.
+
+    - backend="hmac": HS* algoritmaları için anahtarı önceden işlenmiş HMAC
+      nesnesiyle (copy() ile) doğrudan doğrulama; kütüphane katmanı yok.
+    - backend="pyjwt" / "jose": ilgili kütüphane ile doğrulama.
+    - backend="auto": HS* ise "hmac", değilse "jose".
+
+    Başarıyla doğrulanan token -> claim eşlemesi sınırlı bir LRU'da tutulur;
+    süresi (exp) dolan kayıtlar kullanılmaz. Dönen dict paylaşılır, değiştirilmemelidir.
+    """
+
+    def __init__(self, secret: str, algorithm: str, backend: str = "auto", memo_size: int = 4096):
+        self.algorithm = algorithm
+        self.secret = secret
+        self.memo_size = memo_size
+        if backend == "auto":
+            backend = "hmac" if algorithm in _HMAC_DIGESTS else "jose"
+        if backend == "pyjwt":
+            import jwt as pyjwt  # opsiyonel bağımlılık
+            self._pyjwt = pyjwt
+        if backend == "hmac":
+            self._hmac = hmac.new(secret.encode("utf-8"), digestmod=_HMAC_DIGESTS[algorithm])
+        self.backend = backend
+        self._decode = getattr(self, f"_decode_{backend}")
+        self._memo: "OrderedDict[str, dict]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _decode_jose(self, token: str) -> dict:
+        from jose import jwt
+        return jwt.decode(token, self.secret, algorithms=[self.algorithm])
+
+    def _decode_pyjwt(self, token: str) -> dict:
+        return self._pyjwt.decode(token, self.secret, algorithms=[self.algorithm])
+
+    def _decode_hmac(self, token: str) -> dict:
+        header_b64, payload_b64, signature_b64 = token.split(".")
+        header = json.loads(_b64decode(header_b64))
+        if header.get("alg") != self.algorithm:
+            raise ValueError("Beklenmeyen algoritma")
+        mac = self._hmac.copy()
+        mac.update(f"{header_b64}.{payload_b64}".encode("ascii"))
+        if not hmac.compare_digest(mac.digest(), _b64decode(signature_b64)):
+            raise ValueError("Geçersiz imza")
+        payload = json.loads(_b64decode(payload_b64))
+        now = time.time()
+        if "exp" in payload and float(payload["exp"]) <= now:
+            raise ValueError("Token süresi dolmuş")
+        if "nbf" in payload and float(payload["nbf"]) > now:
+            raise ValueError("Token henüz geçerli değil")
+        return payload
+
+    def verify(self, token: str) -> Optional[dict]:
+        """
+        Token geçerliyse claim'leri, değilse None döndürür.
+        """
+        claims = self._memo.get(token)
+        if claims is not None:
+            if claims.get("exp") is None or claims["exp"] > time.time():
+                with self._lock:
+                    # LRU: isabet alan kayıt en sona taşınır (eşzamanlı silinmiş olabilir)
+                    if token in self._memo:
+                        self._memo.move_to_end(token)
+                return claims
+            with self._lock:
+                self._memo.pop(token, None)
+
+        try:
+            claims = self._decode(token)
+        except Exception:
+            return None
+        # Yalnızca erişim token'ları kabul edilir (ör. başka amaçla imzalanmış token'lar değil)
+        if not isinstance(claims, dict) or claims.get("type") != "access":
+            return None
+
+        if self.memo_size:
+            with self._lock:
+                self._memo[token] = claims
+                while len(self._memo) > self.memo_size:
+                    self._memo.popitem(last=False)
+        return claims
+
+
+token_verifier = TokenVerifier(
+    settings.SECRET_KEY, settings.ALGORITHM,
+    backend=settings.JWT_BACKEND, memo_size=settings.JWT_MEMO_SIZE,
+)
+
+
 def verify_token(token: str) -> Optional[dict]:
     """
     Bir JWT token'ı doğrular ve çözer.
     """
-    try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        return payload
-    except Exception:
-        return None
+    return token_verifier.verify(token)
@@ -0,0 +1,182 @@
+"""
+Worker açılışı: import süresi profili ve ısınma (warm-up).
+
+ImportProfiler, STARTUP_PROFILE ortam değişkeni açıkken passenger_wsgi'deki
+uygulama importunu sarar ve modül başına import süresini (kendi + alt
+importlar) toplar; özet log'a yazılır. `python -X importtime` bayrağının
+Passenger altında verilemediği durum içindir.
+
+warm_up(), ilk isteklerin ödediği tek seferlik maliyetleri arka planda öne
+çeker: SQLAlchemy mapper yapılandırması, ertelenmiş (defer_build) pydantic
+şemalarının derlenmesi ve bağlantı havuzunun DB_POOL_PREWARM bağlantıyla
+doldurulması.
+"""
+import builtins
+import sys
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+
+class ImportProfiler:
+    """
+    builtins.__import__ üzerinden modül başına kümülatif ve kendi import süresi.
+    """
+
+    def __init__(self):
+        self.cumulative: Dict[str, float] = {}
+        self.own: Dict[str, float] = {}
+        self.total = 0.0
+        self._stack: List[float] = []
+        self._original = None
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        if level or name in sys.modules:
+            # Göreli veya zaten yüklü: ölçülecek bir iş yok
+            return self._original(name, globals, locals, fromlist, level)
+        started = time.perf_counter()
+        self._stack.append(0.0)
+        try:
+            return self._original(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.perf_counter() - started
+            children = self._stack.pop()
+            if self._stack:
+                self._stack[-1] += elapsed
+            self.cumulative[name] = self.cumulative.get(name, 0.0) + elapsed
+            self.own[name] = self.own.get(name, 0.0) + elapsed - children
+
+    def __enter__(self) -> "ImportProfiler":
+        self._original = builtins.__import__
+        builtins.__import__ = self._import
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        builtins.__import__ = self._original
+        self.total = time.perf_counter() - self._started
+
+    def by_package(self) -> List[Tuple[str, float]]:
+        """
+        Kendi sürelerin üst paket bazında toplamı (ör. "sqlalchemy", "routers").
+        """
+        packages: Dict[str, float] = {}
+        for name, seconds in self.own.items():
+            top = name.split(".")[0]
+            packages[top] = packages.get(top, 0.0) + seconds
+        return sorted(packages.items(), key=lambda item: -item[1])
+
+    def report(self, limit: int = 15) -> str:
+        lines = [f"import toplamı: {self.total * 1000:.0f} ms", "paket bazında (kendi süresi):"]
+        lines += [f"  {seconds * 1000:8.1f} ms  {name}" for name, seconds in self.by_package()[:limit]]
+        lines.append("en yavaş modüller (kümülatif):")
+        slowest = sorted(self.cumulative.items(), key=lambda item: -item[1])[:limit]
+        lines += [f"  {seconds * 1000:8.1f} ms  {name}" for name, seconds in slowest]
+        return "\n".join(lines)
+
+
+def _build_schemas() -> int:
+    """
+    defer_build ile tanımlanmış şemaları derler; derlenen şema sayısını döndürür.
+    """
+    import schemas
+    from pydantic import BaseModel
+
+    built = 0
+    for value in vars(schemas).values():
+        if (isinstance(value, type) and issubclass(value, BaseModel)
+                and not value.__pydantic_complete__):
+            value.model_rebuild()
+            built += 1
+    return built
+
+
+def _prewarm_pool(engine, connections: int) -> int:
+    """
+    Havuza `connections` bağlantıyı paralel açıp geri bırakır (TCP + kimlik
+    doğrulama el sıkışması ilk isteklerden önce yapılır). Bir bağlantı
+    açılamazsa diğerleri beklemeden havuza döner.
+    """
+    from sqlalchemy import text
+
+    opened = []
+    errors = []
+    # Bağlantılar aynı anda açık tutulur ki havuz her biri için ayrı bağlantı açsın
+    barrier = threading.Barrier(connections, timeout=30)
+
+    def connect():
+        try:
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+                opened.append(conn)
+                try:
+                    barrier.wait()
+                except threading.BrokenBarrierError:
+                    pass
+        except Exception as e:
+            errors.append(e)
+            barrier.abort()
+
+    threads = [threading.Thread(target=connect, daemon=True) for _ in range(connections)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if errors and not opened:
+        raise errors[0]
+    return len(opened)
+
+
+def warm_up(engine, pool_connections: int, schema_delay: float = 0.0) -> Dict[str, float]:
+    """
+    Tek seferlik açılış maliyetlerini çalıştırır; adım başına süreyi (ms) döndürür.
+
+    Mapper yapılandırması ve havuz bağlantıları ilk sorgunun zaten beklediği
+    işlerdir, hemen yapılır. Kalan şemaların derlenmesi ise ilk isteklerle
+    CPU (GIL) için yarışmasın diye `schema_delay` saniye sonra yapılır.
+    """
+    from sqlalchemy.orm import configure_mappers
+
+    timings: Dict[str, float] = {}
+
+    started = time.perf_counter()
+    configure_mappers()
+    timings["mappers"] = (time.perf_counter() - started) * 1000
+
+    if pool_connections > 0:
+        started = time.perf_counter()
+        _prewarm_pool(engine, pool_connections)
+        timings["pool"] = (time.perf_counter() - started) * 1000
+
+    if schema_delay:
+        time.sleep(schema_delay)
+    started = time.perf_counter()
+    _build_schemas()
+    timings["schemas"] = (time.perf_counter() - started) * 1000
+    return timings
+
+
+_warm_up_started = False
+_warm_up_lock = threading.Lock()
+last_warm_up: Optional[Dict[str, float]] = None
+
+
+def start_background_warm_up(engine, pool_connections: int, schema_delay: float = 0.0) -> None:
+    """
+    İdempotent; hem passenger_wsgi hem lifespan çağırabilir.
+    """
+    global _warm_up_started
+    with _warm_up_lock:
+        if _warm_up_started:
+            return
+        _warm_up_started = True
+
+    def run():
+        global last_warm_up
+        try:
+            last_warm_up = warm_up(engine, pool_connections, schema_delay)
+        except Exception as e:
+            from logger import log_error
+            log_error(e, "startup warm-up")
+
+    threading.Thread(target=run, name="startup-warm-up", daemon=True).start()
@@ -1,13 +1,14 @@
-from typing import Generator, Optional
+from typing import Generator, Optional, Union
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
-from jose import jwt, JWTError
 
 from db import SessionLocal
 from core.config import settings
 from core import security
 from models import User
+from repositories.user_repo import user_repo
+from services.token_versions import token_versions
 
 # OAuth2 şeması
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
@@ -22,32 +23,73 @@ def get_db() -> Generator:
     finally:
         db.close()
 
-def get_current_user(
-    db: Session = Depends(get_db), 
-    token: str = Depends(oauth2_scheme)
-) -> User:
+
+class Principal:
     """
-    Mevcut Kullanıcı Doğrulama
+    Token claim'lerinden oluşturulan hafif kimlik (veritabanı nesnesi değil).
+    Yalnızca kimlik ve rol gerektiren uç noktalarda User yerine kullanılır.
     """
-    credentials_exception = HTTPException(
+    __slots__ = ("id", "username", "type", "is_active")
+
+    def __init__(self, id: int, username: str, type: str, is_active: bool = True):
+        self.id = id
+        self.username = username
+        self.type = type
+        self.is_active = is_active
+
+
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Kimlik bilgileri doğrulanamadı",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    
-    try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        username: str = payload.get("sub")
-        if username is None:
-            raise credentials_exception
-    except JWTError:
-        raise credentials_exception
-        
-    user = db.query(User).filter(User.username == username).first()
-    if user is None:
-        raise credentials_exception
+
+
+def _decode(token: str) -> dict:
+    payload = security.verify_token(token)
+    if payload is None or payload.get("sub") is None:
+        raise _credentials_exception()
+    return payload
+
+
+def _load_user(db: Session, payload: dict) -> User:
+    """
+    Token sahibini yükler; token sürümü kullanıcınınkiyle eşleşmiyorsa
+    (revoke-tokens sonrası) token reddedilir.
+    """
+    user = user_repo.get_by_username(db, payload["sub"], profile="auth")
+    if user is None or payload.get("ver", 0) != user.token_version:
+        raise _credentials_exception()
     return user
 
+
+def get_current_user(
+    db: Session = Depends(get_db),
+    token: str = Depends(oauth2_scheme)
+) -> User:
+    """
+    Mevcut Kullanıcı Doğrulama
+    """
+    return _load_user(db, _decode(token))
+
+def get_current_principal(
+    db: Session = Depends(get_db),
+    token: str = Depends(oauth2_scheme)
+) -> Union[Principal, User]:
+    """
+    Kimlik ve rol bilgisi.
+    AUTH_STATELESS açıksa ve token uid/role/ver içeriyorsa veritabanına gidilmez;
+    aksi halde get_current_user ile aynı şekilde kullanıcı yüklenir.
+    """
+    payload = _decode(token)
+    if settings.AUTH_STATELESS and "uid" in payload and "role" in payload:
+        if not token_versions.is_current(db, payload["uid"], payload.get("ver", 0)):
+            raise _credentials_exception()
+        return Principal(id=payload["uid"], username=payload["sub"], type=payload["role"])
+
+    return _load_user(db, payload)
+
 def get_current_active_user(current_user: User = Depends(get_current_user)) -> User:
     """
     Aktif Kullanıcı Kontrolü
@@ -56,7 +98,19 @@ def get_current_active_user(current_user: User = Depends(get_current_user)) -> U
         raise HTTPException(status_code=400, detail="Inactive user")
     return current_user
 
-def get_current_superuser(current_user: User = Depends(get_current_user)) -> User:
+def get_current_active_principal(
+    current_user: Union[Principal, User] = Depends(get_current_principal)
+) -> Union[Principal, User]:
+    """
+    Aktif Kimlik Kontrolü (pasif kullanıcıların token sürümü iptal edilmiştir)
+    """
+    if not current_user.is_active:
+        raise HTTPException(status_code=400, detail="Inactive user")
+    return current_user
+
+def get_current_superuser(
+    current_user: Union[Principal, User] = Depends(get_current_principal)
+) -> Union[Principal, User]:
     """
     Süper Kullanıcı Kontrolü
     """
@@ -0,0 +1,34 @@
+"""
+gunicorn yapılandırması: gunicorn -c gunicorn.conf.py
+
+Değerler core.config.Settings'ten (SERVER_*) gelir; bkz. asgi.py.
+preload_app kapalıdır, böylece "kill -HUP <master>" ile yapılan zarif
+yeniden yüklemede worker'lar yeni kodu import eder.
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from asgi import APP, worker_count
+from core.config import settings
+
+try:
+    import uvicorn_worker  # noqa: F401  (uvicorn.workers'ın yeni paketi)
+    _WORKER_CLASS = "uvicorn_worker.UvicornWorker"
+except ImportError:
+    _WORKER_CLASS = "uvicorn.workers.UvicornWorker"
+
+wsgi_app = APP
+bind = f"{settings.SERVER_HOST}:{settings.SERVER_PORT}"
+workers = worker_count()
+worker_class = _WORKER_CLASS
+preload_app = False
+graceful_timeout = settings.SERVER_GRACEFUL_TIMEOUT_SECONDS
+timeout = settings.SERVER_TIMEOUT_SECONDS
+keepalive = settings.SERVER_KEEPALIVE_SECONDS
+max_requests = settings.SERVER_MAX_REQUESTS
+max_requests_jitter = settings.SERVER_MAX_REQUESTS_JITTER
+forwarded_allow_ips = settings.SERVER_FORWARDED_ALLOW_IPS
+loglevel = settings.SERVER_LOG_LEVEL
+accesslog = "-" if settings.SERVER_ACCESS_LOG else None
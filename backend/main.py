@@ -1,17 +1,77 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from core.config import settings
-from routers import auth, users, tasks, leaves, dashboard, assets
-from db import engine, Base
+from core.compression import CompressionMiddleware
+from core.lazy_routers import LazyRouters, LazyRouterMiddleware
+from core.startup import start_background_warm_up
+from routers import auth, users, tasks, leaves, dashboard, assets, announcements
+from core.db_routing import ReplicaRoutingMiddleware
+from db import engine, Base, SessionLocal, replicas
+from services.search import search_index
+from core import background
+from core.hashing import password_hasher
+import services.sessions  # noqa: F401  (periyodik oturum temizliğini kaydeder)
+from services.audit import audit_writer
+from services.reminders import reminder_scheduler
+import services.audit_archive  # noqa: F401  (periyodik denetim kaydı arşivini kaydeder)
+import services.employee_stats  # noqa: F401  (periyodik istatistik mutabakatını kaydeder)
 
 # Tablolar mevcut değilse oluştur (isteğe bağlı, çoğunlukla geliştirme ortamı için)
 # Base.metadata.create_all(bind=engine)
 
+_worker_services_started = False
+
+
+def start_worker_services() -> None:
+    """
+    Worker başına arka plan işlerini başlatır. a2wsgi (Passenger) lifespan
+    olaylarını çalıştırmadığı için passenger_wsgi de çağırır; idempotenttir.
+    """
+    global _worker_services_started
+    if _worker_services_started:
+        return
+    _worker_services_started = True
+    # Arama indeksi arka planda kurulur; hazır olmadan gelen aramalar senkron kurar
+    search_index.start_background_rebuild(SessionLocal)
+    # Şifre hash maliyeti bu sunucuda hedef gecikmeye göre kalibre edilir
+    password_hasher.start_background_configure()
+    background.start_all()
+    audit_writer.start()
+    # Hatırlatıcılar isteğe bağlı olmadan, worker açılır açılmaz zamanlanır
+    reminder_scheduler.start()
+    if settings.STARTUP_WARMUP:
+        start_background_warm_up(engine, settings.DB_POOL_PREWARM, settings.STARTUP_SCHEMA_WARMUP_DELAY_SECONDS)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    start_worker_services()
+    yield
+    background.stop_all()
+    reminder_scheduler.stop()
+    # Kuyrukta bekleyen denetim kayıtları kapanmadan yazılır
+    audit_writer.stop()
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
-    openapi_url=f"{settings.API_V1_STR}/openapi.json"
+    openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    lifespan=lifespan
 )
 
+# Yanıt Sıkıştırma (CORS'tan önce eklenir; böylece en dıştaki katman CORS olur)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.COMPRESSION_MIN_BYTES,
+    gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+    brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+)
+
+# Okuma replikaları: salt-okunur isteklerin SELECT'leri replikaya gider
+# (/batch yalnızca okuma alt istekleri çalıştırır)
+if replicas:
+    app.add_middleware(ReplicaRoutingMiddleware, read_only_paths=[f"{settings.API_V1_STR}/batch"])
+
 # CORS Ayarları
 app.add_middleware(
     CORSMiddleware,
@@ -28,6 +88,27 @@ app.include_router(tasks.router, prefix=settings.API_V1_STR)
 app.include_router(leaves.router, prefix=settings.API_V1_STR)
 app.include_router(dashboard.router, prefix=settings.API_V1_STR)
 app.include_router(assets.router, prefix=settings.API_V1_STR)
+app.include_router(announcements.router, prefix=settings.API_V1_STR)
+
+# İlk istekte yüklenen yönlendiriciler: modül -> karşıladığı yol önekleri.
+# LAZY_ROUTERS kapalıysa hepsi burada eklenir.
+lazy_routers = LazyRouters(app, prefix=settings.API_V1_STR)
+lazy_routers.add("routers.search", ["/search"])
+lazy_routers.add("routers.audit", ["/audit-logs"])
+lazy_routers.add("routers.documents", ["/documents"])
+lazy_routers.add("routers.employees", ["/employees"])
+lazy_routers.add("routers.departments", ["/departments", "/org"])
+lazy_routers.add("routers.widgets", ["/widgets"])
+lazy_routers.add("routers.reminders", ["/reminders"])
+lazy_routers.add("routers.batch", ["/batch"])
+if settings.LAZY_ROUTERS:
+    app.add_middleware(
+        LazyRouterMiddleware,
+        routers=lazy_routers,
+        load_all_paths=[app.openapi_url, app.docs_url, app.redoc_url],
+    )
+else:
+    lazy_routers.load_all()
 
 @app.get("/")
 def root():
@@ -1,6 +1,6 @@
 from datetime import datetime
 from typing import List, Optional
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Float, ForeignKey, Text, Enum, JSON
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Float, ForeignKey, Text, Enum, JSON, Index, UniqueConstraint
 from sqlalchemy.orm import relationship, Mapped, mapped_column, DeclarativeBase
 from sqlalchemy.sql import func
 from db import Base
@@ -25,6 +25,7 @@ class User(Base):
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), onupdate=func.now(), nullable=True)
     type: Mapped[str] = mapped_column(String(50))
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
+    token_version: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False) # Token iptali için
 
     # Ortak İlişkiler
     tasks: Mapped[List["Task"]] = relationship("Task", back_populates="user", foreign_keys="Task.user_id")
@@ -120,11 +121,18 @@ class AssistantManager(User):
         "polymorphic_identity": "assistant_manager",
     }
 
+# Joined Table Inheritance alt sınıfları (polimorfik yükleme ve departman sorguları için)
+USER_SUBCLASSES = (Owner, HRManager, Employee, Manager, AssistantManager)
+
 class Task(Base):
     """
     Kullanıcıya atanan görev varlığı (Task entity).
     """
     __tablename__ = 'tasks'
+    __table_args__ = (
+        # Kullanıcı kapsamlı liste sürümü (COUNT + MAX) yalnızca indeksten okunur
+        Index("ix_tasks_user_versions", "user_id", "created_at", "updated_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     title: Mapped[str] = mapped_column(String(200), nullable=False)
@@ -133,6 +141,7 @@ class Task(Base):
     status: Mapped[str] = mapped_column(Enum('pending', 'in_progress', 'completed', name='status_enum'), default='pending')
     due_date: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, onupdate=func.now(), nullable=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
 
     user: Mapped["User"] = relationship("User", back_populates="tasks")
@@ -155,18 +164,30 @@ class LeaveRequest(Base):
     approved_by: Mapped[Optional[int]] = mapped_column(ForeignKey("users.id"), nullable=True)
     approved_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, onupdate=func.now(), nullable=True)
 
     user: Mapped["User"] = relationship("User", back_populates="leave_requests", foreign_keys=[user_id])
     approver: Mapped[Optional["User"]] = relationship("User", foreign_keys=[approved_by])
 
+    __table_args__ = (
+        # İzin takvimi aralık sorguları için (status, başlangıç, bitiş)
+        Index("ix_leave_requests_status_dates", "status", "start_date", "end_date"),
+        # Çalışanın kendi listesi (created_at sıralı) ve liste sürümü için
+        Index("ix_leave_requests_user_versions", "user_id", "created_at", "updated_at"),
+    )
+
 class LeaveBalance(Base):
     """
     Bir çalışanın belirli bir yıldaki izin bakiyelerini takip eder.
     """
     __tablename__ = 'leave_balance'
+    __table_args__ = (
+        # Çalışan başına yılda tek bakiye satırı (eşzamanlı oluşturmada tekrarı engeller)
+        UniqueConstraint("user_id", "year", name="uq_leave_balance_user_year"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
-    user_id: Mapped[int] = mapped_column(ForeignKey("employees.id"), nullable=False, unique=False) # Yıl bazlı benzersizlik
+    user_id: Mapped[int] = mapped_column(ForeignKey("employees.id"), nullable=False)
     year: Mapped[int] = mapped_column(Integer, nullable=False, default=2025)
     annual_leave: Mapped[int] = mapped_column(Integer, default=15)
     sick_leave: Mapped[int] = mapped_column(Integer, default=10)
@@ -174,6 +195,16 @@ class LeaveBalance(Base):
     
     employee: Mapped["Employee"] = relationship("Employee", back_populates="leave_balance")
 
+class ListVersion(Base):
+    """
+    Liste uç noktalarının ETag'i için tablo başına yazma sayacı
+    (repositories/read_models.py içinde commit öncesi artırılır).
+    """
+    __tablename__ = 'list_versions'
+
+    name: Mapped[str] = mapped_column(String(50), primary_key=True)
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
 class Announcement(Base):
     """
     Sistem genelinde veya özel kategorili duyurular (Announcements).
@@ -217,6 +248,7 @@ class AssetCategory(Base):
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     icon: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, onupdate=func.now(), nullable=True)
 
     assets: Mapped[List["EmployeeAsset"]] = relationship("EmployeeAsset", back_populates="category")
 
@@ -234,6 +266,7 @@ class EmployeeAsset(Base):
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     assigned_by: Mapped[Optional[int]] = mapped_column(ForeignKey("users.id"), nullable=True)
     assigned_date: Mapped[datetime] = mapped_column(DateTime, default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, onupdate=func.now(), nullable=True)
     return_date: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     status: Mapped[str] = mapped_column(String(50), default='active')
     document_url: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
@@ -280,6 +313,11 @@ class AuditLog(Base):
     Sistem eylemleri için denetim kayıtları (Audit logs for system actions).
     """
     __tablename__ = 'audit_logs'
+    __table_args__ = (
+        # Zaman aralığı ve kullanıcı + zaman aralığı sorguları için
+        Index("ix_audit_logs_created_at", "created_at"),
+        Index("ix_audit_logs_user_created", "user_id", "created_at"),
+    )
     
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     user_id: Mapped[Optional[int]] = mapped_column(ForeignKey("users.id"), nullable=True)
@@ -296,8 +334,8 @@ class Session(Base):
     
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
-    token: Mapped[str] = mapped_column(String(500), unique=True, nullable=False)
-    expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    token: Mapped[str] = mapped_column(String(500), unique=True, nullable=False) # Refresh token'ın SHA-256 özeti
+    expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=func.now())
 
 class Reminder(Base):
@@ -305,10 +343,18 @@ class Reminder(Base):
     Sistem hatırlatıcıları (System reminders).
     """
     __tablename__ = 'reminders'
+    __table_args__ = (
+        # Yaklaşan pencere ve henüz tetiklenmemiş hatırlatıcı sorguları için
+        Index("ix_reminders_date", "date"),
+    )
     
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     title: Mapped[str] = mapped_column(String(200), nullable=False)
     date: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    type: Mapped[str] = mapped_column(String(20), default='other', server_default='other', nullable=False) # probation, birthday, tax, other
+    priority: Mapped[str] = mapped_column(String(10), default='medium', server_default='medium', nullable=False) # high, medium, low
+    user_id: Mapped[Optional[int]] = mapped_column(ForeignKey("users.id"), nullable=True) # Boşsa tüm yöneticiler için
+    fired_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True) # Bildirim gönderildiği an
     created_at: Mapped[datetime] = mapped_column(DateTime, default=func.now())
 
 class Document(Base):
@@ -320,5 +366,11 @@ class Document(Base):
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     title: Mapped[str] = mapped_column(String(200), nullable=False)
     file_path: Mapped[str] = mapped_column(String(500), nullable=False)
+    # İçeriğin SHA-256 özeti; aynı içerik diskte tek kopya tutulur
+    content_hash: Mapped[Optional[str]] = mapped_column(String(64), nullable=True, index=True)
+    content_type: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    size_bytes: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    status: Mapped[str] = mapped_column(String(20), default='pending', server_default='pending', nullable=False) # pending, approved, rejected
+    rejection_reason: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     uploaded_by: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=func.now())
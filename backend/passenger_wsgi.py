@@ -1,5 +1,6 @@
 import os
 import sys
+import time
 from a2wsgi import ASGIMiddleware
 
 # Increase recursion limit just in case, though a2wsgi should prevent it
@@ -8,11 +9,29 @@ sys.setrecursionlimit(2000)
 # cPanel/Passenger needs to know where the app is.
 sys.path.insert(0, os.path.dirname(__file__))
 
+from core.startup import ImportProfiler
+
+# STARTUP_PROFILE=1 (Passenger: SetEnv/passenger_env_var) import süresi dökümünü log'a yazar
+_profile = os.getenv("STARTUP_PROFILE", "").lower() in ("1", "true", "yes")
+_started = time.perf_counter()
+
 try:
-    from main import app
+    if _profile:
+        with ImportProfiler() as _profiler:
+            from main import app, start_worker_services
+    else:
+        from main import app, start_worker_services
 except Exception as e:
     print(f"Error importing main app: {e}")
     raise e
 
 # Wrap the ASGI app with ASGIMiddleware to make it WSGI compatible for Passenger
 application = ASGIMiddleware(app)
+
+# a2wsgi lifespan olaylarını çalıştırmaz; periyodik görevler, denetim yazıcısı,
+# hatırlatıcı zamanlayıcı, arama indeksi ve ısınma burada başlatılır
+start_worker_services()
+
+if _profile:
+    from logger import logger
+    logger.info("worker açılışı: %.0f ms\n%s", (time.perf_counter() - _started) * 1000, _profiler.report())
@@ -0,0 +1,25 @@
+from typing import List, Optional
+from sqlalchemy.orm import Session
+from sqlalchemy import desc
+from repositories.base import BaseRepository
+from models import Announcement
+from schemas import AnnouncementCreate, AnnouncementUpdate
+
+
+class AnnouncementRepository(BaseRepository[Announcement, AnnouncementCreate, AnnouncementUpdate]):
+    def get_active(self, db: Session, category: Optional[str] = None) -> List[Announcement]:
+        query = db.query(self.model).filter(Announcement.is_active.is_(True))
+        if category:
+            query = query.filter(Announcement.category == category)
+        return query.order_by(desc(Announcement.announcement_date)).all()
+
+    def create(self, db: Session, obj_in: AnnouncementCreate, created_by: Optional[int] = None) -> Announcement:
+        obj_in_data = obj_in.model_dump(exclude_none=True)
+        db_obj = Announcement(**obj_in_data, created_by=created_by)
+        db.add(db_obj)
+        db.commit()
+        db.refresh(db_obj)
+        return db_obj
+
+
+announcement_repo = AnnouncementRepository(Announcement)
@@ -0,0 +1,41 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+from models import AuditLog
+
+
+class AuditLogRepository:
+    def insert_many(self, db: Session, rows: List[Dict[str, Any]]) -> None:
+        """
+        Tek bir çok satırlı INSERT ... VALUES (...), (...) ile yazar.
+        """
+        if rows:
+            db.execute(insert(AuditLog).values(rows))
+
+    def query(
+        self,
+        db: Session,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        user_id: Optional[int] = None,
+        action: Optional[str] = None,
+        limit: int = 100,
+    ) -> List[AuditLog]:
+        """
+        Zaman aralığı (created_at) ve kullanıcıya göre, yeniden eskiye sıralı kayıtlar.
+        """
+        stmt = select(AuditLog)
+        if since is not None:
+            stmt = stmt.where(AuditLog.created_at >= since)
+        if until is not None:
+            stmt = stmt.where(AuditLog.created_at < until)
+        if user_id is not None:
+            stmt = stmt.where(AuditLog.user_id == user_id)
+        if action:
+            stmt = stmt.where(AuditLog.action == action)
+        stmt = stmt.order_by(AuditLog.created_at.desc(), AuditLog.id.desc()).limit(limit)
+        return list(db.execute(stmt).scalars())
+
+
+audit_repo = AuditLogRepository()
@@ -0,0 +1,69 @@
+from typing import Optional
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from core.config import settings
+from models import Document, EmployeeAsset
+from services.documents import StoredFile
+from services.employee_stats import employee_stats
+
+
+class DocumentRepository:
+    def get(self, db: Session, id: int) -> Optional[Document]:
+        return db.get(Document, id)
+
+    def create(
+        self,
+        db: Session,
+        title: str,
+        stored: StoredFile,
+        content_type: Optional[str],
+        uploaded_by: int,
+        asset: Optional[EmployeeAsset] = None,
+    ) -> Document:
+        """
+        Doküman kaydını oluşturur; demirbaş verilirse belge bağlantısı aynı
+        transaction'da demirbaşa yazılır.
+        """
+        document = Document(
+            title=title,
+            file_path=stored.file_path,
+            content_hash=stored.content_hash,
+            content_type=content_type,
+            size_bytes=stored.size_bytes,
+            uploaded_by=uploaded_by,
+        )
+        db.add(document)
+        db.flush()
+        if asset is not None:
+            asset.document_url = f"{settings.API_V1_STR}/documents/{document.id}/content"
+            asset.document_filename = title
+        db.commit()
+        db.refresh(document)
+        employee_stats.document_uploaded()
+        return document
+
+    def review(self, db: Session, document: Document, approved: bool,
+               rejection_reason: Optional[str] = None) -> Document:
+        was_pending = document.status == "pending"
+        document.status = "approved" if approved else "rejected"
+        document.rejection_reason = None if approved else rejection_reason
+        db.commit()
+        db.refresh(document)
+        if was_pending:
+            employee_stats.document_resolved()
+        return document
+
+    def count_by_hash(self, db: Session, content_hash: str) -> int:
+        return db.execute(
+            select(func.count(Document.id)).where(Document.content_hash == content_hash)
+        ).scalar_one()
+
+    def remove(self, db: Session, document: Document) -> None:
+        was_pending = document.status == "pending"
+        db.delete(document)
+        db.commit()
+        if was_pending:
+            employee_stats.document_resolved()
+
+
+document_repo = DocumentRepository()
@@ -4,6 +4,9 @@ from repositories.base import BaseRepository
 from models import Employee, User
 from schemas import EmployeeCreate, EmployeeResponse
 from core.security import get_password_hash
+from services.search import index_user
+from services.employee_stats import employee_stats
+from services.org_chart import org_chart
 
 class EmployeeRepository(BaseRepository[Employee, EmployeeCreate, EmployeeCreate]):
     def create_employee(self, db: Session, obj_in: EmployeeCreate) -> Employee:
@@ -24,6 +27,9 @@ class EmployeeRepository(BaseRepository[Employee, EmployeeCreate, EmployeeCreate
         db.add(db_user)
         db.commit()
         db.refresh(db_user)
+        index_user(db_user)
+        employee_stats.employee_created(db_user.id, db_user.is_active, db_user.start_date)
+        org_chart.invalidate()
         return db_user
 
 employee_repo = EmployeeRepository(Employee)
@@ -1,9 +1,32 @@
-from typing import List
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy import desc, func, update, select
+from sqlalchemy.exc import IntegrityError
 from repositories.base import BaseRepository
-from models import LeaveRequest
+from models import LeaveRequest, LeaveBalance, User, Employee, USER_SUBCLASSES
 from schemas import LeaveRequestCreate, LeaveRequestUpdate
+from services.employee_stats import employee_stats
+
+# Departman bilgisi alt sınıf tablolarında tutuluyor
+_DEPARTMENT_TABLES = [model.__table__ for model in USER_SUBCLASSES]
+
+# İzin türü -> bakiyeden düşülecek kolon (listede olmayan türler bakiyeden düşmez)
+LEAVE_BALANCE_COLUMNS = {
+    "annual": LeaveBalance.annual_leave,
+    "Yıllık İzin": LeaveBalance.annual_leave,
+    "sick": LeaveBalance.sick_leave,
+    "Sağlık": LeaveBalance.sick_leave,
+    "Hastalık İzni": LeaveBalance.sick_leave,
+    "personal": LeaveBalance.personal_leave,
+    "Mazeret İzni": LeaveBalance.personal_leave,
+}
+
+
+class LeaveConflictError(Exception):
+    """
+    İzin talebi artık beklemede değil ya da bakiye yetersiz.
+    """
 
 
 class LeaveRepository(
@@ -25,5 +48,196 @@ class LeaveRepository(
         return db.query(self.model)\
             .filter(LeaveRequest.status == 'pending').all()
 
+    def get_overlapping(
+        self,
+        db: Session,
+        start: datetime,
+        end: datetime,
+        department: Optional[str] = None,
+        status: str = 'approved',
+    ) -> List[Any]:
+        """
+        [start, end) penceresiyle kesişen izinleri tek bir indeksli aralık
+        taramasıyla, kullanıcı adı ve departmanıyla birlikte getirir.
+        """
+        users = User.__table__
+        department_col = func.coalesce(
+            *[table.c.department for table in _DEPARTMENT_TABLES]
+        ).label("department")
+
+        query = db.query(
+            LeaveRequest.id,
+            LeaveRequest.user_id,
+            LeaveRequest.leave_type,
+            LeaveRequest.start_date,
+            LeaveRequest.end_date,
+            users.c.full_name,
+            department_col,
+        ).join(users, users.c.id == LeaveRequest.user_id)
+        for table in _DEPARTMENT_TABLES:
+            query = query.outerjoin(table, table.c.id == users.c.id)
+
+        query = query.filter(
+            LeaveRequest.status == status,
+            LeaveRequest.start_date < end,
+            LeaveRequest.end_date >= start,
+        )
+        if department:
+            query = query.filter(department_col == department)
+        return query.all()
+
+    def _decide(self, db: Session, leave: LeaveRequest, status: str, approver_id: int,
+                rejection_reason: Optional[str] = None) -> None:
+        """
+        Durumu yalnızca talep hâlâ 'pending' ise değiştiren koşullu UPDATE.
+        Satır kilidi eşzamanlı karar verenleri sıraya sokar; ikinci gelen 0 satır görür.
+        """
+        result = db.execute(
+            update(LeaveRequest)
+            .where(LeaveRequest.id == leave.id, LeaveRequest.status == 'pending')
+            .values(
+                status=status,
+                approved_by=approver_id,
+                approved_at=datetime.utcnow(),
+                rejection_reason=rejection_reason,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount != 1:
+            raise LeaveConflictError("İzin talebi zaten sonuçlandırılmış")
+
+    def _deduct_balance(self, db: Session, leave: LeaveRequest) -> None:
+        """
+        Bakiyeyi yalnızca yeterliyse düşüren koşullu UPDATE.
+        """
+        column = LEAVE_BALANCE_COLUMNS.get(leave.leave_type)
+        if column is None:
+            return
+        year = leave.start_date.year
+        criteria = (LeaveBalance.user_id == leave.user_id, LeaveBalance.year == year)
+
+        stmt = (
+            update(LeaveBalance)
+            .where(*criteria, column >= leave.total_days)
+            .values({column: column - leave.total_days})
+            .execution_options(synchronize_session=False)
+        )
+        if db.execute(stmt).rowcount == 1:
+            return
+
+        # Yavaş yol: bakiye satırı hiç yoksa çalışan için varsayılanlarla oluştur
+        if db.execute(select(LeaveBalance.id).where(*criteria)).first() is not None:
+            raise LeaveConflictError("Yetersiz izin bakiyesi")
+        if db.get(Employee, leave.user_id) is None:
+            return  # Bakiye takibi yalnızca çalışanlar için yapılıyor
+        # Insert-or-ignore: eşzamanlı oluşturan olursa UNIQUE(user_id, year)
+        # ikinci satırı reddeder ve aynı satır üzerinden koşullu UPDATE yapılır
+        try:
+            with db.begin_nested():
+                db.add(LeaveBalance(user_id=leave.user_id, year=year))
+        except IntegrityError:
+            pass
+        if db.execute(stmt).rowcount != 1:
+            raise LeaveConflictError("Yetersiz izin bakiyesi")
+
+    def decide(self, db: Session, leave: LeaveRequest, status: str, approver_id: int,
+               rejection_reason: Optional[str] = None) -> LeaveRequest:
+        """
+        Onay/ret işlemini tek transaction içinde yapar; onayda bakiye aynı
+        transaction'da düşülür. Çakışmada geri alır ve LeaveConflictError fırlatır.
+        """
+        try:
+            self._decide(db, leave, status, approver_id, rejection_reason)
+            if status == 'approved':
+                self._deduct_balance(db, leave)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        db.refresh(leave)
+        if status == 'approved':
+            employee_stats.leave_approved(leave.user_id, leave.start_date, leave.end_date)
+        return leave
+
+    def _refund_balance(self, db: Session, leave: LeaveRequest) -> None:
+        """
+        Onayda düşülen günleri bakiyeye geri ekler (satır yoksa düşülmemiştir).
+        """
+        column = LEAVE_BALANCE_COLUMNS.get(leave.leave_type)
+        if column is None:
+            return
+        db.execute(
+            update(LeaveBalance)
+            .where(LeaveBalance.user_id == leave.user_id, LeaveBalance.year == leave.start_date.year)
+            .values({column: column + leave.total_days})
+            .execution_options(synchronize_session=False)
+        )
+
+    def reopen(self, db: Session, leave: LeaveRequest) -> LeaveRequest:
+        """
+        Sonuçlandırılmış talebi yeniden beklemeye alır. Onaylıysa düşülen
+        bakiye aynı transaction'da iade edilir; koşullu UPDATE sayesinde iade
+        bir onay için yalnızca bir kez yapılır.
+        """
+        previous = leave.status
+        if previous not in ('approved', 'rejected'):
+            raise LeaveConflictError("İzin talebi zaten beklemede")
+        try:
+            result = db.execute(
+                update(LeaveRequest)
+                .where(LeaveRequest.id == leave.id, LeaveRequest.status == previous)
+                .values(status='pending', approved_by=None, approved_at=None, rejection_reason=None)
+                .execution_options(synchronize_session=False)
+            )
+            if result.rowcount != 1:
+                raise LeaveConflictError("İzin talebi eşzamanlı olarak değiştirildi")
+            if previous == 'approved':
+                self._refund_balance(db, leave)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        db.refresh(leave)
+        if previous == 'approved':
+            employee_stats.leave_revoked(leave.user_id, leave.start_date, leave.end_date)
+        return leave
+
+    def bulk_approve(self, db: Session, leave_ids: List[int], approver_id: int) -> Tuple[List[int], Dict[int, str]]:
+        """
+        Birden çok talebi tek transaction'da onaylar. Her talep kendi
+        SAVEPOINT'inde işlenir; başarısız olanlar diğerlerini etkilemez.
+        """
+        leaves = db.query(self.model).filter(
+            LeaveRequest.id.in_(leave_ids), LeaveRequest.status == 'pending'
+        ).all()
+        by_id = {leave.id: leave for leave in leaves}
+
+        approved: List[int] = []
+        approved_spans = []
+        failed: Dict[int, str] = {}
+        try:
+            for leave_id in dict.fromkeys(leave_ids):
+                leave = by_id.get(leave_id)
+                if leave is None:
+                    failed[leave_id] = "İzin talebi bulunamadı veya beklemede değil"
+                    continue
+                savepoint = db.begin_nested()
+                try:
+                    self._decide(db, leave, 'approved', approver_id)
+                    self._deduct_balance(db, leave)
+                    savepoint.commit()
+                    approved.append(leave_id)
+                    approved_spans.append((leave.user_id, leave.start_date, leave.end_date))
+                except LeaveConflictError as e:
+                    savepoint.rollback()
+                    failed[leave_id] = str(e)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        for span in approved_spans:
+            employee_stats.leave_approved(*span)
+        return approved, failed
+
 
 leave_repo = LeaveRepository(LeaveRequest)
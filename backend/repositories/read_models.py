@@ -0,0 +1,173 @@
+"""
+Liste uç noktaları için okuma modelleri (read models).
+
+ORM nesnesi ve pydantic doğrulaması yerine SQLAlchemy Core ile yalnızca
+yanıtta kullanılan kolonlar seçilir ve satırlar doğrudan dict'e çevrilir.
+Alan isimleri ilgili *Response şemalarıyla birebir aynıdır.
+"""
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy import event, select, desc, func, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from models import Task, LeaveRequest, EmployeeAsset, AssetCategory, User, Employee, ListVersion, USER_SUBCLASSES
+
+TASK_COLUMNS = (
+    Task.id, Task.title, Task.description, Task.priority, Task.due_date,
+    Task.status, Task.created_at, Task.user_id,
+)
+
+LEAVE_COLUMNS = (
+    LeaveRequest.id, LeaveRequest.user_id, LeaveRequest.leave_type,
+    LeaveRequest.start_date, LeaveRequest.end_date, LeaveRequest.total_days,
+    LeaveRequest.reason, LeaveRequest.status, LeaveRequest.created_at,
+    LeaveRequest.rejection_reason, LeaveRequest.approved_by, LeaveRequest.approved_at,
+)
+
+ASSET_COLUMNS = (
+    EmployeeAsset.id, EmployeeAsset.asset_name, EmployeeAsset.serial_number,
+    EmployeeAsset.description, EmployeeAsset.status, EmployeeAsset.employee_id,
+    EmployeeAsset.category_id, EmployeeAsset.assigned_date, EmployeeAsset.return_date,
+    EmployeeAsset.document_url,
+)
+
+USER_COLUMNS = (
+    User.id, User.username, User.email, User.full_name, User.is_active,
+    User.avatar, User.created_at, User.type,
+)
+
+
+# Liste sürümü için (oluşturulma, güncellenme) kolonları
+VERSION_COLUMNS = {
+    Task: (Task.created_at, Task.updated_at),
+    LeaveRequest: (LeaveRequest.created_at, LeaveRequest.updated_at),
+    EmployeeAsset: (EmployeeAsset.assigned_date, EmployeeAsset.updated_at),
+    AssetCategory: (AssetCategory.created_at, AssetCategory.updated_at),
+    User: (User.created_at, User.updated_at),
+}
+
+
+def list_version(db: Session, model: Any, *criteria: Any) -> Tuple[Any, ...]:
+    """
+    ETag'e giren liste sürümü.
+
+    - Kapsamsız (tüm tablo): list_versions tablosundaki yazma sayacı; tek
+      satırlık birincil anahtar okuması. Tüm tabloda COUNT/MAX satır sayısıyla
+      büyür ve 304 yolunu 200 yolundan pahalı hale getirir.
+    - Kapsamlı (ör. user_id): (satır sayısı, en son oluşturulma, en son
+      güncellenme) tek aggregate sorguda; (user_id, created_at, updated_at)
+      indeksinden okunur.
+    Not: Sayaç yalnızca ORM oturumu üzerinden yapılan yazmaları görür;
+    veritabanında elle yapılan değişiklikler bir sonraki yazmaya kadar ETag'e yansımaz.
+    """
+    if not criteria:
+        version = db.execute(
+            select(ListVersion.version).where(ListVersion.name == model.__tablename__)
+        ).scalar()
+        return ("v", version or 0)
+    created, updated = VERSION_COLUMNS[model]
+    stmt = select(func.count(), func.max(created), func.max(updated)).select_from(model).where(*criteria)
+    return tuple(db.execute(stmt).one())
+
+
+# ---- Yazma sayacı ----
+
+# Alt sınıflar (Employee, Manager...) temel mapper üzerinden User'a sayılır
+_VERSIONED_TABLES = {model: model.__tablename__ for model in VERSION_COLUMNS}
+
+
+def _note_write(session: Session, mapper) -> None:
+    if mapper is None:
+        return
+    name = _VERSIONED_TABLES.get(mapper.base_mapper.class_)
+    if name is not None:
+        session.info.setdefault("list_versions", set()).add(name)
+
+
+@event.listens_for(Session, "after_flush")
+def _note_flush(session, flush_context):
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        _note_write(session, type(obj).__mapper__)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _note_bulk(orm_execute_state):
+    # update(LeaveRequest)... gibi flush dışı koşullu yazmalar
+    if orm_execute_state.is_update or orm_execute_state.is_delete or orm_execute_state.is_insert:
+        _note_write(orm_execute_state.session, orm_execute_state.bind_mapper)
+
+
+@event.listens_for(Session, "before_commit")
+def _bump_versions(session):
+    # Son flush commit'ten sonra çalışacağı için yazmalar burada toplanır
+    session.flush()
+    names = session.info.pop("list_versions", None)
+    # Sabit sırayla artırılır; eşzamanlı transaction'lar kilitlerde kilitlenmez
+    for name in sorted(names or ()):
+        stmt = (
+            update(ListVersion)
+            .where(ListVersion.name == name)
+            .values(version=ListVersion.version + 1)
+            .execution_options(synchronize_session=False)
+        )
+        if session.execute(stmt).rowcount == 1:
+            continue
+        try:
+            with session.begin_nested():
+                session.add(ListVersion(name=name, version=1))
+        except IntegrityError:
+            session.execute(stmt)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_versions(session):
+    session.info.pop("list_versions", None)
+
+
+def _rows(db: Session, stmt) -> List[Dict[str, Any]]:
+    return [dict(row) for row in db.execute(stmt).mappings()]
+
+
+def task_rows(db: Session, user_id: int, skip: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
+    stmt = select(*TASK_COLUMNS).where(Task.user_id == user_id).offset(skip).limit(limit)
+    return _rows(db, stmt)
+
+
+def leave_rows(db: Session, user_id: Optional[int] = None, skip: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
+    stmt = select(*LEAVE_COLUMNS)
+    if user_id is not None:
+        stmt = stmt.where(LeaveRequest.user_id == user_id).order_by(desc(LeaveRequest.created_at))
+    return _rows(db, stmt.offset(skip).limit(limit))
+
+
+def asset_rows(db: Session, employee_id: Optional[int] = None) -> List[Dict[str, Any]]:
+    stmt = select(*ASSET_COLUMNS)
+    if employee_id is not None:
+        stmt = stmt.where(EmployeeAsset.employee_id == employee_id)
+    return _rows(db, stmt)
+
+
+def user_rows(db: Session, skip: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
+    rows = _rows(db, select(*USER_COLUMNS).offset(skip).limit(limit))
+    for row in rows:
+        # UserResponse'taki computed_field alanları
+        row["name"] = row["full_name"]
+        row["role"] = row["type"]
+    return rows
+
+
+def org_rows(db: Session) -> List[Dict[str, Any]]:
+    """
+    Organizasyon şeması için tüm kullanıcılar tek sorguda: departman alt
+    sınıf tablolarından, yönetici employees.manager_id'den gelir.
+    """
+    users = User.__table__
+    tables = [model.__table__ for model in USER_SUBCLASSES]
+    employees = Employee.__table__
+    stmt = select(
+        users.c.id, users.c.full_name, users.c.type, users.c.is_active,
+        func.coalesce(*[table.c.department for table in tables]).label("department"),
+        employees.c.manager_id,
+    ).select_from(users)
+    for table in tables:
+        stmt = stmt.outerjoin(table, table.c.id == users.c.id)
+    return _rows(db, stmt)
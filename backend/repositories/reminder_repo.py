@@ -0,0 +1,24 @@
+from typing import Optional
+from sqlalchemy.orm import Session
+from repositories.base import BaseRepository
+from models import Reminder
+from schemas import ReminderCreate
+from services.reminders import reminder_added, reminder_removed
+
+
+class ReminderRepository(BaseRepository[Reminder, ReminderCreate, ReminderCreate]):
+    def create(self, db: Session, obj_in: ReminderCreate, user_id: Optional[int] = None) -> Reminder:
+        db_obj = Reminder(**obj_in.model_dump(exclude={"for_all"}), user_id=user_id)
+        db.add(db_obj)
+        db.commit()
+        db.refresh(db_obj)
+        reminder_added(db_obj)
+        return db_obj
+
+    def remove(self, db: Session, id: int) -> Reminder:
+        obj = super().remove(db, id=id)
+        reminder_removed(id)
+        return obj
+
+
+reminder_repo = ReminderRepository(Reminder)
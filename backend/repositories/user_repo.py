@@ -1,17 +1,102 @@
-from typing import Optional
-from sqlalchemy.orm import Session
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy import update
+from sqlalchemy.orm import Session, Query, load_only, defer, with_polymorphic, selectin_polymorphic
 from repositories.base import BaseRepository
-from models import User
+from models import User, USER_SUBCLASSES
 from schemas import UserCreate, UserUpdate
-from core.security import get_password_hash, verify_password
+from core.security import get_password_hash, verify_password_and_update, dummy_verify_password
+from services.search import index_user
+from services.employee_stats import employee_stats
+from services.org_chart import org_chart
+from services.sessions import revoke_user_sessions
+from services.token_versions import REVOKED, token_versions
+
+# Polimorfik yükleme politikaları (alt sınıf kolonları nasıl yüklenir):
+#   "selectin" -> ana sorgudan sonra, sonuçta bulunan her alt sınıf için tek
+#                 bir "WHERE id IN (...)" sorgusu. Sorgu sayısı N'den bağımsızdır.
+#   "joined"   -> tüm alt sınıf tabloları ana sorguya LEFT OUTER JOIN edilir.
+#   None       -> yalnızca users tablosu; alt sınıf kolonlarına erişim satır
+#                 başına tembel (lazy) sorgu üretir.
+POLYMORPHIC_POLICIES = ("selectin", "joined", None)
+DEFAULT_POLYMORPHIC_POLICY = "selectin"
+
+# Yükleme profilleri: hangi kolonların yükleneceği ve alt sınıf tablolarının
+# nasıl yükleneceği. Yüklenmeyen kolonlara erişim tembel (lazy) yüklemeyle
+# yine çalışır, sadece ilk sorguda gelmez.
+#   columns      -> load_only ile yüklenecek users kolonları (None: hepsi)
+#   polymorphic  -> polimorfik yükleme politikası (yukarıya bakınız)
+#   deferred     -> ertelenecek hassas/geniş kolonlar
+LOAD_PROFILES: Dict[str, Dict[str, Any]] = {
+    # /login: yalnızca kimlik doğrulama için gerekenler
+    "login": {
+        "columns": ("id", "username", "password_hash", "type", "is_active", "token_version"),
+        "polymorphic": None,
+        "deferred": (),
+    },
+    # get_current_user / token yenileme: "list" + token_version (dependencies._load_user
+    # token'ın "ver" claim'ini bununla karşılaştırır); şifre hash'i hariç
+    "auth": {
+        "columns": ("id", "username", "email", "full_name", "avatar", "created_at", "type", "is_active",
+                    "token_version"),
+        "polymorphic": None,
+        "deferred": (),
+    },
+    # Listeleme: UserResponse alanları, alt sınıf tabloları hariç
+    "list": {
+        "columns": ("id", "username", "email", "full_name", "avatar", "created_at", "type", "is_active"),
+        "polymorphic": None,
+        "deferred": (),
+    },
+    # Detay: tüm alt sınıf kolonları, hassas kolonlar ertelenmiş
+    "detail": {
+        "columns": None,
+        "polymorphic": DEFAULT_POLYMORPHIC_POLICY,
+        "deferred": ("password_hash", "salary"),
+    },
+}
 
 
 class UserRepository(BaseRepository[User, UserCreate, UserUpdate]):
-    def get_by_email(self, db: Session, email: str) -> Optional[User]:
-        return db.query(User).filter(User.email == email).first()
+    load_profiles = LOAD_PROFILES
+
+    def _query(self, db: Session, profile: str, polymorphic: Any = ...) -> Tuple[Query, Any]:
+        """
+        Profile göre yapılandırılmış sorguyu ve filtrelerde kullanılacak varlığı döndürür.
+        `polymorphic` verilirse profilin polimorfik politikasını bu sorgu için ezer.
+        """
+        spec = self.load_profiles[profile]
+        policy = spec["polymorphic"] if polymorphic is ... else polymorphic
+        if policy not in POLYMORPHIC_POLICIES:
+            raise ValueError(f"Bilinmeyen polimorfik yükleme politikası: {policy}")
+
+        entity = User
+        options = []
+        if policy == "joined":
+            entity = with_polymorphic(User, "*")
+        elif policy == "selectin":
+            options.append(selectin_polymorphic(User, USER_SUBCLASSES))
+
+        if spec["columns"] is not None:
+            options.append(load_only(*[getattr(entity, name) for name in spec["columns"]]))
+        options.extend(defer(getattr(entity, name)) for name in spec["deferred"])
+        return db.query(entity).options(*options), entity
 
-    def get_by_username(self, db: Session, username: str) -> Optional[User]:
-        return db.query(User).filter(User.username == username).first()
+    def get(self, db: Session, id: Any, profile: str = "detail", polymorphic: Any = ...) -> Optional[User]:
+        query, entity = self._query(db, profile, polymorphic)
+        return query.filter(entity.id == id).first()
+
+    def get_multi(self, db: Session, skip: int = 0, limit: int = 100, profile: str = "list",
+                  polymorphic: Any = ...) -> List[User]:
+        query, _ = self._query(db, profile, polymorphic)
+        return query.offset(skip).limit(limit).all()
+
+    def get_by_email(self, db: Session, email: str, profile: str = "list") -> Optional[User]:
+        query, entity = self._query(db, profile)
+        return query.filter(entity.email == email).first()
+
+    def get_by_username(self, db: Session, username: str, profile: str = "detail") -> Optional[User]:
+        query, entity = self._query(db, profile)
+        return query.filter(entity.username == username).first()
 
     def create(self, db: Session, obj_in: UserCreate) -> User:
         db_obj = User(
@@ -25,14 +110,52 @@ class UserRepository(BaseRepository[User, UserCreate, UserUpdate]):
         db.add(db_obj)
         db.commit()
         db.refresh(db_obj)
+        index_user(db_obj)
+        employee_stats.employee_created(db_obj.id, db_obj.is_active)
+        org_chart.invalidate()
         return db_obj
 
+    def deactivate(self, db: Session, user_id: int) -> bool:
+        """
+        Kullanıcıyı pasifleştirir: durum, token sürümü ve refresh oturumları
+        tek transaction'da değişir. Kullanıcı zaten pasifse False döner.
+        """
+        try:
+            changed = db.execute(
+                update(User)
+                .where(User.id == user_id, User.is_active.is_(True))
+                .values(is_active=False, token_version=User.token_version + 1)
+                .execution_options(synchronize_session=False)
+            ).rowcount == 1
+            if changed:
+                revoke_user_sessions(db, user_id)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        if changed:
+            token_versions.bump_local(user_id, REVOKED)
+            employee_stats.employee_deactivated(user_id)
+            org_chart.invalidate()
+        return changed
+
     def authenticate(self, db: Session, username: str, password: str) -> Optional[User]:
-        user = self.get_by_username(db, username)
+        user = self.get_by_username(db, username, profile="login")
         if not user:
+            dummy_verify_password(password)
             return None
-        if not verify_password(password, user.password_hash):
+        valid, new_hash = verify_password_and_update(password, user.password_hash)
+        if not valid:
             return None
+        if new_hash is not None:
+            # Hash eski maliyet/şema ile üretilmiş; şifre elimizdeyken yükselt
+            db.execute(
+                update(User)
+                .where(User.id == user.id, User.password_hash == user.password_hash)
+                .values(password_hash=new_hash)
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
         return user
 
 
@@ -0,0 +1,80 @@
+from typing import Any, Dict, List
+from sqlalchemy import case, delete, insert, select, update
+from sqlalchemy.orm import Session
+from models import DashboardWidget
+
+WIDGET_COLUMNS = (
+    DashboardWidget.id, DashboardWidget.widget_type, DashboardWidget.position,
+    DashboardWidget.is_visible, DashboardWidget.settings,
+)
+
+
+class WidgetRepository:
+    def get_layout(self, db: Session, user_id: int) -> List[Dict[str, Any]]:
+        stmt = (
+            select(*WIDGET_COLUMNS)
+            .where(DashboardWidget.user_id == user_id)
+            .order_by(DashboardWidget.position, DashboardWidget.id)
+        )
+        return [dict(row) for row in db.execute(stmt).mappings()]
+
+    def replace_layout(self, db: Session, user_id: int, items: List[Dict[str, Any]]) -> None:
+        """
+        Kullanıcının düzenini tek transaction'da verilen listeyle eşitler:
+        mevcut widget'lar tek executemany UPDATE, yeniler tek çok satırlı
+        INSERT, listede olmayanlar tek DELETE ile.
+        """
+        existing = {
+            row.widget_type: row.id
+            for row in db.execute(
+                select(DashboardWidget.id, DashboardWidget.widget_type)
+                .where(DashboardWidget.user_id == user_id)
+            )
+        }
+        updates, inserts = [], []
+        for item in items:
+            values = {
+                "position": item["position"],
+                "is_visible": item["is_visible"],
+                "settings": item.get("settings"),
+            }
+            widget_id = existing.pop(item["widget_type"], None)
+            if widget_id is not None:
+                updates.append({"id": widget_id, **values})
+            else:
+                inserts.append({"user_id": user_id, "widget_type": item["widget_type"], **values})
+
+        try:
+            if updates:
+                db.execute(update(DashboardWidget), updates)
+            if inserts:
+                db.execute(insert(DashboardWidget).values(inserts))
+            if existing:
+                db.execute(
+                    delete(DashboardWidget)
+                    .where(DashboardWidget.id.in_(list(existing.values())))
+                    .execution_options(synchronize_session=False)
+                )
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+
+    def reorder(self, db: Session, user_id: int, widget_types: List[str]) -> int:
+        """
+        Sürükle-bırak sırasını tek bir UPDATE ... SET position = CASE ile yazar.
+        """
+        if not widget_types:
+            return 0
+        positions = {widget_type: index for index, widget_type in enumerate(widget_types)}
+        result = db.execute(
+            update(DashboardWidget)
+            .where(DashboardWidget.user_id == user_id, DashboardWidget.widget_type.in_(positions))
+            .values(position=case(positions, value=DashboardWidget.widget_type))
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+        return result.rowcount
+
+
+widget_repo = WidgetRepository()
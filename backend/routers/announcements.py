@@ -0,0 +1,70 @@
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+from dependencies import get_db, get_current_active_principal, get_current_superuser, Principal
+from repositories.announcement_repo import announcement_repo
+from schemas import AnnouncementCreate, AnnouncementResponse, AnnouncementUpdate
+from services.announcement_feed import announcement_feed
+from services.search import index_announcement, search_index
+from services.audit import audit
+
+router = APIRouter(
+    prefix="/announcements",
+    tags=["announcements"]
+)
+
+@router.get("/", response_model=List[AnnouncementResponse])
+def read_announcements(
+    category: Optional[str] = None,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_active_principal)
+):
+    """
+    Aktif duyurular (önbellekten).
+    """
+    return announcement_feed.get(db, category=category)
+
+@router.post("/", response_model=AnnouncementResponse)
+def create_announcement(
+    announcement_in: AnnouncementCreate,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_superuser)
+):
+    announcement = announcement_repo.create(db, obj_in=announcement_in, created_by=current_user.id)
+    announcement_feed.invalidate()
+    index_announcement(announcement)
+    audit("announcement.created", user_id=current_user.id, details={"announcement_id": announcement.id})
+    return announcement
+
+@router.put("/{announcement_id}", response_model=AnnouncementResponse)
+def update_announcement(
+    announcement_id: int,
+    announcement_in: AnnouncementUpdate,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_superuser)
+):
+    announcement = announcement_repo.get(db, id=announcement_id)
+    if not announcement:
+        raise HTTPException(status_code=404, detail="Duyuru bulunamadı")
+
+    announcement = announcement_repo.update(db, db_obj=announcement, obj_in=announcement_in)
+    announcement_feed.invalidate()
+    index_announcement(announcement)
+    audit("announcement.updated", user_id=current_user.id, details={"announcement_id": announcement_id})
+    return announcement
+
+@router.delete("/{announcement_id}")
+def delete_announcement(
+    announcement_id: int,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_superuser)
+):
+    announcement = announcement_repo.get(db, id=announcement_id)
+    if not announcement:
+        raise HTTPException(status_code=404, detail="Duyuru bulunamadı")
+
+    announcement_repo.remove(db, id=announcement_id)
+    announcement_feed.invalidate()
+    search_index.remove("announcement", announcement_id)
+    audit("announcement.deleted", user_id=current_user.id, details={"announcement_id": announcement_id})
+    return {"success": True}
@@ -1,11 +1,13 @@
 from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.orm import Session
 from db import get_db
-from models import User
 from schemas import EmployeeAssetResponse, AssetCategoryResponse
 from repositories.asset_repo import asset_repo, category_repo
-from dependencies import get_current_user
+from repositories.read_models import asset_rows, list_version
+from core.responses import conditional_json, weak_etag
+from models import AssetCategory, EmployeeAsset
+from dependencies import get_current_principal, Principal
 
 router = APIRouter(
     prefix="/assets",
@@ -15,26 +17,30 @@ router = APIRouter(
 
 @router.get("/all", response_model=List[EmployeeAssetResponse])
 def read_assets(
+    request: Request,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     skip: int = 0,
     limit: int = 100,
 ) -> Any:
     """
     Tüm demirbaşları listele (List all assets).
     """
-    assets = asset_repo.get_all_with_details(db)
-    return assets
+    etag = weak_etag("assets", list_version(db, EmployeeAsset))
+    return conditional_json(request, etag, lambda: asset_rows(db))
 
 @router.get("/categories", response_model=List[AssetCategoryResponse])
 def read_categories(
+    request: Request,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     skip: int = 0,
     limit: int = 100,
 ) -> Any:
     """
     Tüm kategorileri listele (List all categories).
     """
-    categories = category_repo.get_all(db)
-    return categories
+    etag = weak_etag("asset_categories", list_version(db, AssetCategory))
+    return conditional_json(request, etag, lambda: [
+        AssetCategoryResponse.model_validate(category).model_dump() for category in category_repo.get_all(db)
+    ])
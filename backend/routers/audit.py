@@ -0,0 +1,47 @@
+from datetime import datetime, timedelta
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from core.config import settings
+from dependencies import get_db, get_current_superuser, Principal
+from repositories.audit_repo import audit_repo
+from schemas import AuditLogResponse
+from services.audit_archive import query_archive
+
+router = APIRouter(
+    prefix="/audit-logs",
+    tags=["audit"]
+)
+
+@router.get("/", response_model=List[AuditLogResponse])
+def read_audit_logs(
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    user_id: Optional[int] = None,
+    action: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_superuser)
+):
+    """
+    Denetim kayıtları, yeniden eskiye. Kayıtlar toplu yazıldığından son birkaç
+    saniyenin olayları henüz görünmeyebilir. Saklama süresinden eski aralıklar
+    arşiv dosyalarından okunur.
+    """
+    if since and until and until <= since:
+        raise HTTPException(status_code=400, detail="Bitiş zamanı başlangıçtan sonra olmalı")
+    rows = audit_repo.query(db, since=since, until=until, user_id=user_id, action=action, limit=limit)
+    if len(rows) >= limit:
+        return rows
+
+    # Arşiv yalnızca saklama sınırından (bir gün payla) eski kayıtları içerir
+    horizon = datetime.now() - timedelta(days=settings.AUDIT_RETENTION_DAYS - 1)
+    if since is not None and since >= horizon:
+        return rows
+    archive_until = min(until, horizon) if until else horizon
+    archived = query_archive(
+        settings.AUDIT_ARCHIVE_DIR, since=since, until=archive_until,
+        user_id=user_id, action=action, limit=limit - len(rows),
+    )
+    live_ids = {row.id for row in rows}
+    return rows + [row for row in archived if row["id"] not in live_ids]
@@ -1,22 +1,45 @@
 from datetime import timedelta
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.orm import Session
 from fastapi.security import OAuth2PasswordRequestForm
 from core.config import settings
 from core.security import create_access_token
-from dependencies import get_db
+from dependencies import get_db, get_current_superuser
+from core.hashing import password_hasher
 from repositories.user_repo import user_repo
-from schemas import Token, LoginResponse
+from schemas import Token, LoginResponse, RefreshTokenRequest
+from services.sessions import issue_refresh_token, rotate_refresh_token, revoke_refresh_token
+from services.rate_limit import login_limiter
+from services.audit import audit
 
 router = APIRouter(
     prefix="",
     tags=["authentication"]
 )
 
+def _access_token_for(user) -> str:
+    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    return create_access_token(
+        subject=user.username, expires_delta=access_token_expires,
+        claims={"uid": user.id, "role": user.type, "ver": user.token_version}
+    )
+
 @router.post("/login", response_model=LoginResponse)
-def login_access_token(db: Session = Depends(get_db), form_data: OAuth2PasswordRequestForm = Depends()):
+def login_access_token(request: Request, db: Session = Depends(get_db), form_data: OAuth2PasswordRequestForm = Depends()):
+    # Sınır aşıldıysa şifre doğrulamasına (bcrypt) hiç gidilmez
+    client_ip = request.client.host if request.client else None
+    retry_after = login_limiter.check(client_ip, form_data.username)
+    if retry_after is not None:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Çok fazla giriş denemesi. Lütfen daha sonra tekrar deneyin.",
+            headers={"Retry-After": str(int(retry_after) + 1)},
+        )
+
     user = user_repo.authenticate(db, username=form_data.username, password=form_data.password)
     if not user:
+        login_limiter.register_failure(client_ip, form_data.username)
+        audit("auth.login_failed", details={"username": form_data.username}, ip_address=client_ip)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Hatalı kullanıcı adı veya şifre",
@@ -24,16 +47,50 @@ def login_access_token(db: Session = Depends(get_db), form_data: OAuth2PasswordR
         )
     if not user.is_active:
         raise HTTPException(status_code=400, detail="Kullanıcı aktif değil")
-        
-    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    access_token = create_access_token(
-        subject=user.username, expires_delta=access_token_expires
-    )
-    
+    login_limiter.register_success(form_data.username)
+    audit("auth.login", user_id=user.id, ip_address=client_ip)
+
     return {
         "success": True,
         "message": "Giriş başarılı",
-        "token": access_token,
+        "token": _access_token_for(user),
+        "refresh_token": issue_refresh_token(db, user.id),
+        "user_id": user.id,
+        "user_role": user.type
+    }
+
+@router.post("/refresh", response_model=LoginResponse)
+def refresh_access_token(refresh_in: RefreshTokenRequest, db: Session = Depends(get_db)):
+    """
+    Refresh token ile şifre doğrulaması olmadan yeni access token alır.
+    Refresh token her kullanımda yenilenir (rotation).
+    """
+    rotated = rotate_refresh_token(db, refresh_in.refresh_token)
+    user = user_repo.get(db, id=rotated[0], profile="auth") if rotated else None
+    if not user or not user.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Oturum süresi doldu. Lütfen tekrar giriş yapın.",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    return {
+        "success": True,
+        "message": "Oturum yenilendi",
+        "token": _access_token_for(user),
+        "refresh_token": rotated[1],
         "user_id": user.id,
         "user_role": user.type
     }
+
+@router.post("/logout")
+def logout(refresh_in: RefreshTokenRequest, db: Session = Depends(get_db)):
+    revoke_refresh_token(db, refresh_in.refresh_token)
+    return {"success": True, "message": "Çıkış yapıldı"}
+
+@router.get("/security/password-hashing")
+def password_hashing_metrics(current_user = Depends(get_current_superuser)):
+    """
+    Şifre hash politikası (şema, maliyet) ve son hashleme/doğrulama süreleri.
+    """
+    return password_hasher.describe()
@@ -0,0 +1,26 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+from core.config import settings
+from core.responses import FastJSONResponse
+from dependencies import get_db, get_current_active_principal, Principal
+from schemas import BatchRequest, BatchResponse
+from services.batch import run_batch
+
+router = APIRouter(
+    prefix="/batch",
+    tags=["batch"]
+)
+
+@router.post("", response_model=BatchResponse)
+def batch(
+    batch_in: BatchRequest,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_active_principal)
+):
+    """
+    Birden fazla okuma isteğini tek kimlik doğrulama ve tek DB oturumuyla çalıştırır.
+    Sonuçlar istek sırasıyla, her biri kendi durum koduyla döner.
+    """
+    if len(batch_in.requests) > settings.BATCH_MAX_REQUESTS:
+        raise HTTPException(status_code=400, detail=f"En fazla {settings.BATCH_MAX_REQUESTS} alt istek gönderilebilir")
+    return FastJSONResponse({"results": run_batch(db, current_user, batch_in.requests)})
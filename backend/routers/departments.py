@@ -0,0 +1,63 @@
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from dependencies import get_db, get_current_active_principal, Principal
+from schemas import DepartmentHeadcount, OrgNode, OrgReport
+from services.org_chart import org_chart
+
+router = APIRouter(
+    prefix="",
+    tags=["departments"]
+)
+
+_MANAGER_TYPES = ("manager", "admin")
+
+
+@router.get("/departments", response_model=List[str])
+def read_departments(
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_active_principal)
+):
+    """
+    Aktif kullanıcıların bulunduğu departman adları.
+    """
+    return sorted(org_chart.get(db).headcount)
+
+
+@router.get("/departments/headcount", response_model=List[DepartmentHeadcount])
+def read_department_headcount(
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_active_principal)
+):
+    headcount = org_chart.get(db).headcount
+    return [{"name": name, "headcount": headcount[name]} for name in sorted(headcount)]
+
+
+@router.get("/org/tree", response_model=List[OrgNode])
+def read_org_tree(
+    root_id: Optional[int] = None,
+    depth: Optional[int] = Query(None, ge=1, le=50),
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_active_principal)
+):
+    if current_user.type not in _MANAGER_TYPES and root_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Kullanıcının yeterli yetkisi yok")
+    return org_chart.get(db).tree(root_id=root_id, max_depth=depth)
+
+
+@router.get("/org/managers/{manager_id}/reports", response_model=List[OrgReport])
+def read_reports(
+    manager_id: int,
+    direct_only: bool = False,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_active_principal)
+):
+    """
+    Yöneticiye doğrudan ve (direct_only=false ise) dolaylı bağlı herkes.
+    """
+    if current_user.type not in _MANAGER_TYPES and manager_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Kullanıcının yeterli yetkisi yok")
+    snapshot = org_chart.get(db)
+    if manager_id not in snapshot.people:
+        raise HTTPException(status_code=404, detail="Kullanıcı bulunamadı")
+    return snapshot.reports_under(manager_id, direct_only=direct_only)
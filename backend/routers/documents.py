@@ -0,0 +1,180 @@
+import os
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import FileResponse, Response
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+from core.config import settings
+from dependencies import get_db, get_current_active_principal, get_current_superuser, Principal
+from repositories.asset_repo import asset_repo
+from repositories.document_repo import document_repo
+from schemas import DocumentResponse, DocumentReview
+from services.audit import audit
+from services.documents import DocumentTooLarge, StagedFile, document_store, thumbnail_worker
+
+router = APIRouter(
+    prefix="/documents",
+    tags=["documents"]
+)
+
+# İçerik adresli olduğundan bir dokümanın içeriği hiç değişmez
+_IMMUTABLE_CACHE = "private, max-age=31536000, immutable"
+
+
+def _readable_document(db: Session, document_id: int, current_user: Principal):
+    document = document_repo.get(db, document_id)
+    if not document:
+        raise HTTPException(status_code=404, detail="Doküman bulunamadı")
+    if document.uploaded_by != current_user.id and current_user.type not in ("manager", "admin"):
+        raise HTTPException(status_code=403, detail="Bu dokümana erişim yetkiniz yok")
+    return document
+
+
+def _file_response(file_path: str, media_type: Optional[str], filename: Optional[str] = None):
+    """
+    DOCUMENT_SENDFILE_HEADER ayarlıysa gövdeyi ön sunucu gönderir (sendfile);
+    aksi halde FileResponse (Range destekli) kullanılır.
+    """
+    headers = {"Cache-Control": _IMMUTABLE_CACHE}
+    if settings.DOCUMENT_SENDFILE_HEADER:
+        headers[settings.DOCUMENT_SENDFILE_HEADER] = f"{settings.DOCUMENT_SENDFILE_PREFIX}/{file_path}"
+        return Response(media_type=media_type, headers=headers)
+    path = document_store.absolute(file_path)
+    if not os.path.exists(path):
+        raise HTTPException(status_code=404, detail="Doküman dosyası bulunamadı")
+    return FileResponse(path, media_type=media_type, filename=filename, headers=headers)
+
+
+@router.post("/", response_model=DocumentResponse, status_code=status.HTTP_201_CREATED)
+async def upload_document(
+    request: Request,
+    title: str = Query(..., min_length=1, max_length=200),
+    asset_id: Optional[int] = None,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_active_principal)
+):
+    """
+    Ham istek gövdesini (multipart değil) dosya olarak yükler; gövde diske
+    parça parça akıtılır. Content-Type dokümanın türü olarak saklanır.
+    asset_id verilirse demirbaşın belge bağlantısı bu dokümana ayarlanır
+    (yalnızca demirbaşın zimmetli olduğu çalışan veya yönetici).
+    Yalnızca akış async çalışır; veritabanı işleri thread havuzunda yapılır.
+    """
+    declared = request.headers.get("content-length")
+    if declared and declared.isdigit() and int(declared) > settings.DOCUMENT_MAX_BYTES:
+        raise HTTPException(status_code=413, detail="Dosya boyutu sınırı aşıldı")
+
+    asset = None
+    if asset_id is not None:
+        asset = await run_in_threadpool(asset_repo.get, db, id=asset_id)
+        if not asset:
+            raise HTTPException(status_code=404, detail="Demirbaş bulunamadı")
+        if asset.employee_id != current_user.id and current_user.type not in ("manager", "admin"):
+            raise HTTPException(status_code=403, detail="Bu demirbaş için yetkiniz yok")
+
+    try:
+        staged = await document_store.stage_stream(request.stream())
+    except DocumentTooLarge:
+        raise HTTPException(status_code=413, detail="Dosya boyutu sınırı aşıldı")
+    if staged.size_bytes == 0:
+        document_store.discard(staged)
+        raise HTTPException(status_code=400, detail="Dosya boş")
+
+    content_type = request.headers.get("content-type") or "application/octet-stream"
+
+    def store(staged: StagedFile):
+        # Aynı içeriğin silinmesiyle yarışmaması için kayıt da kilit altında yapılır
+        with document_store.lock(staged.content_hash):
+            stored = document_store.store(staged)
+            document = document_repo.create(
+                db, title=title, stored=stored, content_type=content_type,
+                uploaded_by=current_user.id, asset=asset,
+            )
+        return stored, document
+
+    try:
+        stored, document = await run_in_threadpool(store, staged)
+    finally:
+        document_store.discard(staged)
+    audit("document.uploaded", user_id=current_user.id,
+          details={"document_id": document.id, "asset_id": asset_id, "deduplicated": not stored.created})
+    return document
+
+
+@router.get("/{document_id}", response_model=DocumentResponse)
+def read_document(
+    document_id: int,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_active_principal)
+):
+    return _readable_document(db, document_id, current_user)
+
+
+@router.get("/{document_id}/content")
+def download_document(
+    document_id: int,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_active_principal)
+):
+    """
+    Doküman içeriği; Range istekleri (kısmi indirme, devam ettirme) desteklenir.
+    """
+    document = _readable_document(db, document_id, current_user)
+    return _file_response(document.file_path, document.content_type, filename=document.title)
+
+
+@router.get("/{document_id}/thumbnail")
+def read_thumbnail(
+    document_id: int,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_active_principal)
+):
+    """
+    Önizleme ilk istekte arka planda üretilir; hazır olana kadar 202 döner.
+    """
+    document = _readable_document(db, document_id, current_user)
+    state = thumbnail_worker.request(document.content_hash, document.file_path, document.content_type)
+    if state == thumbnail_worker.UNSUPPORTED:
+        raise HTTPException(status_code=404, detail="Bu doküman için önizleme yok")
+    if state == thumbnail_worker.PENDING:
+        return Response(status_code=status.HTTP_202_ACCEPTED, headers={"Retry-After": "1"})
+    thumb_path = os.path.relpath(thumbnail_worker.thumbnail_path(document.content_hash), document_store.root)
+    return _file_response(thumb_path, "image/jpeg")
+
+
+@router.put("/{document_id}/review", response_model=DocumentResponse)
+def review_document(
+    document_id: int,
+    review_in: DocumentReview,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_superuser)
+):
+    document = document_repo.get(db, document_id)
+    if not document:
+        raise HTTPException(status_code=404, detail="Doküman bulunamadı")
+    document = document_repo.review(db, document, review_in.approved, review_in.rejection_reason)
+    audit("document.reviewed", user_id=current_user.id,
+          details={"document_id": document_id, "approved": review_in.approved})
+    return document
+
+
+@router.delete("/{document_id}")
+def delete_document(
+    document_id: int,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_active_principal)
+):
+    document = _readable_document(db, document_id, current_user)
+    content_hash, file_path = document.content_hash, document.file_path
+    if not content_hash:
+        document_repo.remove(db, document)
+    else:
+        # Sayım ile dosya silme arasında aynı içerik yeniden yüklenemesin
+        with document_store.lock(content_hash):
+            document_repo.remove(db, document)
+            # Aynı içeriği paylaşan başka doküman yoksa dosya da silinir
+            if document_repo.count_by_hash(db, content_hash) == 0:
+                document_store.delete(file_path)
+                document_store.delete(os.path.relpath(thumbnail_worker.thumbnail_path(content_hash), document_store.root))
+    audit("document.deleted", user_id=current_user.id, details={"document_id": document_id})
+    return {"success": True}
@@ -0,0 +1,20 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+from dependencies import get_db, get_current_superuser, Principal
+from schemas import EmployeeStats
+from services.employee_stats import employee_stats
+
+router = APIRouter(
+    prefix="/employees",
+    tags=["employees"]
+)
+
+@router.get("/stats", response_model=EmployeeStats)
+def read_employee_stats(
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_superuser)
+):
+    """
+    Toplam/izinli/bekleyen doküman/yeni başlayan sayıları (bellek içi sayaçlardan).
+    """
+    return employee_stats.snapshot(db)
@@ -1,10 +1,21 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException
+from contextlib import nullcontext
+from datetime import date, datetime, time, timedelta
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.orm import Session
-from dependencies import get_db, get_current_active_user, get_current_superuser
-from repositories.leave_repo import leave_repo
-from schemas import LeaveRequestCreate, LeaveRequestResponse, LeaveRequestUpdate
-from models import User
+from core.config import settings
+from core.db_routing import use_primary
+from dependencies import get_db, get_current_active_principal, get_current_superuser, Principal
+from repositories.leave_repo import leave_repo, LeaveConflictError
+from repositories.read_models import leave_rows, list_version
+from core.responses import conditional_json, weak_etag
+from models import LeaveRequest
+from schemas import (
+    LeaveRequestCreate, LeaveRequestResponse, LeaveRequestUpdate, AbsenceCalendarResponse,
+    LeaveBulkApproveRequest, LeaveBulkApproveResponse
+)
+from services.absence_calendar import build_calendar, calendar_cache, is_recent_window
+from services.audit import audit
 
 router = APIRouter(
     prefix="/leave-requests",
@@ -13,22 +24,64 @@ router = APIRouter(
 
 @router.get("/", response_model=List[LeaveRequestResponse])
 def read_leaves(
+    request: Request,
     skip: int = 0, 
     limit: int = 100, 
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    current_user: Principal = Depends(get_current_active_principal)
 ):
     if current_user.type == 'employee':
-        return leave_repo.get_by_user(db, user_id=current_user.id, skip=skip, limit=limit)
+        user_id = current_user.id
+        version = list_version(db, LeaveRequest, LeaveRequest.user_id == user_id)
     else:
         # Yönetici Görüntüleme
-        return leave_repo.get_multi(db, skip=skip, limit=limit)
+        user_id = None
+        version = list_version(db, LeaveRequest)
+    etag = weak_etag("leaves", user_id, skip, limit, version)
+    return conditional_json(request, etag, lambda: leave_rows(db, user_id=user_id, skip=skip, limit=limit))
+
+@router.get("/calendar", response_model=AbsenceCalendarResponse)
+def read_absence_calendar(
+    from_date: date = Query(..., alias="from"),
+    to_date: date = Query(..., alias="to"),
+    department: Optional[str] = None,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_superuser)
+):
+    """
+    Pencere içindeki onaylı izinler için günlük izinli sayısı ve kişi bazlı aralıklar.
+    """
+    if to_date < from_date:
+        raise HTTPException(status_code=400, detail="Bitiş tarihi başlangıçtan önce olamaz")
+    if (to_date - from_date).days + 1 > settings.ABSENCE_CALENDAR_MAX_DAYS:
+        raise HTTPException(status_code=400, detail="Takvim penceresi çok geniş")
+
+    cache_key = (from_date, to_date, department)
+    cached = calendar_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    # Önbelleğe girecek pencere birincilden okunur; diğerleri replikadan okunabilir
+    cacheable = is_recent_window(to_date)
+    with use_primary() if cacheable else nullcontext():
+        rows = leave_repo.get_overlapping(
+            db,
+            start=datetime.combine(from_date, time.min),
+            end=datetime.combine(to_date + timedelta(days=1), time.min),
+            department=department,
+        )
+    calendar = build_calendar(rows, from_date, to_date)
+    calendar["department"] = department
+
+    if cacheable:
+        calendar_cache.set(cache_key, calendar)
+    return calendar
 
 @router.post("/", response_model=LeaveRequestResponse)
 def create_leave(
     leave_in: LeaveRequestCreate, 
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    current_user: Principal = Depends(get_current_active_principal)
 ):
     # Veri Hazırlama
     leave_data = leave_in.model_dump()
@@ -40,6 +93,7 @@ def create_leave(
     db.add(db_obj)
     db.commit()
     db.refresh(db_obj)
+    calendar_cache.invalidate()
     return db_obj
 
 @router.put("/{leave_id}", response_model=LeaveRequestResponse)
@@ -47,11 +101,41 @@ def update_leave_status(
     leave_id: int,
     leave_in: LeaveRequestUpdate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_superuser)
+    current_user: Principal = Depends(get_current_superuser)
 ):
+    if leave_in.status not in ('pending', 'approved', 'rejected'):
+        raise HTTPException(status_code=400, detail="Geçersiz izin durumu")
+
     leave = leave_repo.get(db, id=leave_id)
     if not leave:
         raise HTTPException(status_code=404, detail="İzin talebi bulunamadı")
-        
-    leave = leave_repo.update(db, db_obj=leave, obj_in=leave_in)
+
+    # Durum değişikliği ve bakiye düşümü/iadesi tek transaction'da, koşullu UPDATE ile
+    try:
+        if leave_in.status == 'pending':
+            leave = leave_repo.reopen(db, leave)
+        else:
+            leave = leave_repo.decide(
+                db, leave, status=leave_in.status, approver_id=current_user.id,
+                rejection_reason=leave_in.rejection_reason,
+            )
+    except LeaveConflictError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    calendar_cache.invalidate()
+    audit(f"leave.{leave_in.status}", user_id=current_user.id, details={"leave_id": leave_id})
     return leave
+
+@router.post("/bulk-approve", response_model=LeaveBulkApproveResponse)
+def bulk_approve_leaves(
+    bulk_in: LeaveBulkApproveRequest,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_superuser)
+):
+    approved, failed = leave_repo.bulk_approve(db, leave_ids=bulk_in.ids, approver_id=current_user.id)
+    if approved:
+        calendar_cache.invalidate()
+        audit("leave.approved", user_id=current_user.id, details={"leave_ids": approved, "bulk": True})
+    return {
+        "approved": approved,
+        "failed": [{"id": leave_id, "reason": reason} for leave_id, reason in failed.items()],
+    }
@@ -0,0 +1,58 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from core.config import settings
+from dependencies import get_db, get_current_active_principal, Principal
+from repositories.reminder_repo import reminder_repo
+from schemas import ReminderCreate, ReminderListResponse, ReminderResponse
+from services.reminders import reminder_index
+from services.audit import audit
+
+router = APIRouter(
+    prefix="/reminders",
+    tags=["reminders"]
+)
+
+def _is_manager(principal: Principal) -> bool:
+    return principal.type in ("manager", "admin")
+
+@router.get("/", response_model=ReminderListResponse)
+def read_reminders(
+    days: int = Query(30, ge=0, le=settings.REMINDER_INDEX_DAYS),
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_active_principal)
+):
+    """
+    Yaklaşan hatırlatıcılar (bellek içi gün kovalarından).
+    """
+    reminder_index.ensure_loaded(db)
+    return {"reminders": reminder_index.upcoming(current_user.id, days)}
+
+@router.post("/", response_model=ReminderResponse)
+def create_reminder(
+    reminder_in: ReminderCreate,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_active_principal)
+):
+    if reminder_in.for_all and not _is_manager(current_user):
+        raise HTTPException(status_code=400, detail="Yetersiz yetki")
+
+    reminder = reminder_repo.create(db, obj_in=reminder_in, user_id=None if reminder_in.for_all else current_user.id)
+    audit("reminder.created", user_id=current_user.id, details={"reminder_id": reminder.id})
+    return reminder
+
+@router.delete("/{reminder_id}")
+def delete_reminder(
+    reminder_id: int,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_active_principal)
+):
+    reminder = reminder_repo.get(db, id=reminder_id)
+    if not reminder:
+        raise HTTPException(status_code=404, detail="Hatırlatıcı bulunamadı")
+    owner = reminder.user_id
+    if (owner is None and not _is_manager(current_user)) or (owner is not None and owner != current_user.id):
+        raise HTTPException(status_code=400, detail="Yetersiz yetki")
+
+    reminder_repo.remove(db, id=reminder_id)
+    audit("reminder.deleted", user_id=current_user.id, details={"reminder_id": reminder_id})
+    return {"success": True}
@@ -0,0 +1,33 @@
+import time
+from typing import Optional
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from dependencies import get_db, get_current_active_principal, Principal
+from schemas import SearchResponse
+from services.search import search_index
+
+router = APIRouter(
+    prefix="/search",
+    tags=["search"]
+)
+
+@router.get("", response_model=SearchResponse)
+def search(
+    q: str = Query(..., min_length=1, max_length=100),
+    types: Optional[str] = Query(None, description="Virgülle ayrılmış: employee,asset,announcement"),
+    limit: int = Query(10, ge=1, le=50),
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_active_principal)
+):
+    """
+    Çalışan, demirbaş ve duyurularda önek/parça araması (typeahead).
+    """
+    search_index.ensure_built(db)
+    started = time.perf_counter()
+    kinds = [t.strip() for t in types.split(",") if t.strip()] if types else None
+    results = search_index.search(q, kinds=kinds, limit=limit)
+    return {
+        "query": q,
+        "results": results,
+        "took_ms": round((time.perf_counter() - started) * 1000, 3),
+    }
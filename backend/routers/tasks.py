@@ -1,10 +1,12 @@
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.orm import Session
-from dependencies import get_db, get_current_active_user
+from dependencies import get_db, get_current_active_principal, Principal
 from repositories.task_repo import task_repo
+from repositories.read_models import task_rows, list_version
+from core.responses import conditional_json, weak_etag
+from models import Task
 from schemas import TaskCreate, TaskResponse, TaskUpdate
-from models import User
 
 router = APIRouter(
     prefix="/tasks",
@@ -13,19 +15,20 @@ router = APIRouter(
 
 @router.get("/", response_model=List[TaskResponse])
 def read_tasks(
+    request: Request,
     skip: int = 0, 
     limit: int = 100, 
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    current_user: Principal = Depends(get_current_active_principal)
 ):
-    tasks = task_repo.get_multi_by_owner(db, user_id=current_user.id, skip=skip, limit=limit)
-    return tasks
+    etag = weak_etag("tasks", current_user.id, skip, limit, list_version(db, Task, Task.user_id == current_user.id))
+    return conditional_json(request, etag, lambda: task_rows(db, user_id=current_user.id, skip=skip, limit=limit))
 
 @router.post("/", response_model=TaskResponse)
 def create_task(
     task_in: TaskCreate, 
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    current_user: Principal = Depends(get_current_active_principal)
 ):
     # Yetki Kontrolü
     if task_in.user_id != current_user.id and current_user.type != 'manager' and current_user.type != 'admin':
@@ -38,7 +41,7 @@ def update_task(
     task_id: int,
     task_in: TaskUpdate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    current_user: Principal = Depends(get_current_active_principal)
 ):
     task = task_repo.get(db, id=task_id)
     if not task:
@@ -1,9 +1,13 @@
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.orm import Session
-from dependencies import get_db, get_current_active_user, get_current_superuser
+from dependencies import get_db, get_current_active_user, get_current_active_principal, get_current_superuser, Principal
 from repositories.user_repo import user_repo
 from repositories.employee_repo import employee_repo
+from repositories.read_models import user_rows, list_version
+from core.responses import conditional_json, weak_etag
+from services.token_versions import revoke_user_tokens
+from services.audit import audit
 from schemas import UserCreate, UserResponse, UserUpdate, EmployeeCreate, EmployeeResponse
 from models import User
 
@@ -14,39 +18,75 @@ router = APIRouter(
 
 @router.get("/", response_model=List[UserResponse])
 def read_users(
+    request: Request,
     skip: int = 0, 
     limit: int = 100, 
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    current_user: Principal = Depends(get_current_active_principal)
 ):
-    users = user_repo.get_multi(db, skip=skip, limit=limit)
-    return users
+    etag = weak_etag("users", skip, limit, list_version(db, User))
+    return conditional_json(request, etag, lambda: user_rows(db, skip=skip, limit=limit))
 
 @router.post("/", response_model=UserResponse)
 def create_user(
     user_in: UserCreate, 
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_superuser)
+    current_user: Principal = Depends(get_current_superuser)
 ):
     user = user_repo.get_by_email(db, email=user_in.email)
     if user:
         raise HTTPException(status_code=400, detail="E-posta adresi zaten kayıtlı")
     user = user_repo.create(db, obj_in=user_in)
+    audit("user.created", user_id=current_user.id, details={"target_id": user.id, "type": user.type})
     return user
 
 @router.post("/employee", response_model=EmployeeResponse)
 def create_employee_endpoint(
     employee_in: EmployeeCreate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_superuser)
+    current_user: Principal = Depends(get_current_superuser)
 ):
     user = user_repo.get_by_email(db, email=employee_in.email)
     if user:
         raise HTTPException(status_code=400, detail="E-posta adresi zaten kayıtlı")
     
     employee = employee_repo.create_employee(db, obj_in=employee_in)
+    audit("user.created", user_id=current_user.id, details={"target_id": employee.id, "type": employee.type})
     return employee
 
+@router.post("/users/{user_id}/revoke-tokens")
+def revoke_tokens(
+    user_id: int,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_superuser)
+):
+    """
+    Kullanıcının tüm access token'larını geçersiz kılar.
+    """
+    if not user_repo.get(db, id=user_id, profile="list"):
+        raise HTTPException(status_code=404, detail="Kullanıcı bulunamadı")
+    version = revoke_user_tokens(db, user_id)
+    audit("auth.tokens_revoked", user_id=current_user.id, details={"target_id": user_id})
+    return {"success": True, "token_version": version}
+
+@router.post("/users/{user_id}/deactivate")
+def deactivate_user(
+    user_id: int,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_superuser)
+):
+    """
+    Kullanıcıyı pasifleştirir; tüm token'ları ve oturumları geçersiz olur.
+    """
+    if not user_repo.get(db, id=user_id, profile="list"):
+        raise HTTPException(status_code=404, detail="Kullanıcı bulunamadı")
+    if user_id == current_user.id:
+        raise HTTPException(status_code=400, detail="Kendi hesabınızı pasifleştiremezsiniz")
+    if not user_repo.deactivate(db, user_id):
+        raise HTTPException(status_code=409, detail="Kullanıcı zaten pasif")
+    audit("user.deactivated", user_id=current_user.id, details={"target_id": user_id})
+    return {"success": True}
+
 @router.get("/me", response_model=UserResponse)
 def read_user_me(
     current_user: User = Depends(get_current_active_user)
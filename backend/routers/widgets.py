@@ -0,0 +1,90 @@
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+from core.responses import FastJSONResponse
+from dependencies import get_db, get_current_active_principal, Principal
+from repositories.widget_repo import widget_repo
+from schemas import WidgetLayoutItem, WidgetLayoutUpdate, WidgetOrderUpdate
+from services.widgets import camel_case, compose, default_layout
+
+router = APIRouter(
+    prefix="/widgets",
+    tags=["widgets"]
+)
+
+
+def _target_user(user_id: Optional[int], current_user: Principal) -> int:
+    if user_id is None or user_id == current_user.id:
+        return current_user.id
+    if current_user.type not in ("manager", "admin"):
+        raise HTTPException(status_code=403, detail="Kullanıcının yeterli yetkisi yok")
+    return user_id
+
+
+def _response(layout):
+    return FastJSONResponse(camel_case(layout))
+
+
+@router.get("", response_model=List[WidgetLayoutItem])
+def read_widgets(
+    user_id: Optional[int] = None,
+    include_data: bool = True,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_active_principal)
+):
+    """
+    Kullanıcının widget düzeni ve (include_data ise) her görünür widget'ın
+    ilk verisi tek yanıtta.
+    """
+    target = _target_user(user_id, current_user)
+    layout = widget_repo.get_layout(db, target) or default_layout()
+    if include_data and target == current_user.id:
+        layout = compose(db, current_user, layout)
+    return _response(layout)
+
+
+@router.put("", response_model=List[WidgetLayoutItem])
+def replace_widgets(
+    widgets_in: List[WidgetLayoutUpdate],
+    user_id: Optional[int] = None,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_active_principal)
+):
+    """
+    Düzenin tamamını kaydeder (listede olmayan widget'lar kaldırılır).
+    """
+    target = _target_user(user_id, current_user)
+    types = [widget.widgetType for widget in widgets_in]
+    if len(types) != len(set(types)):
+        raise HTTPException(status_code=400, detail="Aynı widget birden fazla kez gönderildi")
+    widget_repo.replace_layout(db, target, [
+        {"widget_type": w.widgetType, "position": w.position, "is_visible": w.isVisible, "settings": w.settings}
+        for w in widgets_in
+    ])
+    return _response(widget_repo.get_layout(db, target))
+
+
+@router.patch("/order")
+def reorder_widgets(
+    order_in: WidgetOrderUpdate,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_active_principal)
+):
+    """
+    Sürükle-bırak sonrası yeni sıra; tek UPDATE ile yazılır. Henüz kayıtlı
+    düzeni olmayan (varsayılanı gören) kullanıcının varsayılan düzeni yeni
+    sırayla kaydedilir.
+    """
+    updated = widget_repo.reorder(db, current_user.id, order_in.widgetTypes)
+    if updated == 0 and not widget_repo.get_layout(db, current_user.id):
+        order = {widget_type: index for index, widget_type in enumerate(order_in.widgetTypes)}
+        layout = default_layout()
+        # Listede olmayan varsayılan widget'lar mevcut sıralarıyla sona eklenir
+        layout.sort(key=lambda item: order.get(item["widget_type"], len(order) + item["position"]))
+        for position, item in enumerate(layout):
+            item["position"] = position
+        widget_repo.replace_layout(db, current_user.id, layout)
+        updated = len([item for item in layout if item["widget_type"] in order])
+    if updated == 0:
+        raise HTTPException(status_code=422, detail="Sıralanacak widget bulunamadı")
+    return {"success": True, "updated": updated}
@@ -1,6 +1,16 @@
-from pydantic import BaseModel, ConfigDict, Field, computed_field
-from typing import List, Optional
-from datetime import datetime
+import pydantic
+from pydantic import ConfigDict, Field, computed_field
+from typing import Any, Dict, List, Optional
+from datetime import date, datetime
+
+
+class BaseModel(pydantic.BaseModel):
+    """
+    Şemalar ilk kullanımda derlenir (defer_build); tembel yüklenen
+    yönlendiricilerin şemaları worker açılışında derlenmez. Kalanlar
+    açılıştan sonra core.startup.warm_up ile arka planda derlenir.
+    """
+    model_config = ConfigDict(defer_build=True)
 
 # ==================== ORTAK ====================
 
@@ -20,6 +30,11 @@ class LoginResponse(BaseModel):
     token: str
     user_id: int
     user_role: str
+    refresh_token: Optional[str] = None
+
+
+class RefreshTokenRequest(BaseModel):
+    refresh_token: str
 
 
 # ==================== KULLANICILAR ====================
@@ -144,6 +159,47 @@ class LeaveRequestResponse(LeaveRequestBase):
 
     model_config = ConfigDict(from_attributes=True)
 
+
+class LeaveBulkApproveRequest(BaseModel):
+    ids: List[int]
+
+
+class LeaveBulkApproveFailure(BaseModel):
+    id: int
+    reason: str
+
+
+class LeaveBulkApproveResponse(BaseModel):
+    approved: List[int]
+    failed: List[LeaveBulkApproveFailure]
+
+
+class AbsenceSpan(BaseModel):
+    leave_id: int
+    leave_type: str
+    start_date: date
+    end_date: date
+
+
+class AbsencePerson(BaseModel):
+    user_id: int
+    full_name: str
+    department: Optional[str] = None
+    spans: List[AbsenceSpan]
+
+
+class AbsenceDay(BaseModel):
+    date: date
+    count: int
+
+
+class AbsenceCalendarResponse(BaseModel):
+    from_date: date
+    to_date: date
+    department: Optional[str] = None
+    days: List[AbsenceDay]
+    people: List[AbsencePerson]
+
 # ==================== VARLIKLAR ====================
 
 
@@ -213,7 +269,15 @@ class AnnouncementBase(BaseModel):
 
 
 class AnnouncementCreate(AnnouncementBase):
-    pass
+    announcement_date: Optional[datetime] = None
+
+
+class AnnouncementUpdate(BaseModel):
+    title: Optional[str] = None
+    content: Optional[str] = None
+    category: Optional[str] = None
+    announcement_date: Optional[datetime] = None
+    is_active: Optional[bool] = None
 
 
 class AnnouncementResponse(AnnouncementBase):
@@ -225,6 +289,160 @@ class AnnouncementResponse(AnnouncementBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+# ==================== ARAMA ====================
+
+
+class SearchHit(BaseModel):
+    type: str # employee, asset, announcement
+    id: int
+    title: str
+    subtitle: Optional[str] = None
+
+
+class SearchResponse(BaseModel):
+    query: str
+    results: List[SearchHit]
+    took_ms: float
+
+
+# ==================== HATIRLATICILAR ====================
+
+
+class ReminderCreate(BaseModel):
+    title: str = Field(..., min_length=1, max_length=200)
+    date: datetime
+    type: str = Field("other", pattern="^(probation|birthday|tax|other)$")
+    priority: str = Field("medium", pattern="^(high|medium|low)$")
+    # Yalnızca yöneticiler: tüm yöneticilere görünen sistem hatırlatıcısı
+    for_all: bool = False
+
+
+class ReminderResponse(BaseModel):
+    id: int
+    title: str
+    date: datetime
+    type: str
+    priority: str
+    user_id: Optional[int] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ReminderListResponse(BaseModel):
+    reminders: List[ReminderResponse]
+
+
+# ==================== TOPLU İSTEK ====================
+
+
+class BatchSubRequest(BaseModel):
+    resource: str = Field(..., max_length=50)
+    # Yanıtta sonucu eşleştirmek için; boşsa kaynak adı kullanılır
+    id: Optional[str] = Field(None, max_length=50)
+    params: Optional[Dict[str, Any]] = None
+
+
+class BatchRequest(BaseModel):
+    requests: List[BatchSubRequest] = Field(..., min_length=1)
+
+
+class BatchResult(BaseModel):
+    id: str
+    status: int
+    data: Optional[Any] = None
+    detail: Optional[Any] = None
+
+
+class BatchResponse(BaseModel):
+    results: List[BatchResult]
+
+
+# ==================== WIDGET DÜZENİ ====================
+
+
+class WidgetLayoutItem(BaseModel):
+    id: Optional[int] = None
+    widgetType: str
+    position: int
+    isVisible: bool = True
+    settings: Optional[dict] = None
+    data: Optional[Any] = None
+
+
+class WidgetLayoutUpdate(BaseModel):
+    widgetType: str = Field(..., max_length=50)
+    position: int
+    isVisible: bool = True
+    settings: Optional[dict] = None
+
+
+class WidgetOrderUpdate(BaseModel):
+    widgetTypes: List[str]
+
+
+# ==================== DEPARTMANLAR / ORGANİZASYON ====================
+
+
+class DepartmentHeadcount(BaseModel):
+    name: str
+    headcount: int
+
+
+class OrgNode(BaseModel):
+    id: int
+    full_name: str
+    type: Optional[str] = None
+    department: Optional[str] = None
+    is_active: bool = True
+    children: List["OrgNode"] = []
+
+
+class OrgReport(BaseModel):
+    id: int
+    full_name: str
+    type: Optional[str] = None
+    department: Optional[str] = None
+    is_active: bool = True
+    manager_id: Optional[int] = None
+    depth: int
+
+
+# ==================== DOKÜMANLAR ====================
+
+
+class DocumentResponse(BaseModel):
+    id: int
+    title: str
+    content_hash: Optional[str] = None
+    content_type: Optional[str] = None
+    size_bytes: Optional[int] = None
+    status: str = "pending"
+    rejection_reason: Optional[str] = None
+    uploaded_by: int
+    created_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class DocumentReview(BaseModel):
+    approved: bool
+    rejection_reason: Optional[str] = None
+
+
+# ==================== DENETİM KAYITLARI ====================
+
+
+class AuditLogResponse(BaseModel):
+    id: int
+    user_id: Optional[int] = None
+    action: str
+    details: Optional[str] = None
+    ip_address: Optional[str] = None
+    created_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
 class Izin(BaseModel):
     id: int
     tip: str = Field(validation_alias="leave_type")
@@ -261,6 +479,13 @@ class DashboardData(BaseModel):
     employeeStats: Optional[dict] = None
 
 
+class EmployeeStats(BaseModel):
+    totalEmployees: int
+    onLeave: int
+    pendingDocuments: int
+    onboarding: int
+
+
 Announcement = AnnouncementResponse
 
 
@@ -0,0 +1,227 @@
+"""
+HR API benchmark paketi: uç nokta başına throughput ve gecikme yüzdelikleri.
+
+bench_seed ile ölçeğe göre doldurulmuş bir veritabanına karşı gerçek
+uygulamayı süreç içinde (httpx ASGITransport; ağ ve sunucu yok) çalıştırır.
+Her uç nokta önce ısıtılır, sonra sabit eşzamanlılıkla ölçülür.
+
+Sonuçlar ölçek adına göre bench_baseline.json ile karşılaştırılır; p95
+gecikme veya throughput toleranstan fazla kötüleşirse, ya da ETag'li bir
+listede koşullu istek (304) tam yanıttan (200) hızlı değilse çıkış kodu 1 olur.
+Temel değerler makineye özgüdür; aynı makinede --save-baseline ile
+güncellenmelidir.
+
+Kullanım:
+  python scripts/bench_api.py --scale 1k
+  python scripts/bench_api.py --scale 10k --requests 300 --concurrency 16 --only leaves,calendar
+  python scripts/bench_api.py --scale 1k --save-baseline
+  python scripts/bench_api.py --url mysql+pymysql://user:pw@localhost/hr_bench --scale 10k --reseed
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Tuple
+
+sys.path.append(os.path.dirname(__file__))
+
+from bench_seed import SCALES, seed
+
+BASELINE_FILE = os.path.join(os.path.dirname(__file__), "bench_baseline.json")
+# Bu değerin altındaki p95 farkları gürültü sayılır (ms)
+NOISE_FLOOR_MS = 1.0
+
+_today = date.today()
+_month = (_today.replace(day=1), (_today.replace(day=28) + timedelta(days=4)).replace(day=1) - timedelta(days=1))
+
+# ad -> (yöntem, yol, kullanıcı, gövde)
+ENDPOINTS: Dict[str, Tuple[str, str, str, Optional[dict]]] = {
+    "me": ("GET", "/api/me", "bench_calisan", None),
+    "dashboard": ("GET", "/api/dashboard/", "bench_calisan", None),
+    "tasks": ("GET", "/api/tasks/", "bench_calisan", None),
+    "leaves_own": ("GET", "/api/leave-requests/", "bench_calisan", None),
+    "leaves": ("GET", "/api/leave-requests/?limit=100", "bench", None),
+    "calendar": ("GET", f"/api/leave-requests/calendar?from={_month[0]}&to={_month[1]}", "bench", None),
+    "users": ("GET", "/api/?limit=100", "bench", None),
+    "employee_stats": ("GET", "/api/employees/stats", "bench", None),
+    "headcount": ("GET", "/api/departments/headcount", "bench", None),
+    "announcements": ("GET", "/api/announcements/", "bench_calisan", None),
+    "asset_categories": ("GET", "/api/assets/categories", "bench", None),
+    "assets": ("GET", "/api/assets/all", "bench", None),
+    "search": ("GET", "/api/search?q=ay", "bench", None),
+    "batch": ("POST", "/api/batch", "bench_calisan", {"requests": [
+        {"resource": "dashboard"}, {"resource": "me"}, {"resource": "tasks"}, {"resource": "announcements"},
+        {"resource": "leave_requests", "params": {"limit": 20}},
+    ]}),
+}
+
+
+def prepare_database(url: Optional[str], scale: str, reseed: bool) -> str:
+    """
+    Ölçeğe ait SQLite dosyası varsa yeniden kullanır (büyük ölçeklerde
+    doldurma dakikalar sürer); yoksa veya --reseed ile yeniden doldurur.
+    URL, db.py import edilmeden önce ortama yazılır (engine import sırasında kurulur).
+    """
+    if url is None:
+        path = os.path.join(tempfile.gettempdir(), f"hr_bench_{scale}.db")
+        url = f"sqlite:///{path}"
+        if reseed and os.path.exists(path):
+            os.remove(path)
+        reseed = not os.path.exists(path)
+    os.environ["SQLALCHEMY_DATABASE_URL"] = url
+    if not reseed:
+        return url
+    started = time.perf_counter()
+    counts = seed(url, SCALES[scale])
+    print(f"veri üretildi ({scale}, {sum(counts.values()):,} satır, {time.perf_counter() - started:.1f} s)")
+    return url
+
+
+async def measure(client, method: str, path: str, headers: dict, body: Optional[dict],
+                  requests: int, concurrency: int, expected: int = 200) -> Tuple[List[float], int, float]:
+    samples: List[float] = []
+    errors = 0
+    remaining = iter(range(requests))
+
+    async def worker():
+        nonlocal errors
+        for _ in remaining:
+            started = time.perf_counter()
+            response = await client.request(method, path, headers=headers, json=body)
+            samples.append((time.perf_counter() - started) * 1000)
+            if response.status_code != expected:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return samples, errors, time.perf_counter() - started
+
+
+async def run(names: List[str], requests: int, concurrency: int, warmup: int) -> Tuple[Dict[str, Dict[str, float]], List[str]]:
+    import httpx
+    from bench_utils import percentiles
+    from core.security import create_access_token
+    from main import app
+
+    tokens = {user: {"Authorization": "Bearer " + create_access_token(user)}
+              for user in {ENDPOINTS[name][2] for name in names}}
+    results: Dict[str, Dict[str, float]] = {}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for name in names:
+            method, path, user, body = ENDPOINTS[name]
+            await measure(client, method, path, tokens[user], body, warmup, min(warmup, concurrency))
+            samples, errors, elapsed = await measure(client, method, path, tokens[user], body, requests, concurrency)
+            stats = percentiles(samples)
+            results[name] = {"rps": requests / elapsed, "p50": stats["p50"], "p95": stats["p95"],
+                             "p99": stats["p99"], "errors": errors}
+            print(f"  {name:<18} {results[name]['rps']:8.1f} req/s  p50={stats['p50']:8.2f}ms  "
+                  f"p95={stats['p95']:8.2f}ms  p99={stats['p99']:8.2f}ms" + (f"  HATA={errors}" if errors else ""))
+
+        # ETag'li listelerde 304 yolu (sürüm sorgusu) 200 yolundan ucuz olmalı.
+        # Kuyruk beklemesi karışmasın diye iki yol da tek bağlantıyla ölçülür.
+        slower: List[str] = []
+        for name in names:
+            method, path, user, body = ENDPOINTS[name]
+            response = await client.request(method, path, headers=tokens[user])
+            etag = response.headers.get("etag")
+            if method != "GET" or etag is None:
+                continue
+            conditional = {**tokens[user], "If-None-Match": etag}
+            full = percentiles((await measure(client, method, path, tokens[user], None, requests, 1))[0])["p50"]
+            samples, errors, _ = await measure(client, method, path, conditional, None, requests, 1, expected=304)
+            cached = percentiles(samples)["p50"]
+            print(f"  {name + ' 304/200':<18} p50={cached:8.2f}ms / {full:8.2f}ms  (x{full / max(cached, 1e-6):.1f})"
+                  + (f"  HATA={errors}" if errors else ""))
+            if errors or cached > full + NOISE_FLOOR_MS:
+                slower.append(f"{name}: 304 p50 {cached:.2f}ms, 200 p50 {full:.2f}ms"
+                              + (f" ({errors} yanıt 304 değil)" if errors else ""))
+    return results, slower
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]],
+            tolerance: float) -> List[str]:
+    regressions = []
+    for name, current in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        if current["p95"] > base["p95"] * (1 + tolerance) and current["p95"] - base["p95"] > NOISE_FLOOR_MS:
+            regressions.append(f"{name}: p95 {base['p95']:.2f}ms -> {current['p95']:.2f}ms")
+        if current["rps"] < base["rps"] * (1 - tolerance):
+            regressions.append(f"{name}: throughput {base['rps']:.1f} -> {current['rps']:.1f} req/s")
+        if current["errors"] and not base.get("errors"):
+            regressions.append(f"{name}: {current['errors']} hatalı yanıt")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HR API benchmark paketi")
+    parser.add_argument("--scale", default="1k", choices=sorted(SCALES))
+    parser.add_argument("--url", help="Veritabanı URL'si (varsayılan: ölçeğe ait geçici SQLite dosyası)")
+    parser.add_argument("--reseed", action="store_true", help="Veritabanını yeniden doldur")
+    parser.add_argument("--requests", type=int, default=200, help="Uç nokta başına ölçülen istek")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--only", help="Virgülle ayrılmış uç nokta adları")
+    parser.add_argument("--baseline", default=BASELINE_FILE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="İzin verilen kötüleşme oranı")
+    args = parser.parse_args()
+
+    names = [name.strip() for name in args.only.split(",")] if args.only else list(ENDPOINTS)
+    unknown = [name for name in names if name not in ENDPOINTS]
+    if unknown:
+        parser.error(f"bilinmeyen uç nokta: {', '.join(unknown)}")
+
+    prepare_database(args.url, args.scale, args.reseed)
+    print(f"ölçek={args.scale}  istek={args.requests}  eşzamanlılık={args.concurrency}\n")
+    results, slower = asyncio.run(run(names, args.requests, args.concurrency, args.warmup))
+    if slower:
+        print("\n304 yolu 200 yolundan hızlı değil:")
+        for line in slower:
+            print(f"  {line}")
+        sys.exit(1)
+
+    baselines = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            baselines = json.load(f)
+
+    if args.save_baseline:
+        entry = baselines.get(args.scale, {"endpoints": {}})
+        entry["endpoints"].update({name: {key: round(value, 3) for key, value in stats.items()}
+                                   for name, stats in results.items()})
+        entry["meta"] = {"requests": args.requests, "concurrency": args.concurrency,
+                         "python": platform.python_version(), "machine": platform.machine(),
+                         "cpus": os.cpu_count()}
+        baselines[args.scale] = entry
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(baselines, f, indent=2, ensure_ascii=False, sort_keys=True)
+            f.write("\n")
+        print(f"\ntemel değerler kaydedildi: {args.baseline} [{args.scale}]")
+        return
+
+    entry = baselines.get(args.scale)
+    if entry is None:
+        print(f"\n{args.scale} için temel değer yok (--save-baseline ile oluşturun)")
+        return
+    meta = entry.get("meta", {})
+    if (meta.get("requests"), meta.get("concurrency")) != (args.requests, args.concurrency):
+        print(f"\nuyarı: temel değerler farklı parametrelerle alınmış ({meta})")
+    regressions = compare(results, entry["endpoints"], args.tolerance)
+    if regressions:
+        print(f"\nkötüleşme (tolerans %{args.tolerance * 100:.0f}):")
+        for line in regressions:
+            print(f"  {line}")
+        sys.exit(1)
+    print(f"\ntemel değerlere göre kötüleşme yok (tolerans %{args.tolerance * 100:.0f})")
+
+
+if __name__ == "__main__":
+    main()
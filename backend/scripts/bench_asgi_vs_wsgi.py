@@ -0,0 +1,149 @@
+"""
+Yük testi: Passenger yolu (a2wsgi + thread'li WSGI sunucusu) ile yerel ASGI
+(asgi.py / uvicorn) karşılaştırması.
+
+Her sunucu ayrı süreçte, geçici bir SQLite veritabanıyla başlatılır. Yük
+üretici eşzamanlı httpx istemcileriyle sabit sayıda istek gönderir;
+saniyedeki istek (throughput) ve p50/p95/p99 gecikme raporlanır.
+
+Passenger'ın kendisi burada yoktur; onun yerine aynı passenger_wsgi.application
+nesnesi, istek başına thread açan wsgiref sunucusunda çalıştırılır.
+
+Kullanım: python scripts/bench_asgi_vs_wsgi.py [istek] [eşzamanlılık] [yol]
+"""
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+from bench_utils import percentiles, sqlite_session_factory
+
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+WSGI_SERVER = r"""
+import os, sys
+from socketserver import ThreadingMixIn
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer, make_server
+sys.path.insert(0, os.getcwd())
+from passenger_wsgi import application
+
+class ThreadingWSGIServer(ThreadingMixIn, WSGIServer):
+    daemon_threads = True
+
+class QuietHandler(WSGIRequestHandler):
+    def log_message(self, *args):
+        pass
+
+make_server("127.0.0.1", int(os.environ["SERVER_PORT"]), application,
+            server_class=ThreadingWSGIServer, handler_class=QuietHandler).serve_forever()
+"""
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def prepare(path: str, tasks: int = 50) -> str:
+    import models
+    from core.security import create_access_token, get_password_hash
+
+    SessionLocal = sqlite_session_factory(path)
+    db = SessionLocal()
+    user = models.Manager(username="bench", email="bench@example.com", full_name="Bench Yönetici",
+                          password_hash=get_password_hash("bench"), type="manager")
+    db.add(user)
+    db.flush()
+    db.add_all([models.Task(title=f"Görev {i}", description="Yük testi görevi", user_id=user.id)
+                for i in range(tasks)])
+    db.commit()
+    db.close()
+    return create_access_token("bench")
+
+
+def start(args, env) -> subprocess.Popen:
+    proc = subprocess.Popen(args, cwd=BACKEND_DIR, env=env,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    url = f"http://127.0.0.1:{env['SERVER_PORT']}/health"
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(url, timeout=1).status_code == 200:
+                return proc
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    proc.kill()
+    raise RuntimeError(f"Sunucu başlamadı: {' '.join(args)}")
+
+
+async def load(url: str, headers: dict, requests: int, concurrency: int):
+    samples, errors = [], 0
+    remaining = iter(range(requests))
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(headers=headers, limits=limits, timeout=30) as client:
+        async def worker():
+            nonlocal errors
+            for _ in remaining:
+                started = time.perf_counter()
+                try:
+                    response = await client.get(url)
+                    if response.status_code != 200:
+                        errors += 1
+                except httpx.HTTPError:
+                    errors += 1
+                samples.append((time.perf_counter() - started) * 1000)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+    return samples, errors, elapsed
+
+
+def run(label: str, args, env, path: str, token: str, requests: int, concurrency: int) -> None:
+    proc = start(args, env)
+    try:
+        url = f"http://127.0.0.1:{env['SERVER_PORT']}{path}"
+        headers = {"Authorization": f"Bearer {token}"}
+        # Isınma: ilk istekler (mapper, şema, bağlantı) ölçüme girmesin
+        asyncio.run(load(url, headers, concurrency * 2, concurrency))
+        samples, errors, elapsed = asyncio.run(load(url, headers, requests, concurrency))
+    finally:
+        proc.terminate()
+        proc.wait(timeout=30)
+    stats = percentiles(samples)
+    print(f"{label:<34} {requests / elapsed:8.1f} req/s  p50={stats['p50']:7.1f}ms  "
+          f"p95={stats['p95']:7.1f}ms  p99={stats['p99']:7.1f}ms  hata={errors}")
+
+
+def main(requests: int = 2000, concurrency: int = 32, path: str = "/api/tasks/"):
+    workdir = tempfile.mkdtemp(prefix="bench_asgi_")
+    db_path = os.path.join(workdir, "bench.db")
+    token = prepare(db_path)
+    base_env = {**os.environ, "SQLALCHEMY_DATABASE_URL": f"sqlite:///{db_path}",
+                "SERVER_LOG_LEVEL": "warning", "SERVER_ACCESS_LOG": "false"}
+
+    from asgi import cpu_count, worker_count
+    workers = int(os.environ.get("SERVER_WORKERS") or worker_count())
+    print(f"GET {path}  istek={requests}  eşzamanlılık={concurrency}  cpu={cpu_count()}\n")
+
+    run("a2wsgi + thread'li WSGI (1 süreç)", [sys.executable, "-c", WSGI_SERVER],
+        {**base_env, "SERVER_PORT": str(free_port())}, path, token, requests, concurrency)
+    run("uvicorn (1 worker)", [sys.executable, "asgi.py"],
+        {**base_env, "SERVER_PORT": str(free_port()), "SERVER_WORKERS": "1"}, path, token, requests, concurrency)
+    if workers > 1:
+        run(f"uvicorn ({workers} worker)", [sys.executable, "asgi.py"],
+            {**base_env, "SERVER_PORT": str(free_port()), "SERVER_WORKERS": str(workers)},
+            path, token, requests, concurrency)
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    main(int(args[0]) if args else 2000, int(args[1]) if len(args) > 1 else 32,
+         args[2] if len(args) > 2 else "/api/tasks/")
@@ -0,0 +1,65 @@
+"""
+JWT doğrulama mikro-benchmark'ı (veritabanı gerekmez).
+
+İstek başına python-jose ile çözme, her TokenVerifier backend'inin soğuk
+(memo'suz) doğrulaması ve memo isabeti karşılaştırılır.
+
+Kullanım: python scripts/bench_auth.py [doğrulama_sayısı] [farklı_token_sayısı]
+"""
+import sys
+
+from bench_utils import percentiles, format_stats, timed
+
+from jose import jwt
+from core.config import settings
+from core.security import TokenVerifier, create_access_token
+
+
+def run(label: str, verify, tokens, iterations: int) -> None:
+    samples = []
+    for i in range(iterations):
+        token = tokens[i % len(tokens)]
+        with timed(samples):
+            claims = verify(token)
+        assert claims and claims["sub"], label
+    print(format_stats(label, percentiles(samples)))
+
+
+def main(iterations: int = 20_000, distinct: int = 500):
+    tokens = [
+        create_access_token(f"user{i}", claims={"uid": i, "role": "employee", "ver": 0})
+        for i in range(distinct)
+    ]
+
+    run("jose decode (istek başına)",
+        lambda t: jwt.decode(t, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]),
+        tokens, iterations)
+
+    backends = ["jose", "hmac"]
+    try:
+        import jwt as pyjwt  # noqa: F401
+        backends.insert(1, "pyjwt")
+    except ImportError:
+        print("PyJWT kurulu değil, pyjwt backend'i atlanıyor")
+
+    for backend in backends:
+        cold = TokenVerifier(settings.SECRET_KEY, settings.ALGORITHM, backend=backend, memo_size=0)
+        run(f"{backend} (memo yok)", cold.verify, tokens, iterations)
+
+    memo = TokenVerifier(settings.SECRET_KEY, settings.ALGORITHM, backend="auto",
+                         memo_size=settings.JWT_MEMO_SIZE)
+    for token in tokens:
+        memo.verify(token)
+    run(f"{memo.backend} (memo isabeti)", memo.verify, tokens, iterations)
+
+    # Geçersiz imza / bozuk token hiçbir backend'de kabul edilmemeli
+    tampered = tokens[0][:-2] + ("AA" if not tokens[0].endswith("AA") else "BB")
+    for backend in backends:
+        verifier = TokenVerifier(settings.SECRET_KEY, settings.ALGORITHM, backend=backend)
+        assert verifier.verify(tampered) is None, backend
+        assert verifier.verify("bozuk.token") is None, backend
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:3]]
+    main(*args)
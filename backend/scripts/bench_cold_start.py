@@ -0,0 +1,118 @@
+"""
+Worker açılışından ilk yanıta kadar geçen süre (time-to-first-response).
+
+Her ölçüm yeni bir Python süreci başlatır, passenger_wsgi'yi import eder ve
+WSGI üzerinden ilk kimlik doğrulamalı isteği gönderir. Veritabanı olarak
+geçici bir SQLite dosyası kullanılır (SQLALCHEMY_DATABASE_URL).
+
+Tek çekirdekli sunucularda duvar saati gürültülüdür; import için CPU süresi
+de raporlanır.
+
+Modlar:
+  baseline  -> LAZY_ROUTERS=false, STARTUP_WARMUP=false
+  optimized -> varsayılan ayarlar (tembel yönlendiriciler + arka plan ısınma)
+
+Kullanım: python scripts/bench_cold_start.py [tekrar] [yol]
+          python scripts/bench_cold_start.py --profile   (import süresi dökümü)
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from bench_utils import percentiles, sqlite_session_factory
+
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+CHILD = r"""
+import io, json, os, sys, time
+started = time.perf_counter()
+cpu_started = time.process_time()
+sys.path.insert(0, os.getcwd())
+if os.getenv("BENCH_PROFILE"):
+    from core.startup import ImportProfiler
+    with ImportProfiler() as profiler:
+        import passenger_wsgi
+    print(profiler.report(limit=20))
+    sys.exit(0)
+import passenger_wsgi
+imported = time.perf_counter()
+import_cpu = time.process_time() - cpu_started
+status = []
+environ = {
+    "REQUEST_METHOD": "GET", "PATH_INFO": os.environ["BENCH_PATH"], "QUERY_STRING": "",
+    "SERVER_NAME": "localhost", "SERVER_PORT": "80", "SERVER_PROTOCOL": "HTTP/1.1",
+    "HTTP_AUTHORIZATION": "Bearer " + os.environ["BENCH_TOKEN"],
+    "wsgi.input": io.BytesIO(b""), "wsgi.errors": sys.stderr, "wsgi.url_scheme": "http",
+    "wsgi.version": (1, 0), "wsgi.multithread": True, "wsgi.multiprocess": True, "wsgi.run_once": False,
+}
+body = b"".join(passenger_wsgi.application(environ, lambda s, h, e=None: status.append(s)))
+done = time.perf_counter()
+print(json.dumps({"status": status[0], "import_ms": (imported - started) * 1000,
+                  "import_cpu_ms": import_cpu * 1000,
+                  "first_ms": (done - imported) * 1000, "total_ms": (done - started) * 1000}))
+"""
+
+MODES = {
+    "baseline": {"LAZY_ROUTERS": "false", "STARTUP_WARMUP": "false"},
+    "optimized": {},
+}
+
+
+def prepare(path: str) -> str:
+    import models
+    from core.security import create_access_token, get_password_hash
+
+    SessionLocal = sqlite_session_factory(path)
+    db = SessionLocal()
+    db.add(models.Manager(username="bench", email="bench@example.com", full_name="Bench Yönetici",
+                          password_hash=get_password_hash("bench"), type="manager"))
+    db.commit()
+    db.close()
+    return create_access_token("bench")
+
+
+def spawn(env: dict) -> dict:
+    started = time.perf_counter()
+    out = subprocess.run([sys.executable, "-c", CHILD], cwd=BACKEND_DIR, env=env,
+                         capture_output=True, text=True, check=True).stdout
+    result = json.loads(out.strip().splitlines()[-1])
+    # Yorumlayıcı başlangıcı dahil duvar saati süresi
+    result["process_ms"] = (time.perf_counter() - started) * 1000
+    return result
+
+
+def main(repeat: int = 10, path: str = "/api/tasks/"):
+    workdir = tempfile.mkdtemp(prefix="bench_cold_start_")
+    db_path = os.path.join(workdir, "bench.db")
+    token = prepare(db_path)
+    base_env = {**os.environ, "SQLALCHEMY_DATABASE_URL": f"sqlite:///{db_path}",
+                "BENCH_PATH": path, "BENCH_TOKEN": token}
+    # Worker'lar gibi .pyc önbelleğini kullansın (boş olmayan her değer yazmayı kapatır)
+    base_env.pop("PYTHONDONTWRITEBYTECODE", None)
+
+    if "--profile" in sys.argv:
+        print(subprocess.run([sys.executable, "-c", CHILD], cwd=BACKEND_DIR,
+                             env={**base_env, "BENCH_PROFILE": "1"},
+                             capture_output=True, text=True, check=True).stdout)
+        return
+
+    # .pyc önbelleğini ısıt (ilk import bytecode derlemesini ölçmesin)
+    spawn(base_env)
+
+    print(f"{repeat} açılış, ilk istek: GET {path}")
+    for mode, overrides in MODES.items():
+        runs = [spawn({**base_env, **overrides}) for _ in range(repeat)]
+        statuses = {run["status"] for run in runs}
+        print(f"\n[{mode}] durum={', '.join(sorted(statuses))}")
+        for key, label in (("import_ms", "import"), ("import_cpu_ms", "import (CPU)"), ("first_ms", "ilk yanıt"),
+                           ("total_ms", "import + ilk yanıt"), ("process_ms", "süreç (yorumlayıcı dahil)")):
+            stats = percentiles([run[key] for run in runs])
+            print(f"  {label:<26} p50={stats['p50']:7.1f}ms  p95={stats['p95']:7.1f}ms  mean={stats['mean']:7.1f}ms")
+
+
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    main(int(args[0]) if args else 10, args[1] if len(args) > 1 else "/api/tasks/")
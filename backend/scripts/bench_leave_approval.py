@@ -0,0 +1,101 @@
+"""
+İzin onayı çekişme (contention) benchmark'ı.
+
+Birden fazla iş parçacığı aynı bekleyen talepleri aynı anda onaylamaya çalışır.
+Sonunda her talebin tam bir kez onaylandığı ve hiçbir bakiyenin eksiye
+düşmediği doğrulanır.
+
+Kullanım: python scripts/bench_leave_approval.py [çalışan_sayısı] [iş_parçacığı] [talep_başına_gün]
+"""
+import os
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+from bench_utils import sqlite_session_factory, percentiles, format_stats, timed
+
+from models import Employee, LeaveBalance, LeaveRequest
+from repositories.leave_repo import leave_repo, LeaveConflictError
+
+
+def seed(SessionFactory, employees: int, days: float):
+    db = SessionFactory()
+    for i in range(employees):
+        db.add(Employee(
+            username=f"bench{i}", email=f"bench{i}@sirket.com", full_name=f"Bench {i}",
+            password_hash="x", type="personel", department="Yazılım",
+        ))
+    db.flush()
+    ids = [row.id for row in db.query(Employee.id).all()]
+    for user_id in ids:
+        db.add(LeaveBalance(user_id=user_id, year=2025, annual_leave=15))
+        # Bakiyeyi aşacak kadar talep: bir kısmı bilinçli olarak reddedilmeli
+        for k in range(4):
+            db.add(LeaveRequest(
+                user_id=user_id, leave_type="annual", total_days=days,
+                start_date=datetime(2025, 3, 1 + k * 5), end_date=datetime(2025, 3, 3 + k * 5),
+            ))
+    db.commit()
+    leave_ids = [row.id for row in db.query(LeaveRequest.id).all()]
+    db.close()
+    return leave_ids
+
+
+def run(employees: int = 50, threads: int = 8, days: float = 5):
+    path = os.path.join(tempfile.gettempdir(), "bench_leave_approval.db")
+    SessionFactory = sqlite_session_factory(path)
+    leave_ids = seed(SessionFactory, employees, days)
+
+    samples = []
+    approved = []
+    conflicts = [0]
+    lock = threading.Lock()
+
+    def worker():
+        db = SessionFactory()
+        try:
+            for leave_id in leave_ids:
+                leave = leave_repo.get(db, id=leave_id)
+                try:
+                    with timed(samples):
+                        leave_repo.decide(db, leave, status="approved", approver_id=1)
+                    with lock:
+                        approved.append(leave_id)
+                except LeaveConflictError:
+                    with lock:
+                        conflicts[0] += 1
+                db.expire_all()
+        finally:
+            db.close()
+
+    started = time.perf_counter()
+    pool = [threading.Thread(target=worker) for _ in range(threads)]
+    for t in pool:
+        t.start()
+    for t in pool:
+        t.join()
+    elapsed = time.perf_counter() - started
+
+    db = SessionFactory()
+    negative = db.query(LeaveBalance).filter(
+        (LeaveBalance.annual_leave < 0)
+    ).count()
+    approved_rows = db.query(LeaveRequest).filter(LeaveRequest.status == "approved").count()
+    db.close()
+
+    attempts = len(leave_ids) * threads
+    print(f"{len(leave_ids)} talep, {threads} iş parçacığı, {attempts} deneme, {elapsed:.2f}s")
+    print(f"throughput: {attempts / elapsed:.1f} deneme/s")
+    print(format_stats("decide()", percentiles(samples)))
+    print(f"onaylanan: {len(approved)}  çakışma/yetersiz bakiye: {conflicts[0]}")
+
+    assert len(approved) == len(set(approved)) == approved_rows, "Bir talep birden fazla kez onaylandı"
+    assert negative == 0, "Eksiye düşen izin bakiyesi var"
+    print("OK: çifte harcama yok")
+
+
+if __name__ == "__main__":
+    args = [float(a) for a in sys.argv[1:]]
+    run(*(int(a) for a in args[:2]), *args[2:3])
@@ -0,0 +1,91 @@
+"""
+Liste uç noktaları: ORM + pydantic yolu ile okuma modeli (Core + hızlı JSON) yolunun karşılaştırması.
+
+Kullanım: python scripts/bench_read_models.py [satır_sayısı] [tekrar]
+"""
+import json
+import os
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from typing import List
+
+from bench_utils import sqlite_session_factory, percentiles, format_stats, timed
+
+from pydantic import TypeAdapter
+from models import Employee, Task, LeaveRequest, EmployeeAsset, AssetCategory, User
+from schemas import TaskResponse, LeaveRequestResponse, EmployeeAssetResponse, UserResponse
+from repositories.task_repo import task_repo
+from repositories.leave_repo import leave_repo
+from repositories.asset_repo import asset_repo
+from repositories.user_repo import user_repo
+from repositories import read_models
+from core.responses import dumps
+
+
+def seed(SessionFactory, rows: int) -> int:
+    db = SessionFactory()
+    owner = Employee(username="bench", email="bench@sirket.com", full_name="Bench", password_hash="x")
+    category = AssetCategory(name="Laptop")
+    db.add_all([owner, category])
+    db.flush()
+    base = datetime(2025, 1, 1)
+    for i in range(rows):
+        db.add(Task(title=f"Görev {i}", description="x" * 40, user_id=owner.id, due_date=base))
+        db.add(LeaveRequest(user_id=owner.id, leave_type="annual", total_days=1,
+                            start_date=base + timedelta(days=i), end_date=base + timedelta(days=i)))
+        db.add(EmployeeAsset(employee_id=owner.id, category_id=category.id,
+                             asset_name=f"Laptop {i}", serial_number=f"SN-{i:06d}"))
+        db.add(Employee(username=f"user{i}", email=f"user{i}@sirket.com", full_name=f"Kullanıcı {i}",
+                        password_hash="x", department="Yazılım"))
+    db.commit()
+    owner_id = owner.id
+    db.close()
+    return owner_id
+
+
+def main(rows: int = 1000, repeat: int = 30):
+    path = os.path.join(tempfile.gettempdir(), "bench_read_models.db")
+    SessionFactory = sqlite_session_factory(path)
+    owner_id = seed(SessionFactory, rows)
+
+    cases = [
+        ("/tasks", List[TaskResponse],
+         lambda db: task_repo.get_multi_by_owner(db, user_id=owner_id, limit=rows),
+         lambda db: read_models.task_rows(db, user_id=owner_id, limit=rows)),
+        ("/leave-requests", List[LeaveRequestResponse],
+         lambda db: leave_repo.get_multi(db, limit=rows),
+         lambda db: read_models.leave_rows(db, limit=rows)),
+        ("/assets/all", List[EmployeeAssetResponse],
+         lambda db: asset_repo.get_all_with_details(db),
+         lambda db: read_models.asset_rows(db)),
+        ("/ (users)", List[UserResponse],
+         lambda db: user_repo.get_multi(db, limit=rows),
+         lambda db: read_models.user_rows(db, limit=rows)),
+    ]
+
+    for label, schema, orm_path, fast_path in cases:
+        adapter = TypeAdapter(schema)
+        orm_samples: List[float] = []
+        fast_samples: List[float] = []
+        for _ in range(repeat):
+            db = SessionFactory()
+            with timed(orm_samples):
+                orm_body = adapter.dump_json(adapter.validate_python(orm_path(db), from_attributes=True))
+            db.close()
+
+            db = SessionFactory()
+            with timed(fast_samples):
+                fast_body = dumps(fast_path(db))
+            db.close()
+
+        assert json.loads(orm_body) == json.loads(fast_body), f"{label}: yanıtlar farklı"
+        orm_stats = percentiles(orm_samples)
+        fast_stats = percentiles(fast_samples)
+        print(format_stats(f"{label} ORM+pydantic", orm_stats))
+        print(format_stats(f"{label} read model", fast_stats))
+        print(f"{'':<32} hızlanma x{orm_stats['p50'] / fast_stats['p50']:.1f}")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:3]))
@@ -0,0 +1,64 @@
+"""
+Arama indeksi typeahead gecikme benchmark'ı (veritabanı gerekmez).
+
+Kullanım: python scripts/bench_search.py [kayıt_sayısı] [sorgu_sayısı]
+p99 hedefi (< 10ms) kaçırılırsa 1 ile çıkar.
+"""
+import random
+import sys
+import time
+
+from bench_utils import percentiles, format_stats
+
+from core.config import settings
+from services.search import SearchIndex
+
+FIRST = ["Mehmet", "Ayşe", "Can", "Berkay", "İsmail", "Işıl", "Gökhan", "Şule", "Çağrı", "Öykü", "Ümit", "Zeynep"]
+LAST = ["Kaya", "Yılmaz", "Demir", "Şahin", "Çelik", "Öztürk", "Aydın", "Arslan", "Doğan", "Kılıç"]
+ASSETS = ["Dizüstü Bilgisayar", "Monitör", "Telefon", "Klavye", "Araç", "Kulaklık"]
+WORDS = ["toplantı", "bayram", "tatil", "eğitim", "güvenlik", "yemekhane", "servis", "ödül", "duyuru"]
+QUERIES = ["m", "me", "meh", "ayse", "ISIL", "işıl", "cag", "gok", "kaya", "yilm", "demir can",
+           "sn-0012", "monit", "dizustu", "bayr", "egitim", "ozt", "umit", "zey", "ars"]
+
+
+def build(records: int) -> SearchIndex:
+    rng = random.Random(42)
+    index = SearchIndex(max_scored=settings.SEARCH_MAX_SCORED_CANDIDATES)
+    for i in range(records):
+        kind = i % 10
+        if kind < 6:
+            name = f"{rng.choice(FIRST)} {rng.choice(LAST)}"
+            index.upsert("employee", i, name, f"user{i}@sirket.com", f"user{i}")
+        elif kind < 9:
+            index.upsert("asset", i, rng.choice(ASSETS), f"SN-{i:07d}")
+        else:
+            text = " ".join(rng.choice(WORDS) for _ in range(30))
+            index.upsert("announcement", i, f"Duyuru {i}", None, text)
+    return index
+
+
+def main(records: int = 100_000, queries: int = 2000):
+    started = time.perf_counter()
+    index = build(records)
+    index.rank_postings()
+    print(f"{records} kayıt indekslendi: {time.perf_counter() - started:.2f}s")
+
+    samples = []
+    for i in range(queries):
+        q = QUERIES[i % len(QUERIES)]
+        t0 = time.perf_counter()
+        index.search(q, limit=10)
+        samples.append((time.perf_counter() - t0) * 1000)
+
+    stats = percentiles(samples)
+    print(format_stats("search()", stats))
+    target = 10.0
+    if stats["p99"] >= target:
+        print(f"FAILURE: p99 {stats['p99']:.2f}ms, hedef < {target}ms")
+        return 1
+    print(f"SUCCESS: p99 hedef < {target}ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(*(int(a) for a in sys.argv[1:3])))
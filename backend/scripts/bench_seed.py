@@ -0,0 +1,207 @@
+"""
+Benchmark veritabanı için hızlı toplu veri üretici (bulk seeder).
+
+ORM yerine Core executemany ile parça parça ekler; kimlikler önceden
+atanır, böylece RETURNING veya flush gerekmez. SQLite'ta ekleme süresince
+günlük (journal) ve senkronizasyon kapatılır. 100k çalışan / milyonlarca
+izin talebi birkaç dakikada oluşur.
+
+Üretilen veri tohum (seed) değerine göre tekrarlanabilirdir. Oturum açmak
+için "bench" (yönetici) ve "bench_calisan" (çalışan) kullanıcıları eklenir;
+şifre "bench".
+
+Kullanım: python scripts/bench_seed.py [ölçek] [sqlite_dosyası | --url=URL]
+Ölçekler: SCALES (ör. 1k, 10k, 100k)
+"""
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Iterator, List
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from sqlalchemy import create_engine, event, func, select
+
+SCALES: Dict[str, Dict[str, int]] = {
+    "1k": {"employees": 1_000, "leaves": 20_000, "tasks": 5_000, "assets": 2_000, "announcements": 200},
+    "10k": {"employees": 10_000, "leaves": 500_000, "tasks": 50_000, "assets": 20_000, "announcements": 1_000},
+    "100k": {"employees": 100_000, "leaves": 2_000_000, "tasks": 300_000, "assets": 150_000, "announcements": 5_000},
+}
+
+CHUNK = 5_000
+PASSWORD = "bench"
+DEPARTMENTS = ["Yazılım", "İnsan Kaynakları", "Satış", "Pazarlama", "Finans", "Operasyon", "Destek", "Hukuk"]
+LOCATIONS = ["İstanbul", "Ankara", "İzmir", "Bursa", "Uzaktan"]
+FIRST_NAMES = ["Ahmet", "Ayşe", "Mehmet", "Fatma", "Can", "Zeynep", "Emre", "Elif", "Burak", "Selin", "Deniz", "Berkay"]
+LAST_NAMES = ["Yılmaz", "Kaya", "Demir", "Şahin", "Çelik", "Yıldız", "Aydın", "Öztürk", "Arslan", "Doğan"]
+LEAVE_TYPES = ["annual", "sick", "personal", "unpaid"]
+LEAVE_STATUSES = ["approved"] * 6 + ["pending"] * 3 + ["rejected"]
+TASK_PRIORITIES = ["low", "medium", "high"]
+TASK_STATUSES = ["pending", "in_progress", "completed"]
+CATEGORIES = ["Laptop", "Telefon", "Monitör", "Kulaklık", "Araç", "Kart"]
+ANNOUNCEMENT_CATEGORIES = ["genel", "etkinlik", "ik", "bilgi"]
+
+
+def chunks(rows: Iterable[dict], size: int = CHUNK) -> Iterator[List[dict]]:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def insert(conn, table, rows: Iterable[dict]) -> int:
+    count = 0
+    for batch in chunks(rows):
+        conn.execute(table.insert(), batch)
+        count += len(batch)
+    return count
+
+
+def _fast_sqlite(engine) -> None:
+    @event.listens_for(engine, "connect")
+    def pragmas(dbapi_connection, record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=OFF")
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA cache_size=-200000")
+        cursor.close()
+
+
+def seed(url: str, scale: Dict[str, int], rng_seed: int = 42) -> Dict[str, int]:
+    """
+    Tabloları oluşturur ve `scale` kadar satır ekler; tablo başına satır sayısını döndürür.
+    """
+    from db import Base
+    import models
+    from core.security import get_password_hash
+
+    engine = create_engine(url)
+    if url.startswith("sqlite"):
+        _fast_sqlite(engine)
+    Base.metadata.create_all(bind=engine)
+
+    rng = random.Random(rng_seed)
+    password_hash = get_password_hash(PASSWORD)
+    now = datetime.utcnow().replace(microsecond=0)
+    employees = scale["employees"]
+    managers = max(1, employees // 50)
+    counts: Dict[str, int] = {}
+
+    users = models.User.__table__
+    with engine.begin() as conn:
+        first_id = (conn.execute(select(func.max(users.c.id))).scalar() or 0) + 1
+
+        # Yöneticiler (ilk kullanıcı "bench") ve çalışanlar (ilk çalışan "bench_calisan")
+        manager_ids = list(range(first_id, first_id + managers))
+        employee_ids = list(range(first_id + managers, first_id + managers + employees))
+
+        def user_row(user_id: int, username: str, user_type: str) -> dict:
+            first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+            return {
+                "id": user_id, "username": username, "email": f"{username}@bench.local",
+                "password_hash": password_hash, "full_name": f"{first} {last}",
+                "first_name": first, "last_name": last, "salary": rng.randint(25, 150) * 1000.0,
+                "type": user_type, "is_active": True, "token_version": 0,
+                "created_at": now - timedelta(days=rng.randint(0, 2000)),
+            }
+
+        counts["users"] = insert(conn, users, (
+            user_row(user_id, "bench" if i == 0 else f"yonetici{i}", "manager")
+            for i, user_id in enumerate(manager_ids)
+        ))
+        counts["users"] += insert(conn, users, (
+            user_row(user_id, "bench_calisan" if i == 0 else f"calisan{i}", "personel")
+            for i, user_id in enumerate(employee_ids)
+        ))
+        insert(conn, models.Manager.__table__, (
+            {"id": user_id, "department": DEPARTMENTS[i % len(DEPARTMENTS)], "admin_level": 1}
+            for i, user_id in enumerate(manager_ids)
+        ))
+        counts["employees"] = insert(conn, models.Employee.__table__, (
+            {
+                "id": user_id, "department": rng.choice(DEPARTMENTS), "location": rng.choice(LOCATIONS),
+                "start_date": now - timedelta(days=rng.randint(0, 3000)),
+                "phone": f"+90 5{rng.randint(10, 59)} {rng.randint(100, 999)} {rng.randint(1000, 9999)}",
+                "manager_id": rng.choice(manager_ids),
+            }
+            for user_id in employee_ids
+        ))
+        counts["leave_balance"] = insert(conn, models.LeaveBalance.__table__, (
+            {"user_id": user_id, "year": now.year, "annual_leave": 15, "sick_leave": 10, "personal_leave": 3}
+            for user_id in employee_ids
+        ))
+
+        def leave_row() -> dict:
+            start = now + timedelta(days=rng.randint(-730, 90))
+            days = rng.randint(1, 10)
+            status = rng.choice(LEAVE_STATUSES)
+            created = start - timedelta(days=rng.randint(1, 30))
+            return {
+                "user_id": rng.choice(employee_ids), "leave_type": rng.choice(LEAVE_TYPES),
+                "start_date": start, "end_date": start + timedelta(days=days - 1), "total_days": float(days),
+                "reason": "Benchmark izni", "status": status,
+                "approved_by": rng.choice(manager_ids) if status != "pending" else None,
+                "approved_at": created + timedelta(days=1) if status != "pending" else None,
+                "created_at": created,
+            }
+
+        counts["leave_requests"] = insert(conn, models.LeaveRequest.__table__,
+                                          (leave_row() for _ in range(scale["leaves"])))
+
+        task_owners = employee_ids + manager_ids[:1]
+        counts["tasks"] = insert(conn, models.Task.__table__, (
+            {
+                "title": f"Görev {i}", "description": "Benchmark görevi",
+                "priority": rng.choice(TASK_PRIORITIES), "status": rng.choice(TASK_STATUSES),
+                "due_date": now + timedelta(days=rng.randint(-30, 60)), "created_at": now,
+                "user_id": rng.choice(task_owners),
+            }
+            for i in range(scale["tasks"])
+        ))
+
+        category_ids = {row.name: row.id for row in conn.execute(select(models.AssetCategory.__table__))}
+        missing = [name for name in CATEGORIES if name not in category_ids]
+        insert(conn, models.AssetCategory.__table__, ({"name": name, "created_at": now} for name in missing))
+        category_ids = [row.id for row in conn.execute(select(models.AssetCategory.__table__.c.id))]
+        counts["employee_assets"] = insert(conn, models.EmployeeAsset.__table__, (
+            {
+                "employee_id": rng.choice(employee_ids), "category_id": rng.choice(category_ids),
+                "asset_name": f"Demirbaş {i}", "serial_number": f"SN-{i:08d}", "assigned_by": manager_ids[0],
+                "assigned_date": now - timedelta(days=rng.randint(0, 1000)), "status": "active",
+            }
+            for i in range(scale["assets"])
+        ))
+
+        counts["announcements"] = insert(conn, models.Announcement.__table__, (
+            {
+                "title": f"Duyuru {i}", "content": "Benchmark duyurusu " * 5,
+                "category": rng.choice(ANNOUNCEMENT_CATEGORIES), "created_by": manager_ids[0],
+                "is_active": True, "announcement_date": now - timedelta(days=rng.randint(0, 365)),
+            }
+            for i in range(scale["announcements"])
+        ))
+    engine.dispose()
+    return counts
+
+
+def main(scale_name: str = "1k", target: str = "bench_seed.db"):
+    url = target[len("--url="):] if target.startswith("--url=") else f"sqlite:///{target}"
+    if url.startswith("sqlite:///") and os.path.exists(url[len("sqlite:///"):]):
+        os.remove(url[len("sqlite:///"):])
+    started = time.perf_counter()
+    counts = seed(url, SCALES[scale_name])
+    elapsed = time.perf_counter() - started
+    print(f"{scale_name}: {url}  ({elapsed:.1f} s, {sum(counts.values()) / elapsed:,.0f} satır/s)")
+    for table, count in counts.items():
+        print(f"  {table:<16} {count:>10,}")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    main(args[0] if args else "1k", args[1] if len(args) > 1 else "bench_seed.db")
@@ -0,0 +1,65 @@
+"""
+Benchmark betikleri için ortak yardımcılar (yerel SQLite veritabanı, zamanlama).
+"""
+import os
+import sys
+import time
+from contextlib import contextmanager
+from typing import Dict, List
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from db import Base
+import models  # noqa: F401  (tabloları metadata'ya kaydeder)
+
+
+def sqlite_session_factory(path: str, reset: bool = True):
+    """
+    Dosya tabanlı bir SQLite veritabanı oluşturur ve sessionmaker döndürür.
+    """
+    if reset and os.path.exists(path):
+        os.remove(path)
+    engine = create_engine(
+        f"sqlite:///{path}",
+        connect_args={"check_same_thread": False, "timeout": 30},
+    )
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@contextmanager
+def timed(samples: List[float]):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        samples.append((time.perf_counter() - start) * 1000)
+
+
+def percentiles(samples: List[float]) -> Dict[str, float]:
+    """
+    Milisaniye cinsinden örneklerden p50/p95/p99 özetini çıkarır.
+    """
+    if not samples:
+        return {"count": 0, "p50": 0.0, "p95": 0.0, "p99": 0.0, "mean": 0.0}
+    ordered = sorted(samples)
+
+    def pick(q: float) -> float:
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    return {
+        "count": len(ordered),
+        "p50": pick(0.50),
+        "p95": pick(0.95),
+        "p99": pick(0.99),
+        "mean": sum(ordered) / len(ordered),
+    }
+
+
+def format_stats(label: str, stats: Dict[str, float]) -> str:
+    return (
+        f"{label:<32} n={stats['count']:<6} mean={stats['mean']:.3f}ms "
+        f"p50={stats['p50']:.3f}ms p95={stats['p95']:.3f}ms p99={stats['p99']:.3f}ms"
+    )
@@ -0,0 +1,232 @@
+"""
+Gerçek uygulamaya (TestClient, geçici SQLite dosyası) karşı çalışan
+regresyon kontrolleri. Her kontrol boş bir şemayla başlar.
+
+Kullanım: python scripts/check_api_regressions.py [kontrol_adı ...]
+"""
+import os
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from typing import Callable, Dict
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+# db.py engine'i import sırasında kurar; ortam önce ayarlanır
+os.environ["SQLALCHEMY_DATABASE_URL"] = "sqlite:///" + os.path.join(tempfile.gettempdir(), "check_api_regressions.db")
+
+from fastapi.testclient import TestClient
+
+import db as database
+import models
+from core.config import settings
+from core.security import create_access_token, get_password_hash
+from main import app
+from services.employee_stats import employee_stats
+from services.org_chart import org_chart
+from services.rate_limit import MemorySlidingWindow, login_limiter
+
+PASSWORD = "kontrol"
+CHECKS: Dict[str, Callable[[TestClient], None]] = {}
+
+
+def check(name: str):
+    def decorator(func):
+        CHECKS[name] = func
+        return func
+    return decorator
+
+
+def reset_database() -> None:
+    database.Base.metadata.drop_all(bind=database.engine)
+    database.Base.metadata.create_all(bind=database.engine)
+    db = database.SessionLocal()
+    password_hash = get_password_hash(PASSWORD)
+    db.add_all([
+        models.Manager(username="yonetici", email="yonetici@example.com", full_name="Kontrol Yönetici",
+                       password_hash=password_hash, type="manager"),
+        models.Employee(username="calisan", email="calisan@example.com", full_name="Kontrol Çalışan",
+                        password_hash=password_hash),
+    ])
+    db.commit()
+    # Süreç içi önbellekler önceki kontrolün verisini taşımasın
+    employee_stats.reconcile(db)
+    org_chart.invalidate()
+    login_limiter.backend = MemorySlidingWindow()
+    db.close()
+
+
+def auth(username: str) -> Dict[str, str]:
+    return {"Authorization": "Bearer " + create_access_token(username)}
+
+
+def expect(condition: bool, message: str) -> None:
+    if not condition:
+        raise AssertionError(message)
+
+
+# ---- Kontroller ----
+
+@check("leave_approve_reopen_cycle")
+def leave_approve_reopen_cycle(client: TestClient) -> None:
+    """
+    Onay -> beklemeye alma döngüsü bakiyeyi yalnızca bir kez düşer ve
+    izindekiler sayacı geri alınır.
+    """
+    db = database.SessionLocal()
+    employee = db.query(models.Employee).filter_by(username="calisan").one()
+    start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    leave = models.LeaveRequest(user_id=employee.id, leave_type="annual", start_date=start,
+                                end_date=start + timedelta(days=4), total_days=5)
+    db.add(leave)
+    db.commit()
+    leave_id, user_id, year = leave.id, employee.id, start.year
+    db.close()
+
+    manager = auth("yonetici")
+    on_leave = lambda: client.get("/api/employees/stats", headers=manager).json()["onLeave"]
+    expect(on_leave() == 0, "başlangıçta izinde kimse olmamalı")
+    for status in ("approved", "pending") * 3 + ("approved",):
+        response = client.put(f"/api/leave-requests/{leave_id}", json={"status": status}, headers=manager)
+        expect(response.status_code == 200, f"{status}: {response.status_code} {response.text}")
+        expect(on_leave() == (1 if status == "approved" else 0), f"{status} sonrası izindekiler sayacı yanlış")
+    response = client.put(f"/api/leave-requests/{leave_id}", json={"status": "approved"}, headers=manager)
+    expect(response.status_code == 409, f"ikinci onay 409 değil: {response.status_code}")
+
+    db = database.SessionLocal()
+    balance = db.query(models.LeaveBalance).filter_by(user_id=user_id, year=year).one()
+    db.close()
+    expect(balance.annual_leave == 10, f"yıllık izin bakiyesi 10 değil: {balance.annual_leave}")
+
+
+@check("revoked_user_cannot_refresh")
+def revoked_user_cannot_refresh(client: TestClient) -> None:
+    """Token iptalinden sonra eski refresh token yeni access token alamaz."""
+    login = client.post("/api/login", data={"username": "calisan", "password": PASSWORD}).json()
+    headers = {"Authorization": "Bearer " + login["token"]}
+    expect(client.get("/api/me", headers=headers).status_code == 200, "giriş token'ı çalışmıyor")
+
+    user_id = login["user_id"]
+    response = client.post(f"/api/users/{user_id}/revoke-tokens", headers=auth("yonetici"))
+    expect(response.status_code == 200, f"iptal başarısız: {response.status_code}")
+    expect(client.get("/api/me", headers=headers).status_code == 401, "iptal edilen access token kabul edildi")
+
+    response = client.post("/api/refresh", json={"refresh_token": login["refresh_token"]})
+    expect(response.status_code == 401, f"iptal sonrası refresh {response.status_code} döndü")
+
+    login = client.post("/api/login", data={"username": "calisan", "password": PASSWORD}).json()
+    response = client.post("/api/refresh", json={"refresh_token": login["refresh_token"]})
+    expect(response.status_code == 200, "iptal sonrası yeni oturum yenilenemiyor")
+
+
+@check("deactivate_user")
+def deactivate_user(client: TestClient) -> None:
+    """Pasifleştirme sayaçları hemen günceller, token ve oturumları kapatır."""
+    manager = auth("yonetici")
+    total = lambda: client.get("/api/employees/stats", headers=manager).json()["totalEmployees"]
+    before = total()
+    login = client.post("/api/login", data={"username": "calisan", "password": PASSWORD}).json()
+
+    response = client.post(f"/api/users/{login['user_id']}/deactivate", headers=manager)
+    expect(response.status_code == 200, f"pasifleştirme {response.status_code} döndü")
+    expect(total() == before - 1, "aktif çalışan sayacı düşmedi")
+    expect(client.get("/api/me", headers={"Authorization": "Bearer " + login["token"]}).status_code == 401,
+           "pasif kullanıcının access token'ı kabul edildi")
+    response = client.post("/api/refresh", json={"refresh_token": login["refresh_token"]})
+    expect(response.status_code == 401, f"pasif kullanıcı refresh {response.status_code} aldı")
+    response = client.post(f"/api/users/{login['user_id']}/deactivate", headers=manager)
+    expect(response.status_code == 409, "ikinci pasifleştirme 409 değil")
+
+
+@check("successful_logins_not_throttled")
+def successful_logins_not_throttled(client: TestClient) -> None:
+    """Aynı IP'den sınırdan fazla başarılı giriş 429 almaz; başarısızlar alır."""
+    attempts = settings.LOGIN_RATE_LIMIT_IP_ATTEMPTS + 5
+    for i in range(attempts):
+        username = ("calisan", "yonetici")[i % 2]
+        response = client.post("/api/login", data={"username": username, "password": PASSWORD})
+        expect(response.status_code == 200, f"{i + 1}. başarılı giriş {response.status_code} aldı")
+
+    statuses = [
+        client.post("/api/login", data={"username": f"yok{i}", "password": "x"}).status_code
+        for i in range(settings.LOGIN_RATE_LIMIT_IP_ATTEMPTS + 1)
+    ]
+    expect(statuses[-1] == 429, f"IP başına başarısız deneme sınırı çalışmıyor: {statuses[-3:]}")
+
+
+@check("reorder_default_widget_layout")
+def reorder_default_widget_layout(client: TestClient) -> None:
+    """Varsayılan düzendeki kullanıcının sürükle-bırak sırası kaybolmaz."""
+    headers = auth("calisan")
+    default = [item["widgetType"] for item in client.get("/api/widgets", headers=headers).json()]
+    wanted = list(reversed(default[:3]))
+    response = client.patch("/api/widgets/order", json={"widgetTypes": wanted}, headers=headers)
+    expect(response.status_code == 200 and response.json()["updated"] == len(wanted),
+           f"sıralama yazılmadı: {response.status_code} {response.text}")
+    layout = [item["widgetType"] for item in client.get("/api/widgets", headers=headers).json()]
+    expect(layout == wanted + [t for t in default if t not in wanted], f"sıra uygulanmadı: {layout}")
+
+    response = client.patch("/api/widgets/order", json={"widgetTypes": ["olmayan"]}, headers=headers)
+    expect(response.status_code == 422, f"bilinmeyen widget için {response.status_code} döndü")
+
+
+@check("batch_dashboard")
+def batch_dashboard(client: TestClient) -> None:
+    """Toplu istekteki "dashboard" kaynağı GET /api/dashboard/ ile aynı veriyi döner."""
+    for username in ("yonetici", "calisan"):
+        headers = auth(username)
+        expected = client.get("/api/dashboard/", headers=headers).json()
+        response = client.post("/api/batch", json={"requests": [{"resource": "dashboard"}, {"resource": "me"}]},
+                               headers=headers)
+        results = {item["id"]: item for item in response.json()["results"]}
+        expect(results["dashboard"]["status"] == 200, f"{username}: {results['dashboard']}")
+        expect(results["dashboard"]["data"] == expected, f"{username}: toplu dashboard verisi farklı")
+
+
+@check("list_etag_tracks_writes")
+def list_etag_tracks_writes(client: TestClient) -> None:
+    """Liste ETag'i koşullu UPDATE dahil her yazmada değişir, değişmeyince 304 döner."""
+    manager, employee = auth("yonetici"), auth("calisan")
+    created = client.post("/api/leave-requests/", headers=employee, json={
+        "leave_type": "annual", "start_date": "2030-01-06T00:00:00", "end_date": "2030-01-07T00:00:00",
+        "total_days": 2, "reason": "kontrol",
+    })
+    expect(created.status_code == 200, f"izin talebi oluşturulamadı: {created.status_code} {created.text}")
+
+    for headers in (manager, employee):
+        etag = client.get("/api/leave-requests/", headers=headers).headers["ETag"]
+        response = client.get("/api/leave-requests/", headers={**headers, "If-None-Match": etag})
+        expect(response.status_code == 304, f"değişmeyen liste için {response.status_code}")
+
+    etags = {id(h): client.get("/api/leave-requests/", headers=h).headers["ETag"] for h in (manager, employee)}
+    response = client.put(f"/api/leave-requests/{created.json()['id']}", json={"status": "approved"}, headers=manager)
+    expect(response.status_code == 200, f"onay başarısız: {response.status_code}")
+    for headers in (manager, employee):
+        response = client.get("/api/leave-requests/", headers={**headers, "If-None-Match": etags[id(headers)]})
+        expect(response.status_code == 200, "onaydan sonra eski ETag hâlâ 304 alıyor")
+
+
+def main(names) -> int:
+    unknown = [name for name in names if name not in CHECKS]
+    if unknown:
+        print(f"bilinmeyen kontrol: {', '.join(unknown)}")
+        return 2
+    client = TestClient(app)
+    failed = 0
+    for name in names or CHECKS:
+        reset_database()
+        try:
+            CHECKS[name](client)
+            print(f"  OK    {name}")
+        except AssertionError as e:
+            failed += 1
+            print(f"  HATA  {name}: {e}")
+    if failed:
+        print(f"FAILURE: {failed} kontrol başarısız.")
+        return 1
+    print("SUCCESS: tüm kontroller geçti.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,81 @@
+"""
+Karışık tipte N kullanıcı listelenip EmployeeResponse'a çevrilirken çalışan
+SQL ifadelerini sayar ve sayının N'den bağımsız kaldığını doğrular.
+
+Kullanım: python scripts/check_query_counts.py
+"""
+import os
+import sys
+import tempfile
+from typing import List
+
+from bench_utils import sqlite_session_factory
+
+from pydantic import TypeAdapter
+from sqlalchemy import event
+from models import Owner, HRManager, Employee, Manager, AssistantManager
+from schemas import EmployeeResponse
+from repositories.user_repo import user_repo
+
+SIZES = (5, 50, 200)
+USER_TYPES = (Owner, HRManager, Employee, Manager, AssistantManager)
+
+
+def seed(SessionFactory, n: int):
+    db = SessionFactory()
+    for i in range(n):
+        model = USER_TYPES[i % len(USER_TYPES)]
+        db.add(model(
+            username=f"user{i}", email=f"user{i}@sirket.com", full_name=f"Kullanıcı {i}",
+            password_hash="x", department="Yazılım",
+        ))
+    db.commit()
+    db.close()
+
+
+def count_statements(SessionFactory, n: int, policy) -> int:
+    adapter = TypeAdapter(List[EmployeeResponse])
+    db = SessionFactory()
+    statements = []
+
+    def on_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", on_execute)
+    try:
+        users = user_repo.get_multi(db, limit=n, profile="detail", polymorphic=policy)
+        adapter.validate_python(users, from_attributes=True)
+    finally:
+        event.remove(engine, "before_cursor_execute", on_execute)
+        db.close()
+    return len(statements)
+
+
+def main() -> int:
+    results = {}
+    for n in SIZES:
+        path = os.path.join(tempfile.gettempdir(), f"check_query_counts_{n}.db")
+        SessionFactory = sqlite_session_factory(path)
+        seed(SessionFactory, n)
+        for policy in ("selectin", "joined", None):
+            results[(n, policy)] = count_statements(SessionFactory, n, policy)
+
+    ok = True
+    for policy in ("selectin", "joined", None):
+        counts = [results[(n, policy)] for n in SIZES]
+        constant = len(set(counts)) == 1
+        print(f"{str(policy):<9} " + "  ".join(f"N={n}: {c}" for n, c in zip(SIZES, counts))
+              + ("  (sabit)" if constant else "  (N ile artıyor)"))
+        if policy is not None and not constant:
+            ok = False
+
+    if ok:
+        print("SUCCESS: selectin ve joined politikalarında sorgu sayısı N'den bağımsız.")
+        return 0
+    print("FAILURE: Sorgu sayısı N ile artıyor.")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,7 +2,7 @@ import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
-from sqlalchemy.schema import CreateTable
+from sqlalchemy.schema import CreateTable, CreateIndex
 from db import engine, Base
 import models
 
@@ -13,6 +13,10 @@ def generate_schema():
             create_table_sql = CreateTable(table).compile(engine)
             f.write(str(create_table_sql))
             f.write(";\n\n")
+            # index=True kolonları ve __table_args__ içindeki Index'ler
+            for index in sorted(table.indexes, key=lambda index: index.name):
+                f.write(str(CreateIndex(index).compile(engine)))
+                f.write(";\n\n")
     print("schema.sql generated successfully.")
 
 if __name__ == "__main__":
@@ -0,0 +1,55 @@
+-- Mevcut (MySQL) veritabanlarını models.py'nin güncel haline getirir.
+-- Yeni kurulumlar için schema.sql yeterlidir (generate_schema.py ile üretilir).
+-- Kullanım: mysql <veritabanı> < scripts/migrate_schema.sql
+
+-- Token iptali: access token'ların "ver" claim'i bununla karşılaştırılır
+ALTER TABLE users ADD COLUMN token_version INT NOT NULL DEFAULT 0;
+
+-- Liste ETag'leri (kullanıcı kapsamlı COUNT + MAX(created_at) + MAX(updated_at))
+ALTER TABLE tasks ADD COLUMN updated_at DATETIME NULL;
+ALTER TABLE leave_requests ADD COLUMN updated_at DATETIME NULL;
+ALTER TABLE asset_categories ADD COLUMN updated_at DATETIME NULL;
+ALTER TABLE employee_assets ADD COLUMN updated_at DATETIME NULL;
+
+-- Liste ETag'leri için tablo başına yazma sayacı (satırlar ilk yazmada oluşur)
+CREATE TABLE list_versions (
+	name VARCHAR(50) NOT NULL,
+	version INTEGER NOT NULL DEFAULT 0,
+	PRIMARY KEY (name)
+);
+
+-- Hatırlatıcı türü, önceliği, hedef kullanıcısı ve bildirim zamanı
+ALTER TABLE reminders
+	ADD COLUMN type VARCHAR(20) NOT NULL DEFAULT 'other',
+	ADD COLUMN priority VARCHAR(10) NOT NULL DEFAULT 'medium',
+	ADD COLUMN user_id INTEGER NULL,
+	ADD COLUMN fired_at DATETIME NULL,
+	ADD FOREIGN KEY (user_id) REFERENCES users (id);
+
+-- Doküman içerik özeti (tekilleştirme), meta verisi ve inceleme durumu
+ALTER TABLE documents
+	ADD COLUMN content_hash VARCHAR(64) NULL,
+	ADD COLUMN content_type VARCHAR(100) NULL,
+	ADD COLUMN size_bytes INTEGER NULL,
+	ADD COLUMN status VARCHAR(20) NOT NULL DEFAULT 'pending',
+	ADD COLUMN rejection_reason TEXT NULL;
+-- İnceleme akışından önce yüklenen dokümanlar bekleyen sayısına girmesin
+UPDATE documents SET status = 'approved';
+
+-- sessions tablosu artık refresh token özetlerini (SHA-256) tutuyor; önceki
+-- sürüm bu tabloya yazmıyordu, eldeki satırlar geçerli bir oturum değildir
+DELETE FROM sessions;
+
+-- Çalışan başına yılda tek bakiye satırı. Önce tekrarlar kontrol edilmeli:
+--   SELECT user_id, year, COUNT(*) FROM leave_balance GROUP BY user_id, year HAVING COUNT(*) > 1;
+ALTER TABLE leave_balance ADD CONSTRAINT uq_leave_balance_user_year UNIQUE (user_id, year);
+
+-- İndeksler
+CREATE INDEX ix_tasks_user_versions ON tasks (user_id, created_at, updated_at);
+CREATE INDEX ix_leave_requests_status_dates ON leave_requests (status, start_date, end_date);
+CREATE INDEX ix_leave_requests_user_versions ON leave_requests (user_id, created_at, updated_at);
+CREATE INDEX ix_audit_logs_created_at ON audit_logs (created_at);
+CREATE INDEX ix_audit_logs_user_created ON audit_logs (user_id, created_at);
+CREATE INDEX ix_sessions_expires_at ON sessions (expires_at);
+CREATE INDEX ix_reminders_date ON reminders (date);
+CREATE INDEX ix_documents_content_hash ON documents (content_hash);
@@ -0,0 +1,121 @@
+"""
+Okuma replikası için yerel, iki SQLite dosyalı deneme ortamı.
+
+primary.db birincil, replica.db replikadır. "Replikasyon" arka planda her
+LAG saniyede bir SQLite backup API'si ile birincilin replikaya kopyalanmasıdır;
+böylece gerçek bir replikanın gecikmesi taklit edilir.
+
+Betik uygulamayı bu iki dosyayla süreç içinde başlatır ve şunları doğrular:
+  - GET istekleri replikadan okunur, yazmalar birincile gider
+  - yazan istemci hemen ardından kendi yazdığını görür (birincile yapışma)
+  - başka bir istemci replikasyon gecikmesi kadar eski veriyi görebilir
+
+Kullanım: python scripts/replica_standin.py [dizin] [gecikme_sn]
+Uygulamayı elle çalıştırmak için yazdırılan ortam değişkenleri kullanılabilir.
+"""
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+
+sys.path.append(os.path.dirname(__file__))
+
+
+def replicate(primary: str, replica: str) -> None:
+    src = sqlite3.connect(primary)
+    dst = sqlite3.connect(replica, timeout=30)
+    try:
+        src.backup(dst)
+    finally:
+        dst.close()
+        src.close()
+
+
+def start_replication(primary: str, replica: str, lag: float) -> threading.Event:
+    stop = threading.Event()
+
+    def run():
+        while not stop.wait(lag):
+            replicate(primary, replica)
+
+    threading.Thread(target=run, name="sqlite-replication", daemon=True).start()
+    return stop
+
+
+def seed(primary: str) -> None:
+    from bench_utils import sqlite_session_factory
+    import models
+    from core.security import get_password_hash
+
+    SessionLocal = sqlite_session_factory(primary)
+    db = SessionLocal()
+    password = get_password_hash("replica")
+    db.add_all([
+        models.Manager(username="yonetici", email="yonetici@example.com", full_name="Replika Yönetici",
+                       password_hash=password, type="manager"),
+        models.Employee(username="calisan", email="calisan@example.com", full_name="Replika Çalışan",
+                        password_hash=password),
+    ])
+    db.commit()
+    db.close()
+
+
+def main(workdir: str, lag: float = 2.0):
+    os.makedirs(workdir, exist_ok=True)
+    primary = os.path.join(workdir, "primary.db")
+    replica = os.path.join(workdir, "replica.db")
+    # db.py engine'leri import sırasında kurar; ortam önce ayarlanır
+    os.environ["SQLALCHEMY_DATABASE_URL"] = f"sqlite:///{primary}"
+    os.environ["DB_REPLICA_URLS"] = f"sqlite:///{replica}"
+    print(f"SQLALCHEMY_DATABASE_URL={os.environ['SQLALCHEMY_DATABASE_URL']}")
+    print(f"DB_REPLICA_URLS={os.environ['DB_REPLICA_URLS']}\n")
+    seed(primary)
+    replicate(primary, replica)
+
+    from fastapi.testclient import TestClient
+    from sqlalchemy import event
+    from core.security import create_access_token
+    import db as database
+    from main import app
+
+    # Engine başına çalıştırılan SELECT sayısı
+    selects = Counter()
+    for label, engine in [("birincil", database.engine)] + [("replika", e) for e in database.replicas.engines]:
+        event.listen(engine, "before_cursor_execute",
+                     lambda conn, cursor, statement, *args, label=label:
+                     selects.update([label]) if statement.lstrip().upper().startswith("SELECT") else None)
+
+    stop = start_replication(primary, replica, lag)
+    client = TestClient(app)
+    manager = {"Authorization": "Bearer " + create_access_token("yonetici")}
+    employee = {"Authorization": "Bearer " + create_access_token("calisan")}
+    employee_id = client.get("/api/me", headers=employee).json()["id"]
+    manager_id = client.get("/api/me", headers=manager).json()["id"]
+
+    selects.clear()
+    client.get("/api/tasks/", headers=employee)
+    print(f"GET /api/tasks/ (yazmamış istemci):     {dict(selects)}")
+
+    for user_id in (manager_id, employee_id):
+        client.post("/api/tasks/", headers=manager,
+                    json={"title": "Replika testi", "description": "", "user_id": user_id}).raise_for_status()
+
+    selects.clear()
+    seen = [task["title"] for task in client.get("/api/tasks/", headers=manager).json()]
+    print(f"GET /api/tasks/ (yazan istemci, hemen): {dict(selects)}  kendi yazdığını görüyor: {'Replika testi' in seen}")
+
+    seen = [task["title"] for task in client.get("/api/tasks/", headers=employee).json()]
+    print(f"çalışan, replikasyondan önce görüyor: {'Replika testi' in seen}")
+    time.sleep(lag * 1.5)
+    seen = [task["title"] for task in client.get("/api/tasks/", headers=employee).json()]
+    print(f"çalışan, replikasyondan sonra görüyor: {'Replika testi' in seen}")
+    stop.set()
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    main(args[0] if args else tempfile.mkdtemp(prefix="replica_standin_"),
+         float(args[1]) if len(args) > 1 else 2.0)
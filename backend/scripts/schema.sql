@@ -5,19 +5,20 @@ CREATE TABLE asset_categories (
 	description TEXT, 
 	icon VARCHAR(50), 
 	created_at DATETIME NOT NULL, 
+	updated_at DATETIME, 
 	PRIMARY KEY (id), 
 	UNIQUE (name)
 )
 
 ;
 
+CREATE INDEX ix_asset_categories_id ON asset_categories (id);
 
-CREATE TABLE reminders (
-	id INTEGER NOT NULL AUTO_INCREMENT, 
-	title VARCHAR(200) NOT NULL, 
-	date DATETIME NOT NULL, 
-	created_at DATETIME NOT NULL, 
-	PRIMARY KEY (id)
+
+CREATE TABLE list_versions (
+	name VARCHAR(50) NOT NULL, 
+	version INTEGER NOT NULL, 
+	PRIMARY KEY (name)
 )
 
 ;
@@ -33,15 +34,22 @@ CREATE TABLE users (
 	last_name VARCHAR(50), 
 	salary FLOAT, 
 	avatar VARCHAR(255), 
-	created_at DATETIME NOT NULL DEFAULT now(), 
+	created_at DATETIME NOT NULL DEFAULT (now()), 
 	updated_at DATETIME, 
 	type VARCHAR(50) NOT NULL, 
 	is_active BOOL NOT NULL, 
+	token_version INTEGER NOT NULL DEFAULT '0', 
 	PRIMARY KEY (id)
 )
 
 ;
 
+CREATE UNIQUE INDEX ix_users_email ON users (email);
+
+CREATE INDEX ix_users_id ON users (id);
+
+CREATE UNIQUE INDEX ix_users_username ON users (username);
+
 
 CREATE TABLE announcements (
 	id INTEGER NOT NULL AUTO_INCREMENT, 
@@ -58,6 +66,8 @@ CREATE TABLE announcements (
 
 ;
 
+CREATE INDEX ix_announcements_id ON announcements (id);
+
 
 CREATE TABLE assistant_managers (
 	id INTEGER NOT NULL, 
@@ -82,6 +92,12 @@ CREATE TABLE audit_logs (
 
 ;
 
+CREATE INDEX ix_audit_logs_created_at ON audit_logs (created_at);
+
+CREATE INDEX ix_audit_logs_id ON audit_logs (id);
+
+CREATE INDEX ix_audit_logs_user_created ON audit_logs (user_id, created_at);
+
 
 CREATE TABLE dashboard_widgets (
 	id INTEGER NOT NULL AUTO_INCREMENT, 
@@ -96,11 +112,18 @@ CREATE TABLE dashboard_widgets (
 
 ;
 
+CREATE INDEX ix_dashboard_widgets_id ON dashboard_widgets (id);
+
 
 CREATE TABLE documents (
 	id INTEGER NOT NULL AUTO_INCREMENT, 
 	title VARCHAR(200) NOT NULL, 
 	file_path VARCHAR(500) NOT NULL, 
+	content_hash VARCHAR(64), 
+	content_type VARCHAR(100), 
+	size_bytes INTEGER, 
+	status VARCHAR(20) NOT NULL DEFAULT 'pending', 
+	rejection_reason TEXT, 
 	uploaded_by INTEGER NOT NULL, 
 	created_at DATETIME NOT NULL, 
 	PRIMARY KEY (id), 
@@ -109,6 +132,10 @@ CREATE TABLE documents (
 
 ;
 
+CREATE INDEX ix_documents_content_hash ON documents (content_hash);
+
+CREATE INDEX ix_documents_id ON documents (id);
+
 
 CREATE TABLE employees (
 	id INTEGER NOT NULL, 
@@ -150,6 +177,7 @@ CREATE TABLE leave_requests (
 	approved_by INTEGER, 
 	approved_at DATETIME, 
 	created_at DATETIME NOT NULL, 
+	updated_at DATETIME, 
 	PRIMARY KEY (id), 
 	FOREIGN KEY(user_id) REFERENCES users (id), 
 	FOREIGN KEY(approved_by) REFERENCES users (id)
@@ -157,6 +185,12 @@ CREATE TABLE leave_requests (
 
 ;
 
+CREATE INDEX ix_leave_requests_id ON leave_requests (id);
+
+CREATE INDEX ix_leave_requests_status_dates ON leave_requests (status, start_date, end_date);
+
+CREATE INDEX ix_leave_requests_user_versions ON leave_requests (user_id, created_at, updated_at);
+
 
 CREATE TABLE managers (
 	id INTEGER NOT NULL, 
@@ -182,6 +216,8 @@ CREATE TABLE notifications (
 
 ;
 
+CREATE INDEX ix_notifications_id ON notifications (id);
+
 
 CREATE TABLE owners (
 	id INTEGER NOT NULL, 
@@ -195,6 +231,26 @@ CREATE TABLE owners (
 ;
 
 
+CREATE TABLE reminders (
+	id INTEGER NOT NULL AUTO_INCREMENT, 
+	title VARCHAR(200) NOT NULL, 
+	date DATETIME NOT NULL, 
+	type VARCHAR(20) NOT NULL DEFAULT 'other', 
+	priority VARCHAR(10) NOT NULL DEFAULT 'medium', 
+	user_id INTEGER, 
+	fired_at DATETIME, 
+	created_at DATETIME NOT NULL, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(user_id) REFERENCES users (id)
+)
+
+;
+
+CREATE INDEX ix_reminders_date ON reminders (date);
+
+CREATE INDEX ix_reminders_id ON reminders (id);
+
+
 CREATE TABLE sessions (
 	id INTEGER NOT NULL AUTO_INCREMENT, 
 	user_id INTEGER NOT NULL, 
@@ -208,6 +264,10 @@ CREATE TABLE sessions (
 
 ;
 
+CREATE INDEX ix_sessions_expires_at ON sessions (expires_at);
+
+CREATE INDEX ix_sessions_id ON sessions (id);
+
 
 CREATE TABLE tasks (
 	id INTEGER NOT NULL AUTO_INCREMENT, 
@@ -217,6 +277,7 @@ CREATE TABLE tasks (
 	status ENUM('pending','in_progress','completed') NOT NULL, 
 	due_date DATETIME, 
 	created_at DATETIME NOT NULL, 
+	updated_at DATETIME, 
 	user_id INTEGER NOT NULL, 
 	PRIMARY KEY (id), 
 	FOREIGN KEY(user_id) REFERENCES users (id)
@@ -224,6 +285,10 @@ CREATE TABLE tasks (
 
 ;
 
+CREATE INDEX ix_tasks_id ON tasks (id);
+
+CREATE INDEX ix_tasks_user_versions ON tasks (user_id, created_at, updated_at);
+
 
 CREATE TABLE employee_assets (
 	id INTEGER NOT NULL AUTO_INCREMENT, 
@@ -234,6 +299,7 @@ CREATE TABLE employee_assets (
 	description TEXT, 
 	assigned_by INTEGER, 
 	assigned_date DATETIME NOT NULL, 
+	updated_at DATETIME, 
 	return_date DATETIME, 
 	status VARCHAR(50) NOT NULL, 
 	document_url VARCHAR(255), 
@@ -247,6 +313,8 @@ CREATE TABLE employee_assets (
 
 ;
 
+CREATE INDEX ix_employee_assets_id ON employee_assets (id);
+
 
 CREATE TABLE leave_balance (
 	id INTEGER NOT NULL AUTO_INCREMENT, 
@@ -256,11 +324,14 @@ CREATE TABLE leave_balance (
 	sick_leave INTEGER NOT NULL, 
 	personal_leave INTEGER NOT NULL, 
 	PRIMARY KEY (id), 
+	CONSTRAINT uq_leave_balance_user_year UNIQUE (user_id, year), 
 	FOREIGN KEY(user_id) REFERENCES employees (id)
 )
 
 ;
 
+CREATE INDEX ix_leave_balance_id ON leave_balance (id);
+
 
 CREATE TABLE work_schedule (
 	id INTEGER NOT NULL AUTO_INCREMENT, 
@@ -276,3 +347,5 @@ CREATE TABLE work_schedule (
 
 ;
 
+CREATE INDEX ix_work_schedule_id ON work_schedule (id);
+
@@ -0,0 +1,191 @@
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple
+
+from core.config import settings
+
+# (başlangıç, bitiş, veri) — tarihler dahil (inclusive)
+Interval = Tuple[date, date, Any]
+
+
+def _as_date(value: Any) -> date:
+    return value.date() if isinstance(value, datetime) else value
+
+
+class IntervalTree:
+    """
+    Merkezli aralık ağacı (Centered interval tree).
+    İstek penceresi için bir kez kurulur, nokta ve aralık sorgularını
+    O(log n + k) sürede yanıtlar.
+    """
+
+    __slots__ = ("center", "by_start", "by_end", "left", "right")
+
+    def __init__(self, intervals: Sequence[Interval]):
+        points = sorted({iv[0] for iv in intervals} | {iv[1] for iv in intervals})
+        self.center = points[len(points) // 2] if points else None
+        self.left: Optional[IntervalTree] = None
+        self.right: Optional[IntervalTree] = None
+
+        overlapping: List[Interval] = []
+        left: List[Interval] = []
+        right: List[Interval] = []
+        for iv in intervals:
+            if iv[1] < self.center:
+                left.append(iv)
+            elif iv[0] > self.center:
+                right.append(iv)
+            else:
+                overlapping.append(iv)
+
+        # Merkezi kesen aralıklar iki sırada tutulur
+        self.by_start = sorted(overlapping, key=lambda iv: iv[0])
+        self.by_end = sorted(overlapping, key=lambda iv: iv[1], reverse=True)
+        if left:
+            self.left = IntervalTree(left)
+        if right:
+            self.right = IntervalTree(right)
+
+    def query_point(self, point: date) -> List[Interval]:
+        """
+        Verilen günü kapsayan aralıkları döndürür.
+        """
+        result: List[Interval] = []
+        node: Optional[IntervalTree] = self
+        while node is not None and node.center is not None:
+            if point < node.center:
+                for iv in node.by_start:
+                    if iv[0] > point:
+                        break
+                    result.append(iv)
+                node = node.left
+            elif point > node.center:
+                for iv in node.by_end:
+                    if iv[1] < point:
+                        break
+                    result.append(iv)
+                node = node.right
+            else:
+                result.extend(node.by_start)
+                break
+        return result
+
+    def query_range(self, start: date, end: date) -> List[Interval]:
+        """
+        [start, end] aralığıyla kesişen aralıkları döndürür.
+        """
+        result: List[Interval] = []
+        stack: List[IntervalTree] = [self]
+        while stack:
+            node = stack.pop()
+            if node.center is None:
+                continue
+            for iv in node.by_start:
+                if iv[0] > end:
+                    break
+                if iv[1] >= start:
+                    result.append(iv)
+            if node.left is not None and start < node.center:
+                stack.append(node.left)
+            if node.right is not None and end > node.center:
+                stack.append(node.right)
+        return result
+
+
+def build_calendar(rows: Sequence[Any], window_start: date, window_end: date) -> Dict[str, Any]:
+    """
+    Tek SQL taramasından gelen satırlardan günlük sayıları ve kişi bazlı
+    izin aralıklarını hesaplar. Aralıklar pencereye kırpılır.
+    """
+    intervals: List[Interval] = []
+    people: Dict[int, Dict[str, Any]] = {}
+
+    for row in rows:
+        start = max(_as_date(row.start_date), window_start)
+        end = min(_as_date(row.end_date), window_end)
+        if start > end:
+            continue
+        intervals.append((start, end, row.user_id))
+
+        person = people.get(row.user_id)
+        if person is None:
+            person = people[row.user_id] = {
+                "user_id": row.user_id,
+                "full_name": row.full_name,
+                "department": row.department,
+                "spans": [],
+            }
+        person["spans"].append({
+            "leave_id": row.id,
+            "leave_type": row.leave_type,
+            "start_date": start,
+            "end_date": end,
+        })
+
+    tree = IntervalTree(intervals)
+    days = []
+    day = window_start
+    while day <= window_end:
+        # Aynı kişinin çakışan talepleri tek kişi sayılır
+        count = len({iv[2] for iv in tree.query_point(day)}) if intervals else 0
+        days.append({"date": day, "count": count})
+        day += timedelta(days=1)
+
+    for person in people.values():
+        person["spans"].sort(key=lambda span: span["start_date"])
+
+    return {
+        "from_date": window_start,
+        "to_date": window_end,
+        "days": days,
+        "people": sorted(people.values(), key=lambda p: p["full_name"] or ""),
+    }
+
+
+class CalendarCache:
+    """
+    Son dönem pencereleri için süreli, boyutu sınırlı LRU önbellek.
+    İzin talebi yazıldığında tamamen geçersiz kılınır.
+    """
+
+    def __init__(self, ttl_seconds: int, max_entries: int = 64):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] > self.ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def is_recent_window(window_end: date, today: Optional[date] = None) -> bool:
+    """
+    Yalnızca yakın aylara ait pencereler önbelleğe alınır; eski aylar
+    nadiren sorgulanır ve önbelleği doldurmamalıdır.
+    """
+    today = today or date.today()
+    return window_end >= today - timedelta(days=31 * settings.ABSENCE_CALENDAR_CACHE_MONTHS)
+
+
+calendar_cache = CalendarCache(ttl_seconds=settings.ABSENCE_CALENDAR_CACHE_TTL_SECONDS)
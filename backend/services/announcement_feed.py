@@ -0,0 +1,58 @@
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from core.db_routing import use_primary
+from repositories.announcement_repo import announcement_repo
+from schemas import AnnouncementResponse
+
+
+class AnnouncementFeedCache:
+    """
+    Aktif duyuru akışının süreç içi paylaşılan önbelleği.
+
+    Tüm aktif duyurular tek sorguda yüklenir, kategori filtresi bellekte
+    uygulanır. Duyuru yazıldığında invalidate() çağrılır; diğer worker
+    süreçleri için TTL bayatlığı sınırlar.
+    """
+
+    def __init__(self, ttl_seconds: int):
+        self.ttl_seconds = ttl_seconds
+        self._feed: Optional[List[Dict[str, Any]]] = None
+        self._loaded_at = 0.0
+        # Yükleme sırasında gelen invalidate'i kaçırmamak için sürüm sayacı
+        self._version = 0
+        self._lock = threading.Lock()
+
+    def get(self, db: Session, category: Optional[str] = None, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        feed = self._feed
+        if feed is None or time.monotonic() - self._loaded_at > self.ttl_seconds:
+            feed = self._load(db)
+        if category:
+            feed = [item for item in feed if item["category"] == category]
+        return feed[:limit] if limit else feed
+
+    def _load(self, db: Session) -> List[Dict[str, Any]]:
+        version = self._version
+        # Süreç önbelleği replikadan doldurulmaz; invalidate sonrası bayat veri TTL boyunca kalırdı
+        with use_primary():
+            feed = [
+                AnnouncementResponse.model_validate(item).model_dump()
+                for item in announcement_repo.get_active(db)
+            ]
+        with self._lock:
+            if version == self._version:
+                self._feed = feed
+                self._loaded_at = time.monotonic()
+        return feed
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._version += 1
+            self._feed = None
+
+
+announcement_feed = AnnouncementFeedCache(ttl_seconds=settings.ANNOUNCEMENT_FEED_TTL_SECONDS)
@@ -0,0 +1,153 @@
+"""
+Denetim kayıtları (audit_logs) için asenkron, toplu yazıcı.
+
+Yazma yolları audit() ile olayı yalnızca bellek içi kuyruğa ekler; istek
+süresine INSERT maliyeti eklenmez. Arka plan thread'i kuyruğu AUDIT_BATCH_SIZE
+olaya ulaşınca veya AUDIT_FLUSH_INTERVAL_SECONDS dolunca tek bir çok satırlı
+INSERT ile boşaltır. Kapanışta (lifespan veya atexit) kalan olaylar yazılır.
+
+Kayıtlar en fazla flush aralığı kadar gecikmeyle sorgulanabilir hale gelir;
+kuyruk doluysa (AUDIT_MAX_QUEUE) yeni olaylar düşürülür ve sayılır.
+"""
+import atexit
+import json
+import queue
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from core.config import settings
+from db import SessionLocal
+from repositories.audit_repo import audit_repo
+
+
+class AuditWriter:
+    def __init__(self, session_factory, batch_size: int, flush_interval: float, max_queue: int):
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=max_queue)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self.written = 0
+        self.dropped = 0
+
+    def log(self, action: str, user_id: Optional[int] = None, details: Any = None,
+            ip_address: Optional[str] = None) -> None:
+        if details is not None and not isinstance(details, str):
+            details = json.dumps(details, ensure_ascii=False, default=str)
+        event = {
+            "user_id": user_id,
+            "action": action,
+            "details": details,
+            "ip_address": ip_address,
+            # Olay zamanı; flush zamanı değil
+            "created_at": datetime.now(),
+        }
+        self.start()
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            self.dropped += 1
+
+    # ---- Arka plan thread'i ----
+
+    def start(self) -> None:
+        """
+        İdempotent; lifespan çalışmayan (a2wsgi) ortamlarda ilk olayda başlar.
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="audit-writer", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """
+        Thread'i durdurur ve kuyrukta kalan olayları yazar.
+        """
+        self._stop.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        self._thread = None
+        self.flush()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            batch = self._collect()
+            if batch:
+                self._write(batch)
+
+    def _collect(self) -> List[Dict[str, Any]]:
+        """
+        İlk olayı bekler, sonra batch dolana veya flush aralığı bitene kadar toplar.
+        """
+        try:
+            batch = [self._queue.get(timeout=self.flush_interval)]
+        except queue.Empty:
+            return []
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size and not self._stop.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _drain(self) -> List[Dict[str, Any]]:
+        batch = []
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def flush(self) -> int:
+        """
+        Kuyruktaki tüm olayları çağıran thread'de yazar.
+        """
+        total = 0
+        while True:
+            batch = self._drain()
+            if not batch:
+                return total
+            self._write(batch)
+            total += len(batch)
+
+    def _write(self, batch: List[Dict[str, Any]]) -> None:
+        db = self.session_factory()
+        try:
+            audit_repo.insert_many(db, batch)
+            db.commit()
+            self.written += len(batch)
+        except Exception as e:
+            db.rollback()
+            self.dropped += len(batch)
+            from logger import log_error
+            log_error(e, "audit log flush")
+        finally:
+            db.close()
+
+
+audit_writer = AuditWriter(
+    SessionLocal,
+    batch_size=settings.AUDIT_BATCH_SIZE,
+    flush_interval=settings.AUDIT_FLUSH_INTERVAL_SECONDS,
+    max_queue=settings.AUDIT_MAX_QUEUE,
+)
+atexit.register(audit_writer.stop)
+
+
+def audit(action: str, user_id: Optional[int] = None, details: Any = None,
+          ip_address: Optional[str] = None) -> None:
+    audit_writer.log(action, user_id=user_id, details=details, ip_address=ip_address)
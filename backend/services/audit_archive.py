@@ -0,0 +1,195 @@
+"""
+audit_logs saklama süresi ve arşivleme.
+
+AUDIT_RETENTION_DAYS'ten eski kayıtlar id sırasıyla (keyset, OFFSET yok)
+AUDIT_ARCHIVE_CHUNK_SIZE'lık parçalar halinde okunur, gün bazında bölümlenmiş
+gzip JSON-lines dosyalarına eklenir ve aynı parça kendi transaction'ında
+silinir; böylece kilitler kısa tutulur.
+
+    <AUDIT_ARCHIVE_DIR>/YYYY/MM/audit-YYYY-MM-DD.jsonl.gz
+
+Dosyaya yazıldıktan sonra silme başarısız olursa aynı satırlar bir sonraki
+çalışmada yeniden yazılabilir; okuyucu kayıtları id'ye göre tekilleştirir.
+"""
+import gzip
+import json
+import os
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterator, List, Optional
+
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+
+from core.background import PeriodicTask, register
+from core.config import settings
+from db import SessionLocal
+from models import AuditLog
+
+try:
+    import fcntl
+except ImportError:  # Windows geliştirme ortamı
+    fcntl = None
+
+_COLUMNS = (AuditLog.id, AuditLog.user_id, AuditLog.action, AuditLog.details,
+            AuditLog.ip_address, AuditLog.created_at)
+
+
+def partition_path(archive_dir: str, day: date) -> str:
+    return os.path.join(archive_dir, f"{day:%Y}", f"{day:%m}", f"audit-{day:%Y-%m-%d}.jsonl.gz")
+
+
+class _ArchiveLock:
+    """
+    Aynı dizini arşivleyen birden fazla worker sürecini dışlar (flock).
+    Kilit alınamazsa bu çalışma atlanır.
+    """
+
+    def __init__(self, archive_dir: str):
+        self.path = os.path.join(archive_dir, ".lock")
+        self._fh = None
+
+    def __enter__(self) -> bool:
+        if fcntl is None:
+            return True
+        self._fh = open(self.path, "a")
+        try:
+            fcntl.flock(self._fh, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return True
+        except OSError:
+            return False
+
+    def __exit__(self, *exc) -> None:
+        if self._fh is not None:
+            self._fh.close()
+
+
+def _write_chunk(archive_dir: str, rows: List[Dict[str, Any]]) -> None:
+    by_day: Dict[date, List[str]] = {}
+    for row in rows:
+        by_day.setdefault(row["created_at"].date(), []).append(
+            json.dumps({**row, "created_at": row["created_at"].isoformat()}, ensure_ascii=False)
+        )
+    for day, lines in by_day.items():
+        path = partition_path(archive_dir, day)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # "a" kipi yeni bir gzip üyesi ekler; gzip.open tüm üyeleri sırayla okur
+        with gzip.open(path, "at", encoding="utf-8") as fh:
+            fh.write("\n".join(lines) + "\n")
+            fh.flush()
+            os.fsync(fh.fileno())
+
+
+def archive_audit_logs(
+    db: Session,
+    retention_days: int,
+    archive_dir: str,
+    chunk_size: int = 5000,
+) -> int:
+    """
+    Saklama süresini aşan kayıtları arşive taşır. Taşınan kayıt sayısını döndürür.
+    """
+    cutoff = datetime.now() - timedelta(days=retention_days)
+    os.makedirs(archive_dir, exist_ok=True)
+    total = 0
+    with _ArchiveLock(archive_dir) as acquired:
+        if not acquired:
+            return 0
+        last_id = 0
+        while True:
+            rows = [
+                dict(row._mapping)
+                for row in db.execute(
+                    select(*_COLUMNS)
+                    .where(AuditLog.created_at < cutoff, AuditLog.id > last_id)
+                    .order_by(AuditLog.id)
+                    .limit(chunk_size)
+                )
+            ]
+            if not rows:
+                break
+            _write_chunk(archive_dir, rows)
+            ids = [row["id"] for row in rows]
+            db.execute(
+                delete(AuditLog)
+                .where(AuditLog.id.in_(ids))
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+            total += len(ids)
+            last_id = ids[-1]
+            if len(rows) < chunk_size:
+                break
+    return total
+
+
+def _iter_partition(path: str) -> Iterator[Dict[str, Any]]:
+    with gzip.open(path, "rt", encoding="utf-8") as fh:
+        for line in fh:
+            if line.strip():
+                row = json.loads(line)
+                row["created_at"] = datetime.fromisoformat(row["created_at"])
+                yield row
+
+
+def _partition_days(archive_dir: str) -> List[date]:
+    days = []
+    if not os.path.isdir(archive_dir):
+        return days
+    for root, _, files in os.walk(archive_dir):
+        for name in files:
+            if name.startswith("audit-") and name.endswith(".jsonl.gz"):
+                days.append(date.fromisoformat(name[len("audit-"):-len(".jsonl.gz")]))
+    return days
+
+
+def query_archive(
+    archive_dir: str,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    user_id: Optional[int] = None,
+    action: Optional[str] = None,
+    limit: int = 100,
+) -> List[Dict[str, Any]]:
+    """
+    Arşivde filtreye uyan kayıtlar, yeniden eskiye. Yalnızca aralıktaki gün
+    dosyaları açılır ve yeterli kayıt toplanınca daha eski günlere inilmez.
+    """
+    days = sorted(
+        (day for day in _partition_days(archive_dir)
+         if (since is None or day >= since.date()) and (until is None or day <= until.date())),
+        reverse=True,
+    )
+    found: Dict[int, Dict[str, Any]] = {}
+    for day in days:
+        if len(found) >= limit:
+            break
+        for row in _iter_partition(partition_path(archive_dir, day)):
+            if since is not None and row["created_at"] < since:
+                continue
+            if until is not None and row["created_at"] >= until:
+                continue
+            if user_id is not None and row["user_id"] != user_id:
+                continue
+            if action and row["action"] != action:
+                continue
+            found[row["id"]] = row
+    rows = sorted(found.values(), key=lambda row: (row["created_at"], row["id"]), reverse=True)
+    return rows[:limit]
+
+
+def _archive_job() -> None:
+    db = SessionLocal()
+    try:
+        archive_audit_logs(
+            db,
+            retention_days=settings.AUDIT_RETENTION_DAYS,
+            archive_dir=settings.AUDIT_ARCHIVE_DIR,
+            chunk_size=settings.AUDIT_ARCHIVE_CHUNK_SIZE,
+        )
+    finally:
+        db.close()
+
+
+audit_archive_task = register(
+    PeriodicTask("audit-archive", settings.AUDIT_ARCHIVE_INTERVAL_SECONDS, _archive_job)
+)
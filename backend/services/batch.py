@@ -0,0 +1,185 @@
+"""
+/api/batch için alt kaynak kayıt defteri.
+
+Sayfa açılışında ön yüzün ayrı ayrı çağırdığı okuma uç noktaları burada
+ad ile kaydedilir (@batch_resource("ad")). Toplu istek, token'ı bir kez çözer
+ve tüm alt istekleri aynı kimlik ve aynı DB oturumu ile çalıştırır.
+
+SQLAlchemy Session thread-safe olmadığından alt istekler sırayla çalışır;
+çoğu sağlayıcı zaten bellek içi önbellek/indekslerden okur. Bir alt isteğin
+hatası yalnızca kendi sonucunu etkiler.
+"""
+import inspect
+from typing import Annotated, Any, Callable, Dict, List, Optional
+
+from fastapi import HTTPException
+from pydantic import Field, ValidationError, create_model
+from sqlalchemy.orm import Session
+
+from repositories.asset_repo import category_repo
+from repositories.read_models import asset_rows, leave_rows, task_rows, user_rows
+from repositories.user_repo import user_repo
+from repositories.widget_repo import widget_repo
+from schemas import AssetCategoryResponse, UserResponse
+from services.announcement_feed import announcement_feed
+from services.dashboard import build_dashboard
+from services.employee_stats import employee_stats
+from services.org_chart import org_chart
+from services.reminders import reminder_index
+from services.widgets import camel_case, compose, default_layout
+
+BatchProvider = Callable[..., Any]
+
+MANAGER_TYPES = ("manager", "admin")
+
+
+Skip = Annotated[int, Field(ge=0)]
+Limit = Annotated[int, Field(ge=1, le=1000)]
+
+
+class BatchResource:
+    __slots__ = ("name", "func", "params", "model", "superuser")
+
+    def __init__(self, name: str, func: BatchProvider, superuser: bool):
+        self.name = name
+        self.func = func
+        self.superuser = superuser
+        # (db, principal) dışındaki anahtar kelime parametreleri kabul edilir;
+        # değerler uç noktalardaki gibi tip ipuçlarına göre doğrulanır ("10" -> 10, "false" -> False)
+        fields = {
+            param.name: (Any if param.annotation is inspect.Parameter.empty else param.annotation, param.default)
+            for param in list(inspect.signature(func).parameters.values())[2:]
+        }
+        self.params = frozenset(fields)
+        self.model = create_model(f"BatchParams_{name}", **fields) if fields else None
+
+
+BATCH_RESOURCES: Dict[str, BatchResource] = {}
+
+
+def batch_resource(name: str, superuser: bool = False):
+    def decorator(func: BatchProvider) -> BatchProvider:
+        BATCH_RESOURCES[name] = BatchResource(name, func, superuser)
+        return func
+    return decorator
+
+
+def run_one(db: Session, principal: Any, resource: str, params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Tek bir alt isteği çalıştırır; sonucu {"status", "data" | "detail"} olarak döndürür.
+    """
+    spec = BATCH_RESOURCES.get(resource)
+    if spec is None:
+        return {"status": 404, "detail": "Kaynak bulunamadı"}
+    params = params or {}
+    unknown = set(params) - spec.params
+    if unknown:
+        return {"status": 400, "detail": f"Geçersiz parametre: {', '.join(sorted(unknown))}"}
+    if spec.superuser and principal.type not in MANAGER_TYPES:
+        return {"status": 400, "detail": "Kullanıcının yeterli yetkisi yok"}
+    if spec.model is not None:
+        try:
+            params = spec.model(**params).model_dump()
+        except ValidationError as e:
+            fields = sorted({str(error["loc"][0]) for error in e.errors()})
+            return {"status": 422, "detail": f"Geçersiz parametre değeri: {', '.join(fields)}"}
+    try:
+        return {"status": 200, "data": spec.func(db, principal, **params)}
+    except HTTPException as e:
+        db.rollback()
+        return {"status": e.status_code, "detail": e.detail}
+    except Exception as e:
+        # Başarısız alt istek oturumu bozuk bırakmasın; sıradakiler devam eder
+        db.rollback()
+        from logger import log_error
+        log_error(e, f"batch {resource}")
+        return {"status": 500, "detail": "Sunucu hatası"}
+
+
+def run_batch(db: Session, principal: Any, requests: List[Any]) -> List[Dict[str, Any]]:
+    return [
+        {"id": item.id or item.resource, **run_one(db, principal, item.resource, item.params)}
+        for item in requests
+    ]
+
+
+# ---- Kaynaklar ----
+
+@batch_resource("me")
+def _me(db: Session, principal: Any) -> Dict[str, Any]:
+    user = user_repo.get(db, principal.id, profile="list")
+    if user is None:
+        raise HTTPException(status_code=404, detail="Kullanıcı bulunamadı")
+    return UserResponse.model_validate(user).model_dump()
+
+
+@batch_resource("dashboard")
+def _dashboard(db: Session, principal: Any) -> Dict[str, Any]:
+    # GET /api/dashboard/ ile aynı veri; ilişkiler (izin bakiyesi) için tam kullanıcı yüklenir
+    user = user_repo.get(db, principal.id, profile="detail")
+    if user is None:
+        raise HTTPException(status_code=404, detail="Kullanıcı bulunamadı")
+    return build_dashboard(db, user).model_dump()
+
+
+@batch_resource("announcements")
+def _announcements(db: Session, principal: Any, category: Optional[str] = None,
+                   limit: Optional[Limit] = None) -> List[Dict[str, Any]]:
+    return announcement_feed.get(db, category=category, limit=limit)
+
+
+@batch_resource("leave_requests")
+def _leave_requests(db: Session, principal: Any, skip: Skip = 0, limit: Limit = 100) -> List[Dict[str, Any]]:
+    user_id = principal.id if principal.type == "employee" else None
+    return leave_rows(db, user_id=user_id, skip=skip, limit=limit)
+
+
+@batch_resource("tasks")
+def _tasks(db: Session, principal: Any, skip: Skip = 0, limit: Limit = 100) -> List[Dict[str, Any]]:
+    return task_rows(db, user_id=principal.id, skip=skip, limit=limit)
+
+
+@batch_resource("my_assets")
+def _my_assets(db: Session, principal: Any) -> List[Dict[str, Any]]:
+    return asset_rows(db, employee_id=principal.id)
+
+
+@batch_resource("assets")
+def _assets(db: Session, principal: Any) -> List[Dict[str, Any]]:
+    return asset_rows(db)
+
+
+@batch_resource("asset_categories")
+def _asset_categories(db: Session, principal: Any) -> List[Dict[str, Any]]:
+    return [AssetCategoryResponse.model_validate(c).model_dump() for c in category_repo.get_all(db)]
+
+
+@batch_resource("reminders")
+def _reminders(db: Session, principal: Any, days: int = 30) -> Dict[str, Any]:
+    if not 0 <= days <= reminder_index.window_days:
+        raise HTTPException(status_code=400, detail="Geçersiz gün aralığı")
+    reminder_index.ensure_loaded(db)
+    return {"reminders": reminder_index.upcoming(principal.id, days)}
+
+
+@batch_resource("users")
+def _users(db: Session, principal: Any, skip: Skip = 0, limit: Limit = 100) -> List[Dict[str, Any]]:
+    return user_rows(db, skip=skip, limit=limit)
+
+
+@batch_resource("departments")
+def _departments(db: Session, principal: Any) -> List[str]:
+    return sorted(org_chart.get(db).headcount)
+
+
+@batch_resource("employee_stats", superuser=True)
+def _employee_stats(db: Session, principal: Any) -> Dict[str, int]:
+    return employee_stats.snapshot(db)
+
+
+@batch_resource("widgets")
+def _widgets(db: Session, principal: Any, include_data: bool = True) -> List[Dict[str, Any]]:
+    layout = widget_repo.get_layout(db, principal.id) or default_layout()
+    if include_data:
+        layout = compose(db, principal, layout)
+    return camel_case(layout)
@@ -0,0 +1,70 @@
+"""
+Ana sayfa (dashboard) verisi. GET /api/dashboard/ ve /api/batch içindeki
+"dashboard" kaynağı aynı fonksiyonu kullanır.
+"""
+from sqlalchemy.orm import Session
+
+from models import User
+from repositories.leave_repo import leave_repo
+from repositories.task_repo import task_repo
+from repositories.user_repo import user_repo
+from schemas import DashboardData, LeaveBalance, PerformanceMetric
+from services.announcement_feed import announcement_feed
+from services.employee_stats import employee_stats
+
+
+def build_dashboard(db: Session, user: User) -> DashboardData:
+    # Mock Veri Yapısı
+    # Veri Çekme İşlemi
+    
+    # İzin Bakiyesi
+    # İzin İlişkisi Kontrolü
+    lb = user.leave_balance if hasattr(user, 'leave_balance') and user.leave_balance else None
+    leave_balance = LeaveBalance(
+        annual=lb.annual_leave if lb else 0,
+        sick=lb.sick_leave if lb else 0,
+        personal=lb.personal_leave if lb else 0
+    )
+
+    # Görevler
+    tasks = task_repo.get_multi_by_owner(db, user_id=user.id, limit=5)
+    
+    # Performans
+    performance = [
+        PerformanceMetric(label="Verimlilik", value=85, maxValue=100),
+        PerformanceMetric(label="Devamlılık", value=95, maxValue=100)
+    ]
+    
+    # Duyurular
+    announcements = announcement_feed.get(db, limit=10)
+    
+    # İzin Talepleri ve Çalışanlar
+    leave_requests = []
+    employees = []
+    stats = None
+
+    if user.type in ['manager', 'admin', 'assistant_manager', 'boss']:
+        # Yönetici ise tüm izin taleplerini ve çalışanları görebilir
+        leave_requests = leave_repo.get_multi(db, limit=5)
+        # Tüm kullanıcıları çekiyoruz ama sadece tip kontrolü yapıp employee olanları filtreleyebiliriz veya direkt dönebiliriz
+        # Şimdilik user_repo.get_multi kullanıyoruz
+        # Alt sınıf kolonları (departman vb.) selectin ile sabit sayıda sorguda yüklenir
+        all_users = user_repo.get_multi(db, limit=10, profile="detail")
+        employees = all_users # Frontend UserResponse bekliyor, EmployeeResponse UserResponse'dan türüyor
+        
+        # İstatistikler artımlı sayaçlardan (sorgu yok)
+        stats = employee_stats.snapshot(db)
+    else:
+        # Çalışan ise sadece kendi izin taleplerini görür
+        leave_requests = leave_repo.get_by_user(db, user_id=user.id, limit=5)
+
+    return DashboardData(
+        userInfo=user,
+        leaveBalance=leave_balance,
+        pendingTasks=tasks,
+        performance=performance,
+        announcements=announcements,
+        leaveRequests=leave_requests,
+        employees=employees,
+        employeeStats=stats
+    )
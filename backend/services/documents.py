@@ -0,0 +1,209 @@
+"""
+İçerik adresli doküman deposu ve tembel küçük resim (thumbnail) üretimi.
+
+Yüklemeler parça parça geçici dosyaya yazılırken SHA-256 özeti hesaplanır;
+tamamlanınca dosya özetine göre adlandırılmış kalıcı yerine taşınır. Aynı
+içerik ikinci kez yüklenirse diskte yeni kopya oluşturulmaz.
+
+    <DOCUMENT_STORAGE_DIR>/objects/ab/cd/<sha256>
+    <DOCUMENT_STORAGE_DIR>/thumbs/<sha256>_<boyut>.jpg
+    <DOCUMENT_STORAGE_DIR>/tmp/            (yarım kalan yüklemeler)
+    <DOCUMENT_STORAGE_DIR>/locks/<sha256>  (içerik başına kilit dosyası)
+
+Aynı içeriğin yüklenmesi (mevcut nesneyi yeniden kullanma + kayıt) ile
+silinmesi (kayıt silme + son referanssa dosyayı kaldırma) içerik başına
+kilitle sıralanır; aksi halde yükleme, silinmek üzere olan dosyaya
+bağlanabilir.
+"""
+import hashlib
+import os
+import queue
+import tempfile
+import threading
+from contextlib import contextmanager
+from typing import AsyncIterator, Iterator, NamedTuple, Optional, Set
+
+from core.config import settings
+
+try:
+    import fcntl
+except ImportError:  # Windows geliştirme ortamı
+    fcntl = None
+
+try:
+    from PIL import Image  # opsiyonel; yoksa önizleme üretilmez
+except ImportError:
+    Image = None
+
+
+class DocumentTooLarge(Exception):
+    pass
+
+
+class StagedFile(NamedTuple):
+    content_hash: str
+    tmp_path: str
+    size_bytes: int
+
+
+class StoredFile(NamedTuple):
+    content_hash: str
+    file_path: str  # depo köküne göre göreli
+    size_bytes: int
+    created: bool  # False: aynı içerik zaten vardı
+
+
+# fcntl olmayan ortamlarda tek süreç varsayılır
+_local_lock = threading.Lock()
+
+
+class DocumentStore:
+    def __init__(self, root: str, max_bytes: int):
+        self.root = root
+        self.max_bytes = max_bytes
+
+    def object_path(self, content_hash: str) -> str:
+        return os.path.join("objects", content_hash[:2], content_hash[2:4], content_hash)
+
+    def absolute(self, file_path: str) -> str:
+        return os.path.join(self.root, file_path)
+
+    async def stage_stream(self, chunks: AsyncIterator[bytes]) -> StagedFile:
+        """
+        Gövdeyi belleğe almadan geçici dosyaya yazar ve özetini hesaplar.
+        Kalıcı konuma store() taşır; vazgeçilirse discard() çağrılmalıdır.
+        """
+        tmp_dir = os.path.join(self.root, "tmp")
+        os.makedirs(tmp_dir, exist_ok=True)
+        digest = hashlib.sha256()
+        size = 0
+        fd, tmp_path = tempfile.mkstemp(dir=tmp_dir)
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                async for chunk in chunks:
+                    if not chunk:
+                        continue
+                    size += len(chunk)
+                    if size > self.max_bytes:
+                        raise DocumentTooLarge()
+                    digest.update(chunk)
+                    fh.write(chunk)
+        except BaseException:
+            self.discard_path(tmp_path)
+            raise
+        return StagedFile(digest.hexdigest(), tmp_path, size)
+
+    def store(self, staged: StagedFile) -> StoredFile:
+        """
+        Geçici dosyayı içerik adresli konuma taşır; içerik zaten varsa
+        mevcut nesne kullanılır. lock(content_hash) altında çağrılmalıdır.
+        """
+        file_path = self.object_path(staged.content_hash)
+        target = self.absolute(file_path)
+        if os.path.exists(target):
+            self.discard(staged)
+            return StoredFile(staged.content_hash, file_path, staged.size_bytes, created=False)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        os.replace(staged.tmp_path, target)
+        return StoredFile(staged.content_hash, file_path, staged.size_bytes, created=True)
+
+    def discard(self, staged: StagedFile) -> None:
+        self.discard_path(staged.tmp_path)
+
+    @staticmethod
+    def discard_path(tmp_path: str) -> None:
+        try:
+            os.remove(tmp_path)
+        except FileNotFoundError:
+            pass
+
+    @contextmanager
+    def lock(self, content_hash: str) -> Iterator[None]:
+        """
+        İçerik başına süreçler arası kilit (flock). Aynı süreçteki thread'ler
+        dosyayı ayrı açtığından onlar da birbirini bekler.
+        """
+        if fcntl is None:
+            with _local_lock:
+                yield
+            return
+        lock_dir = os.path.join(self.root, "locks")
+        os.makedirs(lock_dir, exist_ok=True)
+        with open(os.path.join(lock_dir, content_hash), "a") as fh:
+            fcntl.flock(fh, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(fh, fcntl.LOCK_UN)
+
+    def delete(self, file_path: str) -> None:
+        try:
+            os.remove(self.absolute(file_path))
+        except FileNotFoundError:
+            pass
+
+
+class ThumbnailWorker:
+    """
+    Küçük resimleri ilk istendiklerinde tek bir arka plan thread'inde üretir.
+    İstek beklemez; üretim bitene kadar "pending" döner.
+    """
+    READY, PENDING, UNSUPPORTED = "ready", "pending", "unsupported"
+
+    def __init__(self, store: DocumentStore, size: int):
+        self.store = store
+        self.size = size
+        self._queue: "queue.Queue[tuple]" = queue.Queue()
+        self._pending: Set[str] = set()
+        self._failed: Set[str] = set()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def thumbnail_path(self, content_hash: str) -> str:
+        return os.path.join(self.store.root, "thumbs", f"{content_hash}_{self.size}.jpg")
+
+    def request(self, content_hash: str, file_path: str, content_type: Optional[str]) -> str:
+        if os.path.exists(self.thumbnail_path(content_hash)):
+            return self.READY
+        if Image is None or not (content_type or "").startswith("image/"):
+            return self.UNSUPPORTED
+        with self._lock:
+            if content_hash in self._failed:
+                return self.UNSUPPORTED
+            if content_hash not in self._pending:
+                self._pending.add(content_hash)
+                self._queue.put((content_hash, file_path))
+                self._ensure_thread()
+        return self.PENDING
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="document-thumbnails", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            content_hash, file_path = self._queue.get()
+            try:
+                self._render(content_hash, file_path)
+            except Exception as e:
+                with self._lock:
+                    self._failed.add(content_hash)
+                from logger import log_error
+                log_error(e, "document thumbnail")
+            finally:
+                with self._lock:
+                    self._pending.discard(content_hash)
+
+    def _render(self, content_hash: str, file_path: str) -> None:
+        target = self.thumbnail_path(content_hash)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        with Image.open(self.store.absolute(file_path)) as image:
+            image.thumbnail((self.size, self.size))
+            tmp_path = target + ".tmp"
+            image.convert("RGB").save(tmp_path, "JPEG", quality=80)
+        os.replace(tmp_path, target)
+
+
+document_store = DocumentStore(settings.DOCUMENT_STORAGE_DIR, settings.DOCUMENT_MAX_BYTES)
+thumbnail_worker = ThumbnailWorker(document_store, settings.DOCUMENT_THUMBNAIL_SIZE)
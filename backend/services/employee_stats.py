@@ -0,0 +1,224 @@
+"""
+Çalışan istatistikleri (/api/employees/stats) için artımlı sayaçlar.
+
+Sayaçlar yazma yollarından (çalışan oluşturma, izin onayı ve geri alınması,
+doküman yükleme ve inceleme) güncellenir; okuma sorgu çalıştırmaz. Zamanla değişen değerler
+(izindekiler, yeni başlayanlar) bitiş/başlangıç günlerine göre sıralı
+heap'lerde tutulur ve okumada yalnızca süresi dolan kayıtlar düşülür.
+
+Tüm sayaçlar EMPLOYEE_STATS_RECONCILE_SECONDS aralıklarla SQL COUNT
+sorgularıyla yeniden hesaplanır. Bu, diğer worker süreçlerinin yazmalarını
+ve olay kancası olmayan değişiklikleri (ör. doğrudan veritabanı
+güncellemeleri) en geç bu süre sonunda yansıtır.
+"""
+import heapq
+import threading
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from core.background import PeriodicTask, register
+from core.config import settings
+from core.db_routing import use_primary
+from db import SessionLocal
+from models import Document, Employee, LeaveRequest, User
+
+
+def _day(value) -> date:
+    return value.date() if isinstance(value, datetime) else value
+
+
+class EmployeeStats:
+    def __init__(self, onboarding_days: int):
+        self.onboarding_days = onboarding_days
+        self._lock = threading.Lock()
+        self._loaded = False
+        self.reconciled_at: Optional[datetime] = None
+        self._total = 0
+        self._pending_documents = 0
+        # İzindekiler: kullanıcı -> bugün süren onaylı izin sayısı
+        self._on_leave: Dict[int, int] = {}
+        self._leave_ends: List[Tuple[date, int]] = []          # (bitiş günü, kullanıcı)
+        self._leave_starts: List[Tuple[date, date, int]] = []  # ileri tarihli: (başlangıç, bitiş, kullanıcı)
+        # Yeni başlayanlar: kullanıcı -> pencereden çıkış günü
+        self._onboarding: Dict[int, date] = {}
+        self._onboarding_ends: List[Tuple[date, int]] = []
+
+    # ---- Okuma ----
+
+    def snapshot(self, db: Session) -> Dict[str, int]:
+        if not self._loaded:
+            # İstek içinden ilk yükleme replikaya değil birincile gider
+            with use_primary():
+                self.reconcile(db)
+        with self._lock:
+            self._advance(date.today())
+            return {
+                "totalEmployees": self._total,
+                "onLeave": len(self._on_leave),
+                "pendingDocuments": self._pending_documents,
+                "onboarding": len(self._onboarding),
+            }
+
+    def _advance(self, today: date) -> None:
+        """
+        Başlangıç günü gelen izinleri etkinleştirir, süresi dolanları düşer.
+        """
+        while self._leave_starts and self._leave_starts[0][0] <= today:
+            _, end, user_id = heapq.heappop(self._leave_starts)
+            self._add_active_leave(end, user_id, today)
+        while self._leave_ends and self._leave_ends[0][0] < today:
+            _, user_id = heapq.heappop(self._leave_ends)
+            remaining = self._on_leave.get(user_id, 0) - 1
+            if remaining > 0:
+                self._on_leave[user_id] = remaining
+            else:
+                self._on_leave.pop(user_id, None)
+        while self._onboarding_ends and self._onboarding_ends[0][0] <= today:
+            until, user_id = heapq.heappop(self._onboarding_ends)
+            if self._onboarding.get(user_id) == until:
+                del self._onboarding[user_id]
+
+    def _add_active_leave(self, end: date, user_id: int, today: date) -> None:
+        if end < today:
+            return
+        self._on_leave[user_id] = self._on_leave.get(user_id, 0) + 1
+        heapq.heappush(self._leave_ends, (end, user_id))
+
+    def _add_leave(self, start, end, user_id: int, today: date) -> None:
+        start, end = _day(start), _day(end)
+        if start > today:
+            heapq.heappush(self._leave_starts, (start, end, user_id))
+        else:
+            self._add_active_leave(end, user_id, today)
+
+    def _remove_leave(self, start: date, end: date, user_id: int, today: date) -> None:
+        if start > today:
+            entry = (start, end, user_id)
+            if entry in self._leave_starts:
+                self._leave_starts.remove(entry)
+                heapq.heapify(self._leave_starts)
+            return
+        entry = (end, user_id)
+        if end < today or entry not in self._leave_ends:
+            return
+        self._leave_ends.remove(entry)
+        heapq.heapify(self._leave_ends)
+        remaining = self._on_leave.get(user_id, 0) - 1
+        if remaining > 0:
+            self._on_leave[user_id] = remaining
+        else:
+            self._on_leave.pop(user_id, None)
+
+    def _add_onboarding(self, user_id: int, start_date, today: date) -> None:
+        if start_date is None:
+            return
+        until = _day(start_date) + timedelta(days=self.onboarding_days)
+        if until > today:
+            self._onboarding[user_id] = until
+            heapq.heappush(self._onboarding_ends, (until, user_id))
+
+    # ---- Yazma yollarından çağrılan olaylar ----
+
+    def employee_created(self, user_id: int, is_active: bool = True, start_date=None) -> None:
+        if not self._loaded or not is_active:
+            return
+        with self._lock:
+            self._total += 1
+            self._add_onboarding(user_id, start_date, date.today())
+
+    def employee_deactivated(self, user_id: int) -> None:
+        if not self._loaded:
+            return
+        with self._lock:
+            self._total -= 1
+            self._onboarding.pop(user_id, None)
+
+    def leave_approved(self, user_id: int, start_date, end_date) -> None:
+        if not self._loaded:
+            return
+        with self._lock:
+            self._add_leave(start_date, end_date, user_id, date.today())
+
+    def leave_revoked(self, user_id: int, start_date, end_date) -> None:
+        """Onaylı izin yeniden beklemeye alındı; leave_approved'un tersi."""
+        if not self._loaded:
+            return
+        with self._lock:
+            self._remove_leave(_day(start_date), _day(end_date), user_id, date.today())
+
+    def document_uploaded(self) -> None:
+        self._adjust_documents(1)
+
+    def document_resolved(self) -> None:
+        """Bekleyen bir doküman onaylandı, reddedildi veya silindi."""
+        self._adjust_documents(-1)
+
+    def _adjust_documents(self, delta: int) -> None:
+        if not self._loaded:
+            return
+        with self._lock:
+            self._pending_documents = max(0, self._pending_documents + delta)
+
+    # ---- Mutabakat ----
+
+    def reconcile(self, db: Session) -> None:
+        """
+        Tüm sayaçları SQL'den yeniden hesaplar ve atomik olarak değiştirir.
+        """
+        today = date.today()
+        today_start = datetime.combine(today, datetime.min.time())
+        onboarding_since = today_start - timedelta(days=self.onboarding_days - 1)
+
+        total = db.execute(
+            select(func.count(User.id)).where(User.is_active.is_(True))
+        ).scalar_one()
+        pending_documents = db.execute(
+            select(func.count(Document.id)).where(Document.status == "pending")
+        ).scalar_one()
+        # (status, start_date, end_date) indeksiyle yalnızca bitmemiş onaylı izinler
+        leaves = db.execute(
+            select(LeaveRequest.user_id, LeaveRequest.start_date, LeaveRequest.end_date)
+            .where(LeaveRequest.status == "approved", LeaveRequest.end_date >= today_start)
+        ).all()
+        newcomers = db.execute(
+            select(Employee.id, Employee.start_date)
+            .where(Employee.is_active.is_(True), Employee.start_date >= onboarding_since)
+        ).all()
+
+        fresh = EmployeeStats(self.onboarding_days)
+        fresh._total = total
+        fresh._pending_documents = pending_documents
+        for row in leaves:
+            fresh._add_leave(row.start_date, row.end_date, row.user_id, today)
+        for row in newcomers:
+            fresh._add_onboarding(row.id, row.start_date, today)
+
+        with self._lock:
+            self._total = fresh._total
+            self._pending_documents = fresh._pending_documents
+            self._on_leave = fresh._on_leave
+            self._leave_ends = fresh._leave_ends
+            self._leave_starts = fresh._leave_starts
+            self._onboarding = fresh._onboarding
+            self._onboarding_ends = fresh._onboarding_ends
+            self._loaded = True
+            self.reconciled_at = datetime.now()
+
+
+employee_stats = EmployeeStats(onboarding_days=settings.EMPLOYEE_ONBOARDING_DAYS)
+
+
+def _reconcile_job() -> None:
+    db = SessionLocal()
+    try:
+        employee_stats.reconcile(db)
+    finally:
+        db.close()
+
+
+employee_stats_task = register(
+    PeriodicTask("employee-stats-reconcile", settings.EMPLOYEE_STATS_RECONCILE_SECONDS, _reconcile_job)
+)
@@ -0,0 +1,26 @@
+from typing import Iterable
+
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+from models import Notification, User
+
+# Hedefi belirtilmemiş (sistem) bildirimlerini alan kullanıcı tipleri
+MANAGER_TYPES = ("manager", "admin")
+
+
+def notify(db: Session, user_ids: Iterable[int], title: str, message: str) -> int:
+    """
+    Kullanıcılara tek bir çok satırlı INSERT ile bildirim ekler (commit çağırana aittir).
+    """
+    rows = [{"user_id": user_id, "title": title[:100], "message": message, "is_read": False}
+            for user_id in dict.fromkeys(user_ids)]
+    if rows:
+        db.execute(insert(Notification).values(rows))
+    return len(rows)
+
+
+def manager_ids(db: Session) -> list:
+    return list(db.execute(
+        select(User.id).where(User.type.in_(MANAGER_TYPES), User.is_active.is_(True))
+    ).scalars())
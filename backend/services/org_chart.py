@@ -0,0 +1,121 @@
+"""
+Departman dizini ve organizasyon şeması.
+
+Kullanıcılar, departmanları ve yönetici bağlantıları tek sorguyla yüklenip
+bellekte komşuluk listesine (yönetici -> doğrudan bağlılar) çevrilir.
+"X yöneticisinin altındaki herkes" ve departman başına kişi sayısı bu
+yapıdan seviye başına sorgu olmadan cevaplanır. Çalışan yazmalarında
+invalidate() çağrılır; diğer worker'lar için ORG_CHART_TTL_SECONDS bayatlığı sınırlar.
+"""
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from core.db_routing import use_primary
+from repositories.read_models import org_rows
+
+
+class OrgSnapshot:
+    def __init__(self, rows: List[Dict[str, Any]]):
+        self.people: Dict[int, Dict[str, Any]] = {row["id"]: row for row in rows}
+        self.children: Dict[int, List[int]] = {}
+        self.headcount: Dict[str, int] = {}
+        for row in rows:
+            manager_id = row["manager_id"]
+            if manager_id is not None and manager_id in self.people and manager_id != row["id"]:
+                self.children.setdefault(manager_id, []).append(row["id"])
+            department = (row["department"] or "").strip()
+            if department and row["is_active"]:
+                self.headcount[department] = self.headcount.get(department, 0) + 1
+        for ids in self.children.values():
+            ids.sort(key=lambda person_id: self.people[person_id]["full_name"] or "")
+
+    def reports_under(self, manager_id: int, direct_only: bool = False) -> List[Dict[str, Any]]:
+        """
+        Yöneticiye doğrudan veya dolaylı bağlı kişiler (BFS, seviye sırasıyla).
+        Hatalı verideki döngüler ziyaret kümesiyle kırılır.
+        """
+        result = []
+        seen = {manager_id}
+        queue = deque((child, 1) for child in self.children.get(manager_id, ()))
+        while queue:
+            person_id, depth = queue.popleft()
+            if person_id in seen:
+                continue
+            seen.add(person_id)
+            result.append({**self._node(person_id), "manager_id": self.people[person_id]["manager_id"],
+                           "depth": depth})
+            if not direct_only:
+                queue.extend((child, depth + 1) for child in self.children.get(person_id, ()))
+        return result
+
+    def tree(self, root_id: Optional[int] = None, max_depth: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        İç içe şema. root_id yoksa yöneticisi olmayan herkes köktür.
+        """
+        if root_id is not None:
+            roots = [root_id] if root_id in self.people else []
+        else:
+            linked = {child for ids in self.children.values() for child in ids}
+            roots = sorted((pid for pid in self.people if pid not in linked),
+                           key=lambda pid: self.people[pid]["full_name"] or "")
+
+        seen = set()
+        forest = []
+        stack = []
+        for person_id in reversed(roots):
+            node = {**self._node(person_id), "children": []}
+            forest.append(node)
+            stack.append((person_id, node, 0))
+        forest.reverse()
+        while stack:
+            person_id, node, depth = stack.pop()
+            seen.add(person_id)
+            if max_depth is not None and depth >= max_depth:
+                continue
+            for child_id in self.children.get(person_id, ()):
+                if child_id in seen:
+                    continue
+                child = {**self._node(child_id), "children": []}
+                node["children"].append(child)
+                stack.append((child_id, child, depth + 1))
+        return forest
+
+    def _node(self, person_id: int) -> Dict[str, Any]:
+        row = self.people[person_id]
+        return {"id": row["id"], "full_name": row["full_name"], "type": row["type"],
+                "department": row["department"], "is_active": row["is_active"]}
+
+
+class OrgChartCache:
+    def __init__(self, ttl_seconds: int):
+        self.ttl_seconds = ttl_seconds
+        self._snapshot: Optional[OrgSnapshot] = None
+        self._loaded_at = 0.0
+        self._version = 0
+        self._lock = threading.Lock()
+
+    def get(self, db: Session) -> OrgSnapshot:
+        snapshot = self._snapshot
+        if snapshot is None or time.monotonic() - self._loaded_at > self.ttl_seconds:
+            version = self._version
+            # Önbellek birincilden doldurulur (replika gecikmesi önbellekte kalıcılaşmasın)
+            with use_primary():
+                snapshot = OrgSnapshot(org_rows(db))
+            with self._lock:
+                if version == self._version:
+                    self._snapshot = snapshot
+                    self._loaded_at = time.monotonic()
+        return snapshot
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._version += 1
+            self._snapshot = None
+
+
+org_chart = OrgChartCache(ttl_seconds=settings.ORG_CHART_TTL_SECONDS)
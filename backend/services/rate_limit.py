@@ -0,0 +1,139 @@
+"""
+Giriş denemeleri için kayan pencereli (sliding window) hız sınırlayıcı.
+
+Her anahtar (IP veya kullanıcı adı) için pencere içindeki olay zamanları
+en fazla `limit` uzunluğunda bir deque'da tutulur; bellek kullanımı anahtar
+başına sabittir. Şimdilik yalnızca süreç içi backend vardır; çoklu
+worker/sunucuda sayaçları paylaşmak için SlidingWindowBackend'i uygulayan
+bir backend (ör. Redis: anahtar başına sıralı küme, ZADD now,
+ZREMRANGEBYSCORE -inf now-window, ZCARD, EXPIRE window tek pipeline içinde)
+_make_backend'e eklenmelidir.
+"""
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, Optional
+
+from core.config import settings
+
+
+class SlidingWindowBackend:
+    """
+    Backend arayüzü. Tüm süreler saniye cinsindendir.
+    """
+
+    def hit(self, key: str, limit: int, window: float) -> None:
+        """Pencereye bir olay ekler."""
+        raise NotImplementedError
+
+    def retry_after(self, key: str, limit: int, window: float) -> Optional[float]:
+        """Pencere doluysa yeniden denemeye kalan süre, değilse None."""
+        raise NotImplementedError
+
+    def reset(self, key: str) -> None:
+        raise NotImplementedError
+
+
+class MemorySlidingWindow(SlidingWindowBackend):
+    """
+    Süreç içi backend. Boşalan anahtarlar SWEEP_EVERY işlemde bir temizlenir.
+    """
+    SWEEP_EVERY = 1024
+
+    def __init__(self):
+        self._events: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+        self._ops = 0
+
+    def hit(self, key: str, limit: int, window: float) -> None:
+        now = time.monotonic()
+        with self._lock:
+            events = self._events.get(key)
+            if events is None or events.maxlen != limit:
+                events = self._events[key] = deque(events or (), maxlen=limit)
+            events.append(now)
+            self._ops += 1
+            if self._ops % self.SWEEP_EVERY == 0:
+                self._sweep(now, window)
+
+    def retry_after(self, key: str, limit: int, window: float) -> Optional[float]:
+        now = time.monotonic()
+        with self._lock:
+            events = self._events.get(key)
+            if not events:
+                return None
+            while events and events[0] <= now - window:
+                events.popleft()
+            if len(events) < limit:
+                return None
+            return events[0] + window - now
+
+    def reset(self, key: str) -> None:
+        with self._lock:
+            self._events.pop(key, None)
+
+    def _sweep(self, now: float, window: float) -> None:
+        stale = [key for key, events in self._events.items() if not events or events[-1] <= now - window]
+        for key in stale:
+            del self._events[key]
+
+
+class LoginRateLimiter:
+    """
+    /login için iki sınır, ikisi de yalnızca başarısız denemeleri sayar:
+    - IP başına (LOGIN_RATE_LIMIT_IP_ATTEMPTS / pencere),
+    - kullanıcı adı başına (LOGIN_RATE_LIMIT_USER_FAILURES / pencere).
+    Başarılı girişler sayılmaz; tek NAT IP'si arkasındaki bir ofis sabah
+    girişlerinde sınıra takılmaz.
+
+    check() şifre doğrulamasından önce çağrılır; sınır aşılmışsa bcrypt'e
+    hiç gidilmez.
+    """
+
+    def __init__(self, backend: SlidingWindowBackend, ip_limit: int, user_limit: int, window_seconds: int):
+        self.backend = backend
+        self.ip_limit = ip_limit
+        self.user_limit = user_limit
+        self.window = window_seconds
+
+    @staticmethod
+    def _user_key(username: str) -> str:
+        return "user:" + username.strip().lower()
+
+    @staticmethod
+    def _ip_key(ip: Optional[str]) -> str:
+        return "ip:" + (ip or "unknown")
+
+    def check(self, ip: Optional[str], username: str) -> Optional[float]:
+        """
+        Deneme yapılabiliyorsa None, aksi halde bekleme süresini döndürür.
+        """
+        wait = self.backend.retry_after(self._ip_key(ip), self.ip_limit, self.window)
+        if wait is None:
+            wait = self.backend.retry_after(self._user_key(username), self.user_limit, self.window)
+        return wait
+
+    def register_failure(self, ip: Optional[str], username: str) -> None:
+        self.backend.hit(self._ip_key(ip), self.ip_limit, self.window)
+        self.backend.hit(self._user_key(username), self.user_limit, self.window)
+
+    def register_success(self, username: str) -> None:
+        self.backend.reset(self._user_key(username))
+
+
+def _make_backend() -> SlidingWindowBackend:
+    # Paylaşılan backend henüz yok; URL verilmişse her /login'de değil açılışta hata verilir
+    if settings.LOGIN_RATE_LIMIT_BACKEND_URL:
+        raise RuntimeError(
+            f"Paylaşılan hız sınırı backend'i desteklenmiyor: {settings.LOGIN_RATE_LIMIT_BACKEND_URL} "
+            "(LOGIN_RATE_LIMIT_BACKEND_URL boş bırakılmalı)"
+        )
+    return MemorySlidingWindow()
+
+
+login_limiter = LoginRateLimiter(
+    _make_backend(),
+    ip_limit=settings.LOGIN_RATE_LIMIT_IP_ATTEMPTS,
+    user_limit=settings.LOGIN_RATE_LIMIT_USER_FAILURES,
+    window_seconds=settings.LOGIN_RATE_LIMIT_WINDOW_SECONDS,
+)
@@ -0,0 +1,274 @@
+"""
+Hatırlatıcılar için bellek içi zaman indeksi ve bildirim zamanlayıcısı.
+
+İndeks, [şimdi - REMINDER_CATCHUP_HOURS, şimdi + REMINDER_INDEX_DAYS] aralığındaki
+hatırlatıcıları gün kovalarında tutar; "yaklaşan" sorguları ilgili kovaları
+okur, tabloya gitmez. Henüz tetiklenmemiş hatırlatıcılar ayrıca (zaman, id)
+min-heap'inde durur.
+
+Zamanlayıcı thread'i tabloyu saniyede bir yoklamaz: heap'in başındaki zamana
+kadar (en fazla REMINDER_INDEX_REFRESH_SECONDS) uyur; yeni ve daha erken bir
+hatırlatıcı eklenince uyandırılır. İndeks bu aralıkla DB'den tazelenir, böylece
+diğer worker'larda eklenenler de görülür. Tetikleme "fired_at IS NULL" koşullu
+UPDATE ile sahiplenilir; birden fazla worker aynı hatırlatıcıyı yalnızca bir
+kez bildirir.
+"""
+import heapq
+import threading
+import time
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from core.db_routing import use_primary
+from db import SessionLocal
+from models import Reminder
+from services.notifications import manager_ids, notify
+
+REMINDER_FIELDS = ("id", "title", "date", "type", "priority", "user_id")
+
+
+def _entry(reminder: Any) -> Dict[str, Any]:
+    return {field: getattr(reminder, field) for field in REMINDER_FIELDS}
+
+
+class ReminderIndex:
+    """
+    Gün kovaları (tarih -> {id: kayıt}) ve tetiklenmemişler için heap.
+    """
+
+    def __init__(self, window_days: int, catchup_hours: int, refresh_seconds: int):
+        self.window_days = window_days
+        self.catchup_hours = catchup_hours
+        self.refresh_seconds = refresh_seconds
+        self._buckets: Dict[date, Dict[int, Dict[str, Any]]] = {}
+        self._by_id: Dict[int, Dict[str, Any]] = {}
+        self._heap: List[Tuple[datetime, int]] = []
+        self._pending: Dict[int, datetime] = {}
+        self._loaded_at = 0.0
+        self._lock = threading.RLock()
+
+    def _window(self) -> Tuple[datetime, datetime]:
+        now = datetime.now()
+        return now - timedelta(hours=self.catchup_hours), now + timedelta(days=self.window_days)
+
+    def refresh(self, db: Session) -> None:
+        start, end = self._window()
+        rows = db.execute(
+            select(Reminder.id, Reminder.title, Reminder.date, Reminder.type, Reminder.priority,
+                   Reminder.user_id, Reminder.fired_at)
+            .where(Reminder.date >= start, Reminder.date < end)
+        ).all()
+        with self._lock:
+            self._buckets = {}
+            self._by_id = {}
+            self._pending = {}
+            for row in rows:
+                self._add_locked(_entry(row), pending=row.fired_at is None)
+            self._heap = [(due, id) for id, due in self._pending.items()]
+            heapq.heapify(self._heap)
+            self._loaded_at = time.monotonic()
+
+    def is_stale(self) -> bool:
+        return time.monotonic() - self._loaded_at > self.refresh_seconds
+
+    def ensure_loaded(self, db: Session) -> None:
+        if not self._loaded_at:
+            with self._lock:
+                if not self._loaded_at:
+                    # İndeks zamanlayıcıyla paylaşılır; replikadan değil birincilden yüklenir
+                    with use_primary():
+                        self.refresh(db)
+
+    def _add_locked(self, entry: Dict[str, Any], pending: bool) -> None:
+        self._by_id[entry["id"]] = entry
+        self._buckets.setdefault(entry["date"].date(), {})[entry["id"]] = entry
+        if pending:
+            self._pending[entry["id"]] = entry["date"]
+
+    def add(self, reminder: Reminder) -> bool:
+        """
+        Pencere içindeyse indekse ekler. Heap'in başına geçtiyse True döner.
+        """
+        start, end = self._window()
+        if not (start <= reminder.date < end):
+            return False
+        with self._lock:
+            self._remove_locked(reminder.id)
+            self._add_locked(_entry(reminder), pending=reminder.fired_at is None)
+            if reminder.fired_at is not None:
+                return False
+            heapq.heappush(self._heap, (reminder.date, reminder.id))
+            return self._heap[0][1] == reminder.id
+
+    def remove(self, reminder_id: int) -> None:
+        with self._lock:
+            self._remove_locked(reminder_id)
+
+    def _remove_locked(self, reminder_id: int) -> None:
+        # Heap'teki kayıt tembel olarak atılır (pop sırasında _pending'de yoksa)
+        self._pending.pop(reminder_id, None)
+        entry = self._by_id.pop(reminder_id, None)
+        if entry is not None:
+            bucket = self._buckets.get(entry["date"].date())
+            if bucket is not None:
+                bucket.pop(reminder_id, None)
+                if not bucket:
+                    del self._buckets[entry["date"].date()]
+
+    def next_due(self) -> Optional[datetime]:
+        with self._lock:
+            while self._heap:
+                due, id = self._heap[0]
+                if self._pending.get(id) == due:
+                    return due
+                heapq.heappop(self._heap)
+            return None
+
+    def pop_due(self, now: datetime) -> List[Dict[str, Any]]:
+        due = []
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                when, id = heapq.heappop(self._heap)
+                if self._pending.get(id) == when:
+                    del self._pending[id]
+                    due.append(self._by_id[id])
+        return due
+
+    def upcoming(self, user_id: int, days: int) -> List[Dict[str, Any]]:
+        """
+        Bugünden itibaren `days` gün içindeki, kullanıcıya ait veya herkese açık
+        (user_id boş) hatırlatıcılar; tarihe göre sıralı.
+        """
+        today = date.today()
+        result = []
+        with self._lock:
+            for offset in range(min(days, self.window_days) + 1):
+                bucket = self._buckets.get(today + timedelta(days=offset))
+                if bucket:
+                    result.extend(e for e in bucket.values() if e["user_id"] in (None, user_id))
+        result.sort(key=lambda e: (e["date"], e["id"]))
+        return result
+
+
+class ReminderScheduler:
+    """
+    Vadesi gelen hatırlatıcıları bildirimlere çeviren daemon thread.
+    """
+
+    def __init__(self, index: ReminderIndex, session_factory):
+        self.index = index
+        self.session_factory = session_factory
+        self._cond = threading.Condition()
+        self._stop = False
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self.fired = 0
+
+    def start(self) -> None:
+        """
+        İdempotent; worker açılışında main.start_worker_services çağırır
+        (lifespan ve passenger_wsgi).
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop = False
+            self._thread = threading.Thread(target=self._run, name="reminder-scheduler", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        with self._cond:
+            self._stop = True
+            self._cond.notify()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        self._thread = None
+
+    def wake(self) -> None:
+        with self._cond:
+            self._cond.notify()
+
+    def _timeout(self) -> float:
+        timeout = self.index.refresh_seconds - (time.monotonic() - self.index._loaded_at)
+        due = self.index.next_due()
+        if due is not None:
+            timeout = min(timeout, (due - datetime.now()).total_seconds())
+        return max(timeout, 0.0)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                if self._stop:
+                    return
+                self._cond.wait(self._timeout())
+                if self._stop:
+                    return
+            try:
+                self.tick()
+            except Exception as e:
+                from logger import log_error
+                log_error(e, "reminder scheduler")
+                # Hata döngüsünde CPU'yu yakmamak için kısa bekleme
+                time.sleep(1)
+
+    def tick(self) -> int:
+        """
+        Gerekirse indeksi tazeler ve vadesi gelenleri tetikler.
+        """
+        db = self.session_factory()
+        try:
+            if self.index.is_stale():
+                self.index.refresh(db)
+            due = self.index.pop_due(datetime.now())
+            return self.fire(db, due) if due else 0
+        finally:
+            db.close()
+
+    def fire(self, db: Session, due: List[Dict[str, Any]]) -> int:
+        managers: Optional[List[int]] = None
+        fired = 0
+        for entry in due:
+            claimed = db.execute(
+                update(Reminder)
+                .where(Reminder.id == entry["id"], Reminder.fired_at.is_(None))
+                .values(fired_at=datetime.now())
+                .execution_options(synchronize_session=False)
+            ).rowcount
+            if not claimed:
+                # Başka bir worker tetiklemiş
+                continue
+            if entry["user_id"] is not None:
+                recipients = [entry["user_id"]]
+            else:
+                if managers is None:
+                    managers = manager_ids(db)
+                recipients = managers
+            notify(db, recipients, "Hatırlatıcı", entry["title"])
+            fired += 1
+        db.commit()
+        self.fired += fired
+        return fired
+
+
+reminder_index = ReminderIndex(
+    window_days=settings.REMINDER_INDEX_DAYS,
+    catchup_hours=settings.REMINDER_CATCHUP_HOURS,
+    refresh_seconds=settings.REMINDER_INDEX_REFRESH_SECONDS,
+)
+reminder_scheduler = ReminderScheduler(reminder_index, SessionLocal)
+
+
+def reminder_added(reminder: Reminder) -> None:
+    if reminder_index.add(reminder):
+        reminder_scheduler.wake()
+
+
+def reminder_removed(reminder_id: int) -> None:
+    reminder_index.remove(reminder_id)
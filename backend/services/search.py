@@ -0,0 +1,331 @@
+"""
+Süreç içi (in-process) arama indeksi: çalışanlar, demirbaşlar ve duyurular.
+
+Metinler Türkçe'ye uygun biçimde normalize edilir (İ/ı/I/i -> i, ş -> s,
+ğ -> g, ü -> u, ö -> o, ç -> c) ve her kelimenin 3-gram'ları ile 1-2 harflik
+önekleri ters indekse (posting list) eklenir. Sorgu, en kısa posting
+listesinden başlayarak kesişim alır ve adayları normalize metin üzerinde
+doğrular; tablo taraması (LIKE '%x%') yapılmaz.
+
+Büyük posting listeleri ayrıca sonuç sırasına (başlık uzunluğu, anahtar)
+göre sıralı tutulur. Arama bu sırayla ilerler ve `limit` adet tam puanlı
+sonuç bulunca durur; puanlanan aday sayısı SEARCH_MAX_SCORED_CANDIDATES ile
+sınırlıdır. Böylece "m" gibi binlerce eşleşmeli sorgular da sabit sürede biter.
+"""
+import bisect
+import heapq
+import re
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from core.db_routing import use_primary
+from models import User, EmployeeAsset, Announcement
+
+DocKey = Tuple[str, int]
+
+_FOLD = str.maketrans({
+    "ı": "i", "ş": "s", "ğ": "g", "ü": "u", "ö": "o", "ç": "c",
+    "â": "a", "î": "i", "û": "u",
+})
+_NON_WORD = re.compile(r"[^0-9a-z]+")
+
+
+def normalize(text: Optional[str]) -> str:
+    """
+    Türkçe büyük/küçük harf kurallarıyla küçültür ve aksanları katlar.
+    """
+    if not text:
+        return ""
+    # Türkçe'de "I" -> "ı" ve "İ" -> "i"; ikisi de sonunda "i"ye katlanır
+    text = text.replace("İ", "i").replace("I", "ı").lower().translate(_FOLD)
+    return _NON_WORD.sub(" ", text).strip()
+
+
+def _grams(token: str) -> Set[str]:
+    grams = {"^" + token[:1], "^" + token[:2]}
+    for i in range(len(token) - 2):
+        grams.add(token[i:i + 3])
+    return grams
+
+
+def _query_grams(token: str) -> Set[str]:
+    if len(token) < 3:
+        return {"^" + token}
+    return {token[i:i + 3] for i in range(len(token) - 2)}
+
+
+# Bu boyutun altındaki posting listeleri sıralı tutulmaz; tamamı puanlanır
+RANKED_POSTING_MIN = 256
+
+RankedEntry = Tuple[int, DocKey]  # (başlık uzunluğu, anahtar): sonuç sırasındaki ikincil anahtarlar
+
+
+class SearchIndex:
+    """
+    Thread-safe n-gram ters indeksi.
+
+    Yazmalar yapıldığı worker'da indekse hemen işlenir; diğer worker'lar için
+    indeks ttl_seconds sonra arka planda yeniden kurulur (bayat indeks bu
+    sırada hizmet vermeye devam eder).
+    """
+
+    def __init__(self, ttl_seconds: Optional[int] = None, max_scored: Optional[int] = None):
+        self.ttl_seconds = ttl_seconds
+        self.max_scored = max_scored
+        self._built_at = 0.0
+        self._docs: Dict[DocKey, Dict] = {}
+        self._postings: Dict[str, Set[DocKey]] = {}
+        # Büyük posting listelerinin sonuç sırasına göre sıralı kopyaları
+        self._ranked: Dict[str, List[RankedEntry]] = {}
+        self._lock = threading.RLock()
+        self.ready = threading.Event()
+        self.rebuild_ms: Optional[float] = None
+        self._rebuilding = False
+        # Yeniden kurulum sürerken gelen yazmalar; yeni indekse yeniden uygulanır
+        self._journal: Optional[List[Tuple]] = None
+        # Aynı anda tek yeniden kurulum (açılıştaki arka plan kurulumu ve ilk aramalar)
+        self._rebuild_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def upsert(self, kind: str, id: int, title: str, subtitle: Optional[str] = None,
+               text: Optional[str] = None) -> None:
+        key = (kind, id)
+        norm = normalize(" ".join(filter(None, (title, subtitle, text))))
+        tokens = norm.split()
+        grams: Set[str] = set()
+        for token in tokens:
+            grams |= _grams(token)
+
+        with self._lock:
+            if self._journal is not None:
+                self._journal.append(("upsert", kind, id, title, subtitle, text))
+            self._remove_locked(key)
+            entry = (len(title or ""), key)
+            self._docs[key] = {
+                "type": kind, "id": id, "title": title, "subtitle": subtitle,
+                "norm": norm, "tokens": tokens, "grams": grams, "rank": entry,
+            }
+            for gram in grams:
+                self._postings.setdefault(gram, set()).add(key)
+                ranked = self._ranked.get(gram)
+                if ranked is not None:
+                    bisect.insort(ranked, entry)
+
+    def remove(self, kind: str, id: int) -> None:
+        with self._lock:
+            if self._journal is not None:
+                self._journal.append(("remove", kind, id))
+            self._remove_locked((kind, id))
+
+    def _remove_locked(self, key: DocKey) -> None:
+        doc = self._docs.pop(key, None)
+        if doc is None:
+            return
+        for gram in doc["grams"]:
+            posting = self._postings.get(gram)
+            if posting is not None:
+                posting.discard(key)
+                if not posting:
+                    del self._postings[gram]
+            ranked = self._ranked.get(gram)
+            if ranked is not None:
+                i = bisect.bisect_left(ranked, doc["rank"])
+                if i < len(ranked) and ranked[i] == doc["rank"]:
+                    del ranked[i]
+                if not ranked:
+                    del self._ranked[gram]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._docs.clear()
+            self._postings.clear()
+            self._ranked.clear()
+
+    def _ranked_locked(self, gram: str) -> List[RankedEntry]:
+        """
+        Posting listesinin sıralı kopyası; ilk ihtiyaçta kurulur, sonra
+        upsert/remove ile güncel tutulur.
+        """
+        ranked = self._ranked.get(gram)
+        if ranked is None:
+            ranked = self._ranked[gram] = sorted(self._docs[key]["rank"] for key in self._postings[gram])
+        return ranked
+
+    def rank_postings(self) -> None:
+        """
+        Büyük posting listelerini önceden sıralar (toplu yüklemeden sonra çağrılır).
+        """
+        with self._lock:
+            self._rank_postings_locked()
+
+    def _rank_postings_locked(self) -> None:
+        # Her listeyi ayrı sıralamak yerine dokümanlar bir kez sırayla gezilir
+        ranked = {gram: [] for gram, posting in self._postings.items() if len(posting) >= RANKED_POSTING_MIN}
+        for entry in sorted(doc["rank"] for doc in self._docs.values()):
+            for gram in self._docs[entry[1]]["grams"]:
+                target = ranked.get(gram)
+                if target is not None:
+                    target.append(entry)
+        self._ranked = ranked
+
+    def search(self, query: str, kinds: Optional[Iterable[str]] = None, limit: int = 10) -> List[Dict]:
+        tokens = normalize(query).split()
+        if not tokens:
+            return []
+        kinds = set(kinds) if kinds else None
+
+        with self._lock:
+            grams: Set[str] = set()
+            for token in tokens:
+                grams |= _query_grams(token)
+            if not all(gram in self._postings for gram in grams):
+                return []
+            ordered = sorted(grams, key=lambda gram: len(self._postings[gram]))
+            shortest, rest = self._postings[ordered[0]], [self._postings[gram] for gram in ordered[1:]]
+            if len(shortest) < RANKED_POSTING_MIN:
+                # Küçük liste: kesişim C seviyesinde set işlemiyle, sonra sıralama
+                candidates = sorted(shortest.intersection(*rest), key=lambda key: self._docs[key]["rank"])
+            else:
+                # Büyük liste: sıralı kopya üzerinde gez, diğer listelerde üyelik kontrol et
+                candidates = (
+                    key for _, key in self._ranked_locked(ordered[0])
+                    if all(key in posting for posting in rest)
+                )
+
+            # Adaylar (başlık uzunluğu, anahtar) sırasında geldiğinde `limit`
+            # adet tam puanlı sonuçtan sonrası bunları geçemez
+            best = 2 * len(tokens)
+            full = checked = 0
+            scored = []
+            for key in candidates:
+                if full >= limit or (self.max_scored is not None and checked >= self.max_scored):
+                    break
+                doc = self._docs[key]
+                if kinds is not None and doc["type"] not in kinds:
+                    continue
+                checked += 1
+                score = self._score(doc, tokens)
+                if score is not None:
+                    scored.append((-score, len(doc["title"] or ""), key, doc))
+                    full += score == best
+
+        return [
+            {"type": doc["type"], "id": doc["id"], "title": doc["title"], "subtitle": doc["subtitle"]}
+            for _, _, _, doc in heapq.nsmallest(limit, scored, key=lambda item: item[:3])
+        ]
+
+    @staticmethod
+    def _score(doc: Dict, tokens: List[str]) -> Optional[int]:
+        """
+        Her sorgu kelimesi ya bir kelimenin öneki ya da (3+ harfse) metnin
+        bir parçası olmalı. Önek eşleşmeleri daha yüksek puan alır.
+        """
+        score = 0
+        for token in tokens:
+            if any(word.startswith(token) for word in doc["tokens"]):
+                score += 2
+            elif len(token) >= 3 and token in doc["norm"]:
+                score += 1
+            else:
+                return None
+        return score
+
+    # ---- Veritabanından yükleme ----
+
+    def rebuild(self, db: Session) -> None:
+        """
+        İndeksi veritabanından baştan kurar.
+        """
+        with self._rebuild_lock:
+            self._rebuild(db)
+
+    def _rebuild(self, db: Session) -> None:
+        started = time.perf_counter()
+        with self._lock:
+            self._journal = []
+        fresh = SearchIndex()
+        try:
+            for row in db.execute(select(User.id, User.full_name, User.username, User.email)):
+                fresh.upsert("employee", row.id, row.full_name, row.email, row.username)
+            for row in db.execute(select(EmployeeAsset.id, EmployeeAsset.asset_name, EmployeeAsset.serial_number)):
+                fresh.upsert("asset", row.id, row.asset_name, row.serial_number)
+            for row in db.execute(
+                select(Announcement.id, Announcement.title, Announcement.content)
+                .where(Announcement.is_active.is_(True))
+            ):
+                fresh.upsert("announcement", row.id, row.title, None, row.content)
+        except Exception:
+            with self._lock:
+                self._journal = None
+            raise
+        # Sıralama kilit dışında; günlükten uygulanan yazmalar sıralı listeleri günceller
+        fresh.rank_postings()
+
+        with self._lock:
+            for op in self._journal:
+                getattr(fresh, op[0])(*op[1:])
+            self._journal = None
+            self._docs = fresh._docs
+            self._postings = fresh._postings
+            self._ranked = fresh._ranked
+            self._built_at = time.monotonic()
+        self.ready.set()
+        self.rebuild_ms = (time.perf_counter() - started) * 1000
+
+    def ensure_built(self, db: Session) -> None:
+        if not self.ready.is_set():
+            with self._rebuild_lock:
+                # Beklerken başka bir istek kurmuş olabilir
+                if not self.ready.is_set():
+                    with use_primary():
+                        self._rebuild(db)
+        elif self.ttl_seconds and time.monotonic() - self._built_at > self.ttl_seconds:
+            from db import SessionLocal
+            self.start_background_rebuild(SessionLocal)
+
+    def start_background_rebuild(self, session_factory) -> None:
+        """
+        Uygulama açılışında indeksi arka planda kurar; ilk istekleri bekletmez.
+        """
+        with self._lock:
+            if self._rebuilding:
+                return
+            self._rebuilding = True
+
+        def run():
+            db = session_factory()
+            try:
+                self.rebuild(db)
+            except Exception as e:
+                from logger import log_error
+                log_error(e, "search index rebuild")
+            finally:
+                db.close()
+                with self._lock:
+                    self._rebuilding = False
+
+        threading.Thread(target=run, name="search-index-rebuild", daemon=True).start()
+
+
+search_index = SearchIndex(ttl_seconds=settings.SEARCH_INDEX_TTL_SECONDS,
+                           max_scored=settings.SEARCH_MAX_SCORED_CANDIDATES)
+
+
+# Yazma yollarından çağrılan yardımcılar
+
+def index_user(user: User) -> None:
+    search_index.upsert("employee", user.id, user.full_name, user.email, user.username)
+
+
+def index_announcement(announcement: Announcement) -> None:
+    if announcement.is_active:
+        search_index.upsert("announcement", announcement.id, announcement.title, None, announcement.content)
+    else:
+        search_index.remove("announcement", announcement.id)
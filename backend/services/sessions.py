@@ -0,0 +1,171 @@
+"""
+Refresh token'lar ve sunucu tarafı oturum kaydı (sessions tablosu).
+
+Ham refresh token yalnızca istemciye verilir; veritabanında SHA-256 özeti
+(benzersiz indeksli `token` kolonu) saklanır. Her yenilemede token döndürülür
+(rotation): eski satır silinir, yenisi eklenir.
+"""
+import hashlib
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Optional, Tuple
+
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+
+from core.background import PeriodicTask, register
+from core.config import settings
+from db import SessionLocal
+from models import Session as SessionModel
+
+
+def hash_token(raw: str) -> str:
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class RevocationCache:
+    """
+    İptal edilmiş / döndürülmüş refresh token özetleri için sınırlı bellek içi
+    küme. Bilinen iptal edilmiş token'lar veritabanına gitmeden reddedilir.
+    """
+
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, token_hash: str, expires_at: datetime) -> None:
+        with self._lock:
+            self._entries[token_hash] = expires_at.timestamp()
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __contains__(self, token_hash: str) -> bool:
+        expires = self._entries.get(token_hash)
+        if expires is None:
+            return False
+        if expires < time.time():
+            # Süresi dolmuş token zaten geçersiz; kaydı tutmaya gerek yok
+            with self._lock:
+                self._entries.pop(token_hash, None)
+        return True
+
+
+revoked_tokens = RevocationCache()
+
+
+def issue_refresh_token(db: Session, user_id: int) -> str:
+    raw = secrets.token_urlsafe(48)
+    db.add(SessionModel(
+        user_id=user_id,
+        token=hash_token(raw),
+        expires_at=datetime.utcnow() + timedelta(minutes=settings.REFRESH_TOKEN_EXPIRE_MINUTES),
+    ))
+    db.commit()
+    return raw
+
+
+def _consume(db: Session, raw: str) -> Optional[SessionModel]:
+    """
+    Geçerli oturumu bulur ve siler. Eşzamanlı iki yenilemeden yalnızca biri kazanır.
+    """
+    token_hash = hash_token(raw)
+    if token_hash in revoked_tokens:
+        return None
+    session = db.execute(
+        select(SessionModel).where(SessionModel.token == token_hash)
+    ).scalar_one_or_none()
+    if session is None:
+        return None
+    # Satır Core DELETE ile silineceği için nesne identity map'ten ayrılır
+    db.expunge(session)
+
+    deleted = db.execute(
+        delete(SessionModel)
+        .where(SessionModel.id == session.id)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    revoked_tokens.add(token_hash, session.expires_at)
+    if deleted != 1 or session.expires_at < datetime.utcnow():
+        db.commit()
+        return None
+    return session
+
+
+def rotate_refresh_token(db: Session, raw: str) -> Optional[Tuple[int, str]]:
+    """
+    Refresh token'ı tüketip aynı kullanıcı için yenisini verir.
+    Geçersizse None döner.
+    """
+    session = _consume(db, raw)
+    if session is None:
+        return None
+    new_raw = secrets.token_urlsafe(48)
+    db.add(SessionModel(
+        user_id=session.user_id,
+        token=hash_token(new_raw),
+        expires_at=datetime.utcnow() + timedelta(minutes=settings.REFRESH_TOKEN_EXPIRE_MINUTES),
+    ))
+    db.commit()
+    return session.user_id, new_raw
+
+
+def revoke_refresh_token(db: Session, raw: str) -> bool:
+    session = _consume(db, raw)
+    if session is None:
+        return False
+    db.commit()
+    return True
+
+
+def revoke_user_sessions(db: Session, user_id: int) -> int:
+    """
+    Kullanıcının tüm refresh token oturumlarını siler; commit çağırana
+    bırakılır (sürüm artırma / pasifleştirme ile aynı transaction).
+    """
+    return db.execute(
+        delete(SessionModel)
+        .where(SessionModel.user_id == user_id)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+
+
+def purge_expired_sessions(db: Session, batch_size: int = 1000) -> int:
+    """
+    Süresi dolmuş oturumları sınırlı boyutlu partiler halinde siler
+    (uzun süreli kilitlerden kaçınmak için her parti ayrı commit edilir).
+    """
+    total = 0
+    now = datetime.utcnow()
+    while True:
+        ids = db.execute(
+            select(SessionModel.id).where(SessionModel.expires_at < now).limit(batch_size)
+        ).scalars().all()
+        if not ids:
+            break
+        db.execute(
+            delete(SessionModel)
+            .where(SessionModel.id.in_(ids))
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+        total += len(ids)
+        if len(ids) < batch_size:
+            break
+    return total
+
+
+def _cleanup_job() -> None:
+    db = SessionLocal()
+    try:
+        purge_expired_sessions(db, batch_size=settings.SESSION_CLEANUP_BATCH_SIZE)
+    finally:
+        db.close()
+
+
+session_cleanup_task = register(
+    PeriodicTask("session-cleanup", settings.SESSION_CLEANUP_INTERVAL_SECONDS, _cleanup_job)
+)
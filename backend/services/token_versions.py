@@ -0,0 +1,82 @@
+import threading
+import time
+from typing import Dict
+
+from sqlalchemy import or_, select, update
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from core.db_routing import use_primary
+from models import User
+from services.sessions import revoke_user_sessions
+
+# Pasif kullanıcılar için hiçbir token sürümüyle eşleşmeyen değer
+REVOKED = -1
+
+
+class TokenVersionMap:
+    """
+    Kullanıcı başına token sürümlerinin küçük bellek içi kopyası.
+
+    Yalnızca sürümü 0'dan farklı veya pasif kullanıcılar tutulur; haritada
+    olmayan kullanıcının sürümü 0 kabul edilir. Harita TOKEN_VERSION_REFRESH_SECONDS
+    aralıklarla tek bir sorguyla tazelenir, böylece token iptali en geç bu
+    süre sonunda tüm worker'larda geçerli olur.
+    """
+
+    def __init__(self, refresh_seconds: int):
+        self.refresh_seconds = refresh_seconds
+        self._versions: Dict[int, int] = {}
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+
+    def _refresh(self, db: Session) -> None:
+        # Birincilden okunur: gecikmeli replika bump_local'ı ezip iptal edilmiş token'ı geri açmasın
+        with use_primary():
+            rows = db.execute(
+                select(User.id, User.token_version, User.is_active)
+                .where(or_(User.token_version != 0, User.is_active.is_(False)))
+            ).all()
+        self._versions = {
+            row.id: (row.token_version if row.is_active else REVOKED) for row in rows
+        }
+        self._loaded_at = time.monotonic()
+
+    def current(self, db: Session, user_id: int) -> int:
+        if time.monotonic() - self._loaded_at > self.refresh_seconds:
+            # Tek bir thread tazeler, diğerleri mevcut haritayla devam eder
+            if self._lock.acquire(blocking=not self._loaded_at):
+                try:
+                    if time.monotonic() - self._loaded_at > self.refresh_seconds:
+                        self._refresh(db)
+                finally:
+                    self._lock.release()
+        return self._versions.get(user_id, 0)
+
+    def is_current(self, db: Session, user_id: int, version: int) -> bool:
+        return self.current(db, user_id) == version
+
+    def bump_local(self, user_id: int, version: int) -> None:
+        self._versions[user_id] = version
+
+
+token_versions = TokenVersionMap(refresh_seconds=settings.TOKEN_VERSION_REFRESH_SECONDS)
+
+
+def revoke_user_tokens(db: Session, user_id: int) -> int:
+    """
+    Kullanıcının tüm mevcut access token'larını geçersiz kılar (sürümü artırır).
+    Refresh token oturumları da aynı transaction'da silinir; aksi halde
+    /refresh iptal edilmiş kullanıcıya yeni access token verirdi.
+    """
+    db.execute(
+        update(User)
+        .where(User.id == user_id)
+        .values(token_version=User.token_version + 1)
+        .execution_options(synchronize_session=False)
+    )
+    revoke_user_sessions(db, user_id)
+    db.commit()
+    version = db.execute(select(User.token_version).where(User.id == user_id)).scalar_one()
+    token_versions.bump_local(user_id, version)
+    return version
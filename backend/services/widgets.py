@@ -0,0 +1,116 @@
+"""
+Gösterge paneli widget'ları için ilk veri sağlayıcıları.
+
+Her widget türü için kayıtlı bir sağlayıcı, düzen yanıtına gömülecek ilk
+veriyi üretir; böylece ön yüz her widget için ayrı istek atmaz. Yeni bir
+widget türü @widget_data("tür") ile kaydedilir. Bir sağlayıcının hatası
+yalnızca o widget'ın verisini boş bırakır.
+"""
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from models import LeaveBalance
+from repositories.read_models import asset_rows, task_rows
+from services.announcement_feed import announcement_feed
+from services.reminders import reminder_index
+
+WidgetProvider = Callable[[Session, Any], Any]
+
+WIDGET_DATA_PROVIDERS: Dict[str, WidgetProvider] = {}
+
+# Kullanıcının kayıtlı düzeni yoksa döndürülen varsayılan (kaydedilmez)
+DEFAULT_LAYOUT = (
+    "profile", "leave", "tasks", "performance", "calendar", "assets", "announcements_mini",
+)
+
+
+def widget_data(widget_type: str):
+    def decorator(func: WidgetProvider) -> WidgetProvider:
+        WIDGET_DATA_PROVIDERS[widget_type] = func
+        return func
+    return decorator
+
+
+def default_layout() -> List[Dict[str, Any]]:
+    return [
+        {"id": None, "widget_type": widget_type, "position": position, "is_visible": True, "settings": None}
+        for position, widget_type in enumerate(DEFAULT_LAYOUT)
+    ]
+
+
+def camel_case(layout: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Ön yüzün beklediği alan adlarıyla (widgetType, isVisible) düzen öğeleri.
+    """
+    return [
+        {
+            "id": item["id"],
+            "widgetType": item["widget_type"],
+            "position": item["position"],
+            "isVisible": item["is_visible"],
+            "settings": item["settings"],
+            "data": item.get("data"),
+        }
+        for item in layout
+    ]
+
+
+def compose(db: Session, principal: Any, layout: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Görünür widget'lara ilk verilerini ekler.
+    """
+    composed = []
+    for item in layout:
+        data: Optional[Any] = None
+        provider = WIDGET_DATA_PROVIDERS.get(item["widget_type"])
+        if provider is not None and item["is_visible"]:
+            try:
+                data = provider(db, principal)
+            except Exception as e:
+                # Hatalı sorgu oturumu bozuk bırakmasın; sıradaki widget'lar okunabilsin
+                db.rollback()
+                from logger import log_error
+                log_error(e, f"widget data {item['widget_type']}")
+        composed.append({**item, "data": data})
+    return composed
+
+
+@widget_data("leave")
+def _leave_balance(db: Session, principal: Any) -> Dict[str, float]:
+    row = db.execute(
+        select(LeaveBalance.annual_leave, LeaveBalance.sick_leave, LeaveBalance.personal_leave)
+        .where(LeaveBalance.user_id == principal.id)
+        .order_by(LeaveBalance.year.desc())
+        .limit(1)
+    ).first()
+    if row is None:
+        return {"annual": 0, "sick": 0, "personal": 0}
+    return {"annual": row.annual_leave, "sick": row.sick_leave, "personal": row.personal_leave}
+
+
+@widget_data("tasks")
+def _tasks(db: Session, principal: Any) -> List[Dict[str, Any]]:
+    return task_rows(db, user_id=principal.id, limit=5)
+
+
+@widget_data("assets")
+def _assets(db: Session, principal: Any) -> List[Dict[str, Any]]:
+    return asset_rows(db, employee_id=principal.id)
+
+
+@widget_data("announcements_mini")
+def _announcements_mini(db: Session, principal: Any) -> List[Dict[str, Any]]:
+    return announcement_feed.get(db, limit=3)
+
+
+@widget_data("announcements_list")
+def _announcements_list(db: Session, principal: Any) -> List[Dict[str, Any]]:
+    return announcement_feed.get(db, limit=10)
+
+
+@widget_data("reminders")
+def _reminders(db: Session, principal: Any) -> List[Dict[str, Any]]:
+    reminder_index.ensure_loaded(db)
+    return reminder_index.upcoming(principal.id, 30)